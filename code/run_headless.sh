@@ -0,0 +1,3 @@
+# Run a scenario headless (no GUI), ticking as fast as possible.
+# Usage: bash run_headless.sh scenarios/example_scenario.json --ticks 10000
+python -m simulation.headless "$@"
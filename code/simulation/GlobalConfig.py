@@ -1,4 +1,4 @@
-from typing import ClassVar
+from typing import ClassVar, Optional
 from pydantic import BaseModel
 
 from simulation.Color import Colors
@@ -10,8 +10,21 @@ class GlobalConfig(BaseModel):
     This class holds configuration settings that can be accessed globally.
     """
     # Simulation settings
-    max_log_entries: ClassVar[int] = 1000  # Maximum number of log entries to keep
+    max_log_entries: ClassVar[int] = 1000  # Maximum number of log entries to keep in memory per object
+    log_spill_dir: ClassVar[Optional[str]] = None  # If set, log entries evicted from memory are appended to <dir>/<run id>/<object id>.jsonl
     log_print_level: ClassVar[int] = 0  # Log level for printing (0 = info, 1 = warning, 2 = error)
+    log_record_level: ClassVar[int] = 0  # Log level for keeping messages in each object's log history; anything below this and log_print_level is dropped before it is built
+    log_sink_async: ClassVar[bool] = True  # Whether printed log messages are written by a background thread (see LogSink.py)
+    log_sink_queue_size: ClassVar[int] = 10000  # Max printed log messages waiting on the background writer before logging blocks
+    log_file: ClassVar[Optional[str]] = None  # If set, printed log messages are also appended to this file
+    spatial_hash_cell_size: ClassVar[int] = 16  # Size (in tiles) of the grid cells used to find the nearest entities of a type
+    pathfinding_cluster_size: ClassVar[int] = 16  # Size (in tiles) of the clusters used by hierarchical pathfinding
+    hierarchical_pathfinding_min_tiles: ClassVar[int] = 256 * 256  # Maps with at least this many tiles use hierarchical pathfinding (see World.find_path); on smaller maps plain A* is faster
+    flow_field_query_threshold: ClassVar[int] = 3  # Number of paths asked for to the same destination before a shared flow field is built for it (0 = never)
+    max_flow_fields: ClassVar[int] = 16  # Max flow fields kept per world
+    path_cache_size: ClassVar[int] = 512  # Max paths kept per world for repeated queries (0 = no cache)
+    cooperative_window: ClassVar[int] = 8  # Number of steps that cooperative movers plan (and reserve) ahead; they re-plan halfway through
+    cooperative_max_stalls: ClassVar[int] = 10  # Number of plans in a row that make no progress before a cooperative mover gives up
  
     # Web request settings
     default_timeout: ClassVar[float] = 5.0  # Default timeout for web requests in seconds
@@ -31,6 +44,10 @@ class GlobalConfig(BaseModel):
     # Debug settings
     llm_dump_http_requests: ClassVar[bool] = True  # Whether to dump HTTP requests to files for later debugging
     simulation_dump_state: ClassVar[bool] = True  # Whether to dump the simulation state to files for later debugging
+    simulation_dump_dir: ClassVar[str] = "logs"  # Directory that state dumps, tick journals and HTTP request dumps are written to
+    simulation_dump_format: ClassVar[str] = "journal"  # "journal" for a single delta-encoded tick journal, or "files" for a pair of JSON files per tick
+    simulation_journal_keyframe_interval: ClassVar[int] = 100  # Ticks between full keyframes in the tick journal
+    simulation_dump_queue_size: ClassVar[int] = 64  # Max state dumps waiting on the background writer before new ones are dropped
 
     # Color codes for terminal output
     colors: ClassVar[Colors] = Colors()
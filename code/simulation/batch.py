@@ -0,0 +1,192 @@
+"""
+Batch runner - runs many scenarios headless, in parallel across a process pool.
+
+Runs are spread across worker processes (by default, one per CPU core), so that
+CPU-bound simulations actually run in parallel. Every run is seeded from --seed plus its run
+index, so a batch is reproducible. Per-run metrics are collected into one summary table.
+
+Usage (from the code/ directory):
+    python -m simulation.batch scenarios/example_scenario.json --ticks 5000 --runs 8
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from pydantic import BaseModel
+from simulation.GlobalConfig import GlobalConfig
+
+
+# A single scenario run, as handed to a worker process.
+class BatchJob(BaseModel):
+    scenario_path: str
+    ticks: int
+    seed: int
+    idle_fast_forward: bool = False  # Skip over idle stretches (see Simulation.fast_forward)
+
+# Metrics collected from a single run.
+class BatchResult(BaseModel):
+    scenario_path: str
+    ticks: int
+    seed: int
+    water_produced: int = 0  # Total increase in water held by all WaterTanks over the run
+    water_total: int = 0  # Water held by all WaterTanks at the end of the run
+    charge_total: int = 0  # Charge held by all PowerPacks at the end of the run
+    charge_capacity: int = 0  # Combined capacity of all PowerPacks
+    elapsed_seconds: float = 0.0  # Wall-clock time the run took (excluding scenario loading)
+    error: Optional[str] = None  # Set if the run failed
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.ticks / self.elapsed_seconds
+
+    @property
+    def ms_per_tick(self) -> float:
+        if self.ticks <= 0:
+            return 0.0
+        return 1000 * self.elapsed_seconds / self.ticks
+
+
+def _sum_component_field(simulation, component_type, field: str) -> int:
+    total = 0
+    for entity in simulation.world.entities.values():
+        for slot in getattr(entity, 'slots', {}).values():
+            if isinstance(slot.component, component_type):
+                total += getattr(slot.component, field)
+    return total
+
+
+def _configure_worker():
+    """Process-wide settings for batch runs. Applied once per worker process (as the pool's initializer),
+    or around each job when jobs run in the calling process (see _isolated)."""
+    GlobalConfig.simulation_dump_state = False
+    GlobalConfig.log_print_level = 2
+
+
+@contextlib.contextmanager
+def _isolated():
+    # Runs a job in the calling process without leaving any trace of it behind: the global config,
+    #  the state of the global random generator, and the default simulation are all restored afterwards.
+    from simulation.core.SimulationContext import default_context
+
+    config = {name: getattr(GlobalConfig, name) for name in GlobalConfig.__class_vars__}
+    random_state = random.getstate()
+    context = default_context()
+    try:
+        _configure_worker()
+        yield
+    finally:
+        for name, value in config.items():
+            setattr(GlobalConfig, name, value)
+        random.setstate(random_state)
+        context.make_default()
+
+
+def run_job(job: BatchJob) -> BatchResult:
+    """Run a single scenario headless, in the calling process. Global settings are restored afterwards."""
+    with _isolated():
+        return _run_job(job)
+
+
+def _run_job(job: BatchJob) -> BatchResult:
+    # Runs inside a worker process, already set up by _configure_worker().
+    # Imported here so that worker processes do all of their own model setup.
+    from simulation.AutoScenarioManager import AutoScenarioManager
+    from simulation.core.entity.component.PowerPack import PowerPack
+    from simulation.core.entity.component.WaterTank import WaterTank
+    from simulation.core.Simulation import Simulation
+
+    result = BatchResult(scenario_path=job.scenario_path, ticks=job.ticks, seed=job.seed)
+    try:
+        random.seed(job.seed)
+
+        # Start every run from a fresh simulation (with its own ID counters), so that runs sharing a worker do not affect each other.
+        Simulation()
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulation = AutoScenarioManager.load_simulation_from_json(job.scenario_path)
+        simulation.paused = False
+        simulation.idle_fast_forward = job.idle_fast_forward
+
+        water_start = _sum_component_field(simulation, WaterTank, 'fill')
+        start = time.perf_counter()
+        simulation.run_sync(ticks=job.ticks, headless=True)
+        result.elapsed_seconds = time.perf_counter() - start
+
+        result.water_total = _sum_component_field(simulation, WaterTank, 'fill')
+        result.water_produced = result.water_total - water_start
+        result.charge_total = _sum_component_field(simulation, PowerPack, 'charge')
+        result.charge_capacity = _sum_component_field(simulation, PowerPack, 'charge_max')
+    except Exception as e:
+        result.error = f"{e.__class__.__name__}: {e}"
+        traceback.print_exc()
+    return result
+
+
+def make_jobs(scenario_paths: List[str], ticks: int, runs: int = 1, base_seed: int = 0, idle_fast_forward: bool = False) -> List[BatchJob]:
+    """Build `runs` jobs for every scenario, each with its own seed."""
+    jobs = []
+    for scenario_path in scenario_paths:
+        for _ in range(runs):
+            jobs.append(BatchJob(scenario_path=scenario_path, ticks=ticks, seed=base_seed + len(jobs), idle_fast_forward=idle_fast_forward))
+    return jobs
+
+
+def run_batch(jobs: List[BatchJob], max_workers: Optional[int] = None) -> List[BatchResult]:
+    """Run every job across a process pool (one worker per CPU core by default).
+    Results are returned in the same order as the jobs."""
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(jobs) <= 1:
+        return [run_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs)), initializer=_configure_worker) as executor:
+        return list(executor.map(_run_job, jobs))
+
+
+def format_summary(results: List[BatchResult]) -> str:
+    """Format the results of a batch as a plain-text table."""
+    header = f"{'scenario':<32} {'seed':>6} {'ticks':>8} {'water+':>8} {'water':>8} {'charge':>13} {'ticks/s':>10} {'ms/tick':>8}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        name = os.path.basename(r.scenario_path)[:32]
+        if r.error:
+            lines.append(f"{name:<32} {r.seed:>6} FAILED: {r.error}")
+            continue
+        charge = f"{r.charge_total}/{r.charge_capacity}"
+        lines.append(f"{name:<32} {r.seed:>6} {r.ticks:>8} {r.water_produced:>8} {r.water_total:>8} {charge:>13} {r.ticks_per_second:>10.1f} {r.ms_per_tick:>8.3f}")
+
+    succeeded = [r for r in results if not r.error]
+    if succeeded:
+        lines.append("-" * len(header))
+        mean_water = sum(r.water_produced for r in succeeded) / len(succeeded)
+        mean_tps = sum(r.ticks_per_second for r in succeeded) / len(succeeded)
+        lines.append(f"{len(succeeded)}/{len(results)} runs succeeded, mean water produced {mean_water:.1f}, mean {mean_tps:.1f} ticks/sec")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run MoistureFarmer scenarios headless, in parallel, and summarize the results.")
+    parser.add_argument("scenarios", nargs="+", help="Paths to scenario JSON files (AutoScenarioManager format)")
+    parser.add_argument("--ticks", type=int, default=1000, help="Number of ticks to run each scenario for (default: 1000)")
+    parser.add_argument("--runs", type=int, default=1, help="Number of runs per scenario, each with a different seed (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Base random seed; run N is seeded with seed + N (default: 0)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: one per CPU core)")
+    parser.add_argument("--fast-forward", action="store_true", help="Skip over stretches where nothing but vaporators and generators are running")
+    args = parser.parse_args(argv)
+
+    jobs = make_jobs(args.scenarios, args.ticks, args.runs, args.seed, args.fast_forward)
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers)
+    print(format_summary(results))
+    print(f"Batch of {len(jobs)} runs complete in {time.perf_counter() - start:.2f}s")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import pickle
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from simulation.core.Simulation import Simulation
+
+# --- Checkpoint / Restore ---
+# Snapshots an entire Simulation (world, entities, every component's state including in-flight
+#  state such as Motivator paths and an agent's pending tool call, and the tick count) into a
+#  compact binary blob, and restores it again.
+# Unlike AutoScenarioManager (which saves human-editable scenarios with only non-default values),
+#  checkpoints are lossless and fast, but are only meant to be read back by the same version of
+#  the code. Checkpoints are pickles -- only restore blobs from sources you trust.
+#
+# Things that cannot be captured are dropped from the snapshot:
+#  - on_tick subscribers and background writer threads (the restored simulation starts with none)
+#  - LLM requests that are still in flight (the restored agent sees them as failed requests)
+
+CHECKPOINT_MAGIC = b"MFCK"
+CHECKPOINT_VERSION = 4
+
+
+class CheckpointError(ValueError):
+    pass
+
+
+def checkpoint(simulation: 'Simulation') -> bytes:
+    """Snapshot the simulation into a compact binary blob."""
+    payload = {
+        "version": CHECKPOINT_VERSION,
+        "simulation": simulation,  # Includes its SimulationContext, and so its ID and log sequence counters
+    }
+    data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    return CHECKPOINT_MAGIC + zlib.compress(data, 1)
+
+
+def restore(blob: bytes, make_current: bool = True) -> 'Simulation':
+    """Rebuild a simulation from a blob created by checkpoint().
+
+    Args:
+        blob (bytes): The checkpoint data.
+        make_current (bool): Whether the restored simulation becomes the one returned by Simulation.get_instance().
+    """
+    if not blob.startswith(CHECKPOINT_MAGIC):
+        raise CheckpointError("Data is not a MoistureFarmer checkpoint.")
+    payload = pickle.loads(zlib.decompress(blob[len(CHECKPOINT_MAGIC):]))
+    if payload.get("version") != CHECKPOINT_VERSION:
+        raise CheckpointError(f"Unsupported checkpoint version {payload.get('version')}; expected {CHECKPOINT_VERSION}.")
+
+    simulation = payload["simulation"]
+    simulation.running = False
+    if make_current:
+        simulation.make_current()
+    return simulation
+
+
+def fork(simulation: 'Simulation') -> 'Simulation':
+    """Create an independent copy of the simulation for what-if runs. The original stays current."""
+    copy = restore(checkpoint(simulation), make_current=False)
+    copy.start_new_run()
+    return copy
@@ -0,0 +1,96 @@
+import heapq
+import json
+import os
+from collections import deque
+from itertools import islice, takewhile
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from simulation.GlobalConfig import GlobalConfig
+
+# --- Log Ring Buffer ---
+# The log history of a single object (see GameObject.log). Holds at most GlobalConfig.max_log_entries
+#  entries; once full, every new entry evicts the oldest one, so memory use stays flat no matter how
+#  long the simulation runs, while the most recent entries stay in memory for the UI and agents.
+# Evicted entries can optionally be spilled to a JSON-lines segment file (see spill_to), so that the
+#  full history of a long run can still be inspected afterwards. Spilled entries are written in
+#  batches, to keep file I/O off the per-tick path.
+
+class LogRingBuffer:
+    spill_batch_size: int = 100  # Number of evicted entries to collect before appending them to the spill file
+
+    def __init__(self, maxlen: Optional[int] = None, spill_path: Optional[str] = None):
+        if maxlen is None:
+            maxlen = GlobalConfig.max_log_entries
+        self._entries: deque = deque(maxlen=maxlen if maxlen and maxlen > 0 else None)
+        self.spill_path = spill_path
+        self.evicted = 0  # Number of entries pushed out of the buffer so far
+        self._spill_pending: List[Any] = []
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._entries.maxlen
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._entries)
+
+    def __getitem__(self, index: int) -> Any:
+        return self._entries[index]
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._entries)
+
+    def spill_to(self, path: Optional[str]):
+        """Write entries to this JSON-lines file as they are evicted (None to stop spilling)."""
+        self.flush()
+        self.spill_path = path
+
+    def append(self, entry: Any):
+        entries = self._entries
+        if entries.maxlen is not None and len(entries) == entries.maxlen:
+            self.evicted += 1
+            if self.spill_path:
+                self._spill_pending.append(entries[0])
+                if len(self._spill_pending) >= self.spill_batch_size:
+                    self.flush()
+        entries.append(entry)
+
+    def last(self) -> Optional[Any]:
+        return self._entries[-1] if self._entries else None
+
+    def to_list(self) -> List[Any]:
+        return list(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def flush(self):
+        """Append any evicted entries that are still waiting to the spill file."""
+        if not self._spill_pending or not self.spill_path:
+            self._spill_pending.clear()
+            return
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            for entry in self._spill_pending:
+                f.write(json.dumps(entry.to_json() if hasattr(entry, "to_json") else entry, default=str) + "\n")
+        self._spill_pending.clear()
+
+
+def merge_recent(buffers: Iterable[LogRingBuffer], key: Callable[[Any], int], limit: Optional[int] = None, since: Optional[int] = None) -> List[Any]:
+    """Merge several buffers, each already in order of `key`, into one list in that order.
+    Only the most recent `limit` entries are returned, and only those with a key greater than `since`.
+    The buffers are walked backwards from their newest entries, so this costs O(result size * log(buffer count))
+    rather than copying and sorting everything."""
+    if limit is not None and limit <= 0:
+        return []
+    streams = [reversed(buffer) for buffer in buffers]
+    if since is not None:
+        streams = [takewhile(lambda entry: key(entry) > since, stream) for stream in streams]
+    newest_first = heapq.merge(*streams, key=key, reverse=True)
+    result = list(islice(newest_first, limit))
+    result.reverse()
+    return result
@@ -0,0 +1,81 @@
+import atexit
+import os
+import queue
+import sys
+import threading
+from typing import Any, Optional, TextIO
+
+from simulation.GlobalConfig import GlobalConfig
+
+# --- Log Sink ---
+# Prints log messages (see GameObject.log) on a background thread, so that formatting and console /
+#  file output do not run on the simulation thread. Messages are handed over together with the
+#  stream that was sys.stdout at the time they were logged, so redirecting stdout (as the batch
+#  runner does while loading scenarios) still applies to them.
+# If GlobalConfig.log_file is set, every printed message is also appended to that file (without colors).
+# Set GlobalConfig.log_sink_async to False to print synchronously instead (e.g. when debugging a crash).
+
+class LogSink:
+    def __init__(self, queue_size: Optional[int] = None, log_file: Optional[str] = None):
+        self.log_file = log_file
+        self.written = 0  # Number of messages written so far
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size or GlobalConfig.log_sink_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._file: Optional[TextIO] = None
+
+    def emit(self, message: Any, stream: Optional[TextIO] = None):
+        """Print a message (anything with a __str__). Blocks only if the background writer has fallen far behind."""
+        stream = stream or sys.stdout
+        if not GlobalConfig.log_sink_async:
+            self.write(stream, message)
+            return
+        self._queue.put((stream, message))
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer_loop, name="LogSink", daemon=True)
+            self._thread.start()
+
+    def flush(self):
+        """Block until every queued message has been written."""
+        if self._thread:
+            self._queue.join()
+        if self._file:
+            self._file.flush()
+
+    def write(self, stream: TextIO, message: Any):
+        text = str(message)
+        if not getattr(stream, "closed", False):  # e.g. a redirect that has since ended
+            print(text, file=stream)
+        log_file = self.log_file or GlobalConfig.log_file
+        if log_file:
+            if self._file is None or self._file.name != log_file:
+                if self._file:
+                    self._file.close()
+                directory = os.path.dirname(log_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(log_file, "a", encoding="utf-8")
+            self._file.write(getattr(message, "plain_text", text) + "\n")
+        self.written += 1
+
+    def _writer_loop(self):
+        while True:
+            stream, message = self._queue.get()
+            try:
+                self.write(stream, message)
+            except Exception as e:
+                print(f"[WARN] Failed to write log message: {e}", file=sys.__stderr__)
+            finally:
+                self._queue.task_done()
+
+
+_default_sink: Optional[LogSink] = None
+
+
+def log_sink() -> LogSink:
+    """The sink that GameObject.log prints to."""
+    global _default_sink
+    if _default_sink is None:
+        _default_sink = LogSink()
+        atexit.register(_default_sink.flush)
+    return _default_sink
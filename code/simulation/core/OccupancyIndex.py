@@ -0,0 +1,68 @@
+from typing import Dict, Iterator, Optional, Tuple
+
+# --- Occupancy Index ---
+# Which entities occupy which tiles, bucketed by tile, so that collision queries cost O(footprint)
+#  rather than a scan of every entity in the world. The World keeps it up to date as entities are
+#  added, removed, moved or resized (see Entity.__setattr__).
+# Nothing stops a scenario from placing entities on top of one another, so a tile can hold several
+#  entities. They are kept in the order they were placed, so that queries are deterministic.
+
+Footprint = Tuple[int, int, int, int]  # x, y, width, height
+
+
+def footprint_tiles(footprint: Footprint) -> Iterator[Tuple[int, int]]:
+    x, y, width, height = footprint
+    for oy in range(height):
+        for ox in range(width):
+            yield (x + ox, y + oy)
+
+
+class OccupancyIndex:
+    def __init__(self):
+        self._tiles: Dict[Tuple[int, int], Dict[str, None]] = {}  # Tile -> IDs of the entities on it (used as an ordered set)
+        self._footprints: Dict[str, Footprint] = {}  # Entity ID -> footprint it is indexed under
+
+    def __len__(self) -> int:
+        return len(self._footprints)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._footprints
+
+    def footprint_of(self, entity_id: str) -> Optional[Footprint]:
+        return self._footprints.get(entity_id)
+
+    def place(self, entity_id: str, footprint: Footprint):
+        """Index an entity under the given footprint, replacing wherever it was before."""
+        if self._footprints.get(entity_id) == footprint:
+            return
+        self.remove(entity_id)
+        self._footprints[entity_id] = footprint
+        for tile in footprint_tiles(footprint):
+            self._tiles.setdefault(tile, {})[entity_id] = None
+
+    def remove(self, entity_id: str):
+        footprint = self._footprints.pop(entity_id, None)
+        if footprint is None:
+            return
+        for tile in footprint_tiles(footprint):
+            occupants = self._tiles.get(tile)
+            if occupants is not None:
+                occupants.pop(entity_id, None)
+                if not occupants:
+                    del self._tiles[tile]
+
+    def clear(self):
+        self._tiles.clear()
+        self._footprints.clear()
+
+    def at(self, x: int, y: int) -> Iterator[str]:
+        """IDs of the entities occupying a tile."""
+        yield from self._tiles.get((x, y), ())
+
+    def is_free(self, footprint: Footprint, ignore: Optional[str] = None) -> bool:
+        """Whether no entity (other than `ignore`) occupies any tile of the footprint."""
+        for tile in footprint_tiles(footprint):
+            occupants = self._tiles.get(tile)
+            if occupants and (len(occupants) > 1 or ignore not in occupants):
+                return False
+        return True
@@ -1,9 +1,14 @@
 import asyncio
-import json
-import os
+import time
 from typing import TYPE_CHECKING, List, Optional
 
 from pydantic import BaseModel
+from simulation.core import Checkpoint
+from simulation.core.LogSink import log_sink
+from simulation.core.SimulationContext import (SimulationContext,
+                                               current_context)
+from simulation.core.StateDumper import JournalStateDumper, StateDumper
+from simulation.core.TickScheduler import TickScheduler
 from simulation.core.World import World
 from simulation.GlobalConfig import GlobalConfig
 
@@ -13,6 +18,21 @@ if TYPE_CHECKING:
 
 # --- Simulation System ---
 
+# Summary of a single call to run() / run_sync(), so that batch and headless runs can report throughput.
+class RunStats(BaseModel):
+    ticks: int = 0  # Number of ticks advanced during the run
+    elapsed_seconds: float = 0.0  # Wall-clock time the run took
+    llm_wait_seconds: float = 0.0  # Wall-clock time spent waiting on outstanding LLM responses (headless only)
+
+    @property
+    def ticks_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.ticks / self.elapsed_seconds
+
+    def __str__(self):
+        return f"{self.ticks} ticks in {self.elapsed_seconds:.3f}s ({self.ticks_per_second:.1f} ticks/sec, {self.llm_wait_seconds:.3f}s waiting on LLM)"
+
 # The Simulation is a high-level controller that manages the world and the simulation loop
 class Simulation(BaseModel):
     running: bool = False  # Flag to control the simulation loop
@@ -24,20 +44,27 @@ class Simulation(BaseModel):
 
     log_level: int = 0  # Log level for the simulation (0 = info, 1 = warning, 2 = error)
 
+    headless_poll_interval: float = 0.01  # In headless mode, how often to check whether outstanding LLM responses have arrived
+    idle_fast_forward: bool = False  # In headless mode, skip over stretches where nothing but closed-form processes are running (see fast_forward)
+    idle_fast_forward_max_ticks: int = 10000  # Most ticks to skip at once when running without a tick limit
+
     # TODO: Make this more easily configurable -- possibly with a dictionary of endpoints for different model names or services.
     llm_url: str = "http://localhost:8080/v1/chat/completions"  # URL for the LLM endpoint
 
     world: World = World()  # The world that the simulation is running in
 
     _on_tick_subscribers: List = []  # List of callback functions to call after each tick
+    _scheduler: TickScheduler = TickScheduler()  # Fixed-timestep scheduler used when running in real time
+    _state_dumper: Optional[StateDumper] = None  # Background writer for GlobalConfig.simulation_dump_state
 
-    # Singleton pattern to ensure only one instance of Simulation exists
-    __instance: Optional['Simulation'] = None
+    _context: Optional[SimulationContext] = None  # Per-simulation state such as ID counters (see SimulationContext.py)
 
     @classmethod
     def get_instance(cls, **data) -> 'Simulation':
-        if not cls.__instance is None:
-            return cls.__instance
+        """Return the current simulation, creating one if there is none yet."""
+        simulation = current_context().simulation
+        if simulation is not None:
+            return simulation
         return cls(**data)
     
     def __init__(self, **data):
@@ -45,10 +72,62 @@ class Simulation(BaseModel):
         # Ensure the world is initialized
         if not self.world:
             self.world = World(**data.get('world', {}))
-            
-        Simulation.__instance = self  # Set the singleton instance
+        self.world._simulation = self
+
+        # The newest simulation becomes the default one, as returned by get_instance()
+        self._context = SimulationContext(self)
+        self._context.make_default()
+
+    @property
+    def context(self) -> SimulationContext:
+        return self._context
+
+    def make_current(self):
+        """Make this simulation the one returned by Simulation.get_instance()."""
+        self._context.make_default()
+
+    def activate(self):
+        """Context manager that makes this simulation current within the current asyncio task / thread only.
+        Use it when several simulations share a process, e.g. while building a world:
+            with simulation.activate():
+                simulation.world.add_entity(GonkDroid())
+        """
+        return self._context.activate()
+
+    def __getstate__(self):
+        # Callbacks and the dump writer thread belong to the running process, not to the simulation state.
+        state = super().__getstate__()
+        private = dict(state['__pydantic_private__'] or {})
+        private['_on_tick_subscribers'] = []
+        private['_state_dumper'] = None
+        state['__pydantic_private__'] = private
+        return state
+
+    # --- Checkpoints (see Checkpoint.py) ---
+    def checkpoint(self) -> bytes:
+        """Snapshot the whole simulation into a compact binary blob."""
+        return Checkpoint.checkpoint(self)
+
+    @classmethod
+    def restore(cls, blob: bytes, make_current: bool = True) -> 'Simulation':
+        """Rebuild a simulation from a blob created by checkpoint()."""
+        return Checkpoint.restore(blob, make_current=make_current)
+
+    def fork(self) -> 'Simulation':
+        """Create an independent copy of this simulation, e.g. for what-if runs. This simulation stays current."""
+        return Checkpoint.fork(self)
+
+    @property
+    def tick_lag(self) -> float:
+        """How far behind its target tick rate (in seconds) the simulation finished its last tick. 0 when keeping up."""
+        return self._scheduler.tick_lag
+
+    @property
+    def tick_cost(self) -> float:
+        """How long (in seconds) the most recent tick took to run."""
+        return self._scheduler.tick_cost
 
-    def to_json(self):
+    def to_json(self, include_tilemap: bool = True):
         """Convert the simulation state to JSON format."""
         return {
             "running": self.running,
@@ -58,17 +137,23 @@ class Simulation(BaseModel):
             "simulation_delay": self.simulation_delay,
             "simulation_delay_max": self.simulation_delay_max,
             "log_level": self.log_level,
-            "world": self.world.to_json(),
+            "tick_lag": self.tick_lag,
+            "tick_cost": self.tick_cost,
+            "world": self.world.to_json(include_tilemap=include_tilemap),
         }
 
-    def run(self, ticks: Optional[int] = None):
+    def run(self, ticks: Optional[int] = None, headless: bool = False):
         # Start the simulation loop in a separate thread
-        simulation_task = asyncio.create_task(self._do_run(ticks))
+        simulation_task = asyncio.create_task(self._do_run(ticks, headless=headless))
 
         return simulation_task
     
-    def run_sync(self, ticks: Optional[int] = None):
-        """Run the simulation synchronously for a specified number of ticks."""
+    def run_sync(self, ticks: Optional[int] = None, headless: bool = False) -> RunStats:
+        """Run the simulation synchronously for a specified number of ticks.
+
+        If headless is True, ticks are run back-to-back without any delay, and the
+        loop only waits while an agent's LLM response is actually outstanding.
+        """
 
         # Run the simulation loop in a blocking manner
         try:
@@ -77,7 +162,7 @@ class Simulation(BaseModel):
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-        return loop.run_until_complete(self._do_run(ticks))
+        return loop.run_until_complete(self._do_run(ticks, headless=headless))
 
     def subscribe_on_tick(self, callback):
         if callback not in self._on_tick_subscribers:
@@ -95,81 +180,140 @@ class Simulation(BaseModel):
             except Exception as e:
                 print(f"[WARN] on_tick subscriber error: {e}")
 
-    async def _do_run(self, ticks: Optional[int] = None):
+    def step(self):
+        """Advance the simulation by exactly one tick, notifying subscribers and dumping state as configured."""
+        # Reset the thinking count at the start of each tick
+        self.world.entity_thinking_count = 0
+
+        # Advance the world by one tick
+        self.world.tick()
+        self.tick_count += 1
+
+        # Call all on_tick subscribers
+        self.dispatch_on_tick()
+
+        if GlobalConfig.simulation_dump_state:
+            self._dump_state()
+
+    def fast_forward(self, max_ticks: int) -> int:
+        """Skip up to max_ticks ticks at once if the world is quiescent (see World.fast_forward).
+        Skipped ticks are not dispatched to on_tick subscribers or dumped. Returns the number of ticks skipped."""
+        skipped = self.world.fast_forward(max_ticks)
+        self.tick_count += skipped
+        return skipped
+
+    def _dump_state(self):
+        # Change detection and file writing are handled by the dump pipeline, off the simulation thread.
+        if self._state_dumper is None:
+            if GlobalConfig.simulation_dump_format == "journal":
+                self._state_dumper = JournalStateDumper()
+            else:
+                self._state_dumper = StateDumper()
+        self._state_dumper.dump(self)
+
+    def flush_state_dumps(self):
+        """Block until all queued state dumps have been written to disk."""
+        if self._state_dumper:
+            self._state_dumper.flush()
+
+    def close_state_dumps(self):
+        """Write all queued state dumps, then stop the dump writer and close its files.
+        Dumping resumes in a new journal if the simulation keeps running."""
+        if self._state_dumper:
+            self._state_dumper.stop()
+            self._state_dumper = None
+
+    def start_new_run(self):
+        """Give this simulation a new run ID (see SimulationContext.run_id), e.g. after forking it, and move the
+        spill files of every object's log over to it, so that they do not append to another run's files."""
+        self.flush_logs()
+        self._context.run_id = SimulationContext.new_run_id()
+        for entity in self.world.entities.values():
+            entity.update_log_spill_path(self._context)
+            for component in getattr(entity, 'components', ()):
+                component.update_log_spill_path(self._context)
+
+    def flush_logs(self):
+        """Write all log entries that have been evicted from memory, but not yet spilled, to disk."""
+        for entity in self.world.entities.values():
+            entity.flush_logs()
+            for component in getattr(entity, 'components', ()):
+                component.flush_logs()
+
+    async def _wait_for_thinking_entities(self) -> float:
+        """Headless mode: block (without ticking) until no agent has an outstanding LLM request.
+        Returns the number of seconds spent waiting."""
+        start = time.perf_counter()
+        deadline = start + GlobalConfig.llm_timeout_seconds
+        while self.running and self.world.is_any_entity_thinking():
+            if time.perf_counter() >= deadline:
+                print(f"[WARN] Simulation: gave up waiting on LLM responses after {GlobalConfig.llm_timeout_seconds} seconds.")
+                break
+            await asyncio.sleep(self.headless_poll_interval)
+        return time.perf_counter() - start
+
+    async def _do_run(self, ticks: Optional[int] = None, headless: bool = False) -> RunStats:
         """Run the simulation asynchronously for a specified number of ticks."""
+        # Everything that runs inside our ticks (tools, agents, newly created objects) belongs to this simulation,
+        #  even if other simulations are running concurrently in the same process.
+        with self.activate():
+            return await self._run_loop(ticks, headless)
+
+    async def _run_loop(self, ticks: Optional[int], headless: bool) -> RunStats:
         self.running = True
-        count = 0
+        stats = RunStats()
+        start = time.perf_counter()
 
         while self.running:
             sleep_time = 0.1
 
             if not self.paused:
-                # Reset the thinking count at the start of each tick
-                self.world.entity_thinking_count = 0
-
-                # Advance the world by one tick
-                self.world.tick()
-                self.tick_count += 1
-                count += 1
-                # Call all on_tick subscribers
-                for cb in self._on_tick_subscribers:
-                    try:
-                        cb(self)
-                    except Exception as e:
-                        print(f"[WARN] on_tick subscriber error: {e}")
-
-                self.dispatch_on_tick()
-
-                if GlobalConfig.simulation_dump_state:
-                    state_full = self.to_json()
-                    state_short = self.world.to_json(short=True)
-
-                    os.makedirs("logs", exist_ok=True)
-                    filename_full = f"sim_state_{Simulation.get_instance().tick_count}.json"
-                    filename_short = f"world_state_{Simulation.get_instance().tick_count}.json"
-
-                    short_state_changed = True
-
-                    filename_short_prev = f"world_state_{Simulation.get_instance().tick_count - 1}.json"
-                    # Check if the previous file exists
-                    if os.path.exists(f"logs/{filename_short_prev}"):
-                        # Check if it has the same contents as the current state
-                        with open(f"logs/{filename_short_prev}", "r") as f:
-                            state_short_prev = json.load(f)
-
-                        if state_short_prev == state_short:
-                            short_state_changed = False
-
-                    # Only write the new state if it has changed
-                    if short_state_changed:
-                        with open(f"logs/{filename_full}", "w") as f:
-                            try:
-                                json.dump(state_full, f, indent=2)
-                            except Exception as e:
-                                # Write without dumping it as JSON -- just serialize as string
-                                print(f"[WARN] Failed to write {filename_full}: {e}")
-                                f.write(str(state_full))
-                        with open(f"logs/{filename_short}", "w") as f:
-                            json.dump(state_short, f, indent=2)
-                    else:
-                        pass
-                        #print(f"Skipping world state dump for tick {Simulation.get_instance().tick_count} as it is unchanged from prev.")
+                if headless and self.idle_fast_forward:
+                    # Leave the last tick of the run to step(), so that subscribers see the final state
+                    budget = ticks - stats.ticks - 1 if ticks is not None else self.idle_fast_forward_max_ticks
+                    stats.ticks += self.fast_forward(budget)
+
+                tick_start = time.perf_counter()
+                self.step()
+                stats.ticks += 1
 
-                if ticks is not None and count >= ticks:
+                if ticks is not None and stats.ticks >= ticks:
                     self.running = False
                     break
 
-                sleep_time = self.simulation_delay
+                if headless:
+                    # Only wait when an agent is actually waiting on its LLM, otherwise tick back-to-back.
+                    if self.world.entity_thinking_count > 0:
+                        stats.llm_wait_seconds += await self._wait_for_thinking_entities()
+                    else:
+                        # Yield to the event loop so that other tasks are not starved.
+                        await asyncio.sleep(0)
+                    continue
+
+                period = self.simulation_delay
 
                 # Check to see if any agents are thinking
                 if self.world.entity_thinking_count > 0:
                     # If any entities are thinking, then give them the maximum delay to think
-                    sleep_time = self.simulation_delay_max
-                    #print(f"Simulation: {self.world.entity_thinking_count} entities are thinking, sleeping for {sleep_time} seconds.")
+                    period = self.simulation_delay_max
+                    #print(f"Simulation: {self.world.entity_thinking_count} entities are thinking, sleeping for {period} seconds.")
 
-            # Sleep for the specified delay before the next tick
+                # Sleep for whatever is left of the tick period once the cost of this tick is subtracted
+                sleep_time = self._scheduler.next_delay(tick_start, time.perf_counter(), period)
+            else:
+                # Don't try to catch up on time spent paused
+                self._scheduler.reset()
+
+            # Sleep until the next tick is due
             await asyncio.sleep(sleep_time)
 
+        stats.elapsed_seconds = time.perf_counter() - start
+        self.flush_state_dumps()
+        log_sink().flush()
+        if GlobalConfig.log_spill_dir:
+            self.flush_logs()
+        return stats
+
 
 
 # Resolve forward references now that World is fully defined.
@@ -0,0 +1,75 @@
+import contextvars
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Type
+
+if TYPE_CHECKING:
+    from simulation.core.Simulation import Simulation
+
+# --- Simulation Context ---
+# State that belongs to one Simulation rather than to the whole process: the simulation itself
+#  (as returned by Simulation.get_instance()), the counters used to generate object IDs
+#  (e.g. "GonkDroid_1"), the sequence numbers of log messages and a run ID that tells runs apart on
+#  disk (e.g. their log spill files). Every Simulation owns a context, so a single process can host
+#  many independent simulations whose IDs are numbered independently.
+# A context is saved and restored along with its simulation (see Checkpoint.py), so numbering
+#  carries on where it left off, even in another process.
+#
+# Which context is "current" is resolved in two steps:
+#  1. A context activated with SimulationContext.activate() (Simulation.activate() / the run loop),
+#     tracked with a ContextVar so that it only applies to the current asyncio task or thread.
+#     This is what keeps simulations that run concurrently in one process apart.
+#  2. Otherwise, the process-wide default: the most recently created simulation, or the one last
+#     passed to make_default(). This keeps the single-simulation behaviour of the GUI and scripts.
+# Objects created before any simulation exists (e.g. default components declared on a class)
+#  are numbered by a bootstrap context.
+
+class SimulationContext:
+    def __init__(self, simulation: Optional['Simulation'] = None):
+        self.simulation = simulation
+        self.type_counter: Dict[Type, int] = {}  # Number of IDs generated so far, per type
+        self.log_sequence = 0  # Sequence number of the next log message (see LogMessage)
+        self.run_id = self.new_run_id()  # Names this run's files, which would otherwise clash with other runs' (object IDs are only unique per context)
+
+    @staticmethod
+    def new_run_id() -> str:
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+    def generate_id(self, obj_type: Type) -> str:
+        count = self.type_counter.get(obj_type, 0) + 1
+        self.type_counter[obj_type] = count
+        return f"{obj_type.__name__}_{count}"
+
+    def next_log_sequence(self) -> int:
+        sequence = self.log_sequence
+        self.log_sequence = sequence + 1
+        return sequence
+
+    def make_default(self):
+        """Make this the context used wherever no other context has been activated."""
+        global _default_context
+        _default_context = self
+
+    @contextmanager
+    def activate(self) -> Iterator['SimulationContext']:
+        """Make this the current context within the current asyncio task / thread, for the duration of the block."""
+        token = _active_context.set(self)
+        try:
+            yield self
+        finally:
+            _active_context.reset(token)
+
+
+_default_context = SimulationContext()
+_active_context: contextvars.ContextVar[Optional[SimulationContext]] = contextvars.ContextVar("simulation_context", default=None)
+
+
+def current_context() -> SimulationContext:
+    """Return the context of the simulation that code is currently running in."""
+    return _active_context.get() or _default_context
+
+
+def default_context() -> SimulationContext:
+    """Return the process-wide default context (see make_default), ignoring any activated one."""
+    return _default_context
@@ -0,0 +1,114 @@
+import bisect
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+
+# --- Spatial Hash ---
+# Positions of a set of entities, bucketed into square grid cells, for nearest-neighbour queries by
+#  Manhattan distance. The World keeps one per entity type (see World.nearest), so that finding the
+#  nearest GX1_Vaporator only looks at GX1_Vaporators, and only at those in the cells around us.
+# A query searches rings of cells outwards from the query point, and stops as soon as no cell further
+#  out could hold anything closer than what has been found. If that would mean visiting more cells
+#  than there are entities (few, widely spread entities), it scans the entities instead.
+# Ties are broken by a caller-supplied order (the order in which entities were added to the world),
+#  so results match a stable sort of every candidate by distance.
+
+class SpatialHash:
+    def __init__(self, cell_size: int = 16):
+        self.cell_size = max(1, cell_size)
+        self._cells: Dict[Tuple[int, int], Dict[str, None]] = {}  # Cell -> IDs of the entities in it
+        self._positions: Dict[str, Tuple[int, int]] = {}  # Entity ID -> (x, y)
+        self._bounds: Optional[List[int]] = None  # [min_cx, min_cy, max_cx, max_cy] of every cell used so far (only ever grows)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._positions
+
+    def _cell(self, x: int, y: int) -> Tuple[int, int]:
+        return (x // self.cell_size, y // self.cell_size)
+
+    def place(self, entity_id: str, x: int, y: int):
+        """Index an entity at the given position, replacing wherever it was before."""
+        old = self._positions.get(entity_id)
+        if old == (x, y):
+            return
+        if old is not None:
+            old_cell = self._cell(*old)
+            if old_cell == self._cell(x, y):
+                self._positions[entity_id] = (x, y)
+                return
+            self.remove(entity_id)
+        self._positions[entity_id] = (x, y)
+        cx, cy = self._cell(x, y)
+        self._cells.setdefault((cx, cy), {})[entity_id] = None
+        if self._bounds is None:
+            self._bounds = [cx, cy, cx, cy]
+        else:
+            bounds = self._bounds
+            bounds[0], bounds[1] = min(bounds[0], cx), min(bounds[1], cy)
+            bounds[2], bounds[3] = max(bounds[2], cx), max(bounds[3], cy)
+
+    def remove(self, entity_id: str):
+        position = self._positions.pop(entity_id, None)
+        if position is None:
+            return
+        cell = self._cell(*position)
+        entity_ids = self._cells[cell]
+        del entity_ids[entity_id]
+        if not entity_ids:
+            del self._cells[cell]
+        if not self._positions:
+            self._bounds = None
+
+    def nearest(self, x: int, y: int, k: int = 1, max_distance: Optional[int] = None,
+                order: Optional[Callable[[str], int]] = None) -> List[Tuple[int, str]]:
+        """The k entities nearest to (x, y) by Manhattan distance, as (distance, entity ID), closest first.
+        Entities further than max_distance are left out. Equidistant entities are ordered by `order(entity_id)`."""
+        if k <= 0 or not self._positions:
+            return []
+        order = order or (lambda entity_id: 0)
+
+        def key(entity_id: str) -> Tuple[int, int]:
+            ex, ey = self._positions[entity_id]
+            return (abs(ex - x) + abs(ey - y), order(entity_id))
+
+        cx, cy = self._cell(x, y)
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+        last_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy)
+
+        best: List[Tuple[int, int, str]] = []  # (distance, order, entity ID), sorted, at most k long
+        cells_visited = 0
+        for ring in range(last_ring + 1):
+            # Nothing in this ring of cells, or any further out, can be closer than this
+            ring_distance = max(0, (ring - 1) * self.cell_size + 1)
+            if max_distance is not None and ring_distance > max_distance:
+                break
+            if len(best) == k and ring_distance > best[-1][0]:
+                break
+            cells_visited += max(1, 8 * ring)
+            if cells_visited > len(self._positions):
+                # Cheaper to look at every entity than to keep searching (mostly empty) cells
+                best = heapq.nsmallest(k, ((*key(entity_id), entity_id) for entity_id in self._positions))
+                break
+            for cell in self._ring_cells(cx, cy, ring):
+                for entity_id in self._cells.get(cell, ()):
+                    candidate = (*key(entity_id), entity_id)
+                    if len(best) < k or candidate < best[-1]:
+                        bisect.insort(best, candidate)
+                        del best[k:]
+
+        return [(distance, entity_id) for distance, _, entity_id in best
+                if max_distance is None or distance <= max_distance]
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int):
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
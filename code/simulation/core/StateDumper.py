@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from simulation.GlobalConfig import GlobalConfig
+from simulation.journal.TickJournal import TickJournalWriter
+
+# --- State Dump Pipeline ---
+# Writes debug dumps of the simulation state (see GlobalConfig.simulation_dump_state) without
+#  slowing down the simulation thread.
+#  - Change detection uses an in-memory digest of the short world state, rather than re-reading
+#    the previous dump from disk.
+#  - The full state is only serialized when the short state has actually changed, and the tilemap
+#    is left out of it unless its version has changed since the last dump.
+#  - Encoding and file I/O happen on a background writer thread, fed by a bounded queue.
+#    If the writer cannot keep up, dumps are dropped (and counted) rather than stalling the tick.
+# StateDumper writes a pair of files (sim_state_N.json / world_state_N.json) per changed tick.
+#  JournalStateDumper instead appends to a single delta-encoded tick journal (see TickJournal.py).
+# Call flush() to wait for (and sync) everything queued so far, and stop() once the dumper is no
+#  longer needed, to shut down the writer thread and close its files.
+
+class StateDumper:
+    def __init__(self, directory: Optional[str] = None, queue_size: Optional[int] = None):
+        self.directory = directory or GlobalConfig.simulation_dump_dir
+        self.dumps_written = 0  # Number of ticks whose state has been written to disk
+        self.dumps_skipped = 0  # Number of ticks skipped because the state had not changed
+        self.dumps_dropped = 0  # Number of ticks dropped because the writer queue was full
+
+        self._last_digest: Optional[bytes] = None
+        self._last_tilemap_key: Optional[tuple] = None  # (tilemap, version) of the last tilemap dumped
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size or GlobalConfig.simulation_dump_queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def digest(state: Dict[str, Any]) -> bytes:
+        """Compute a compact fingerprint of a JSON-compatible state dict."""
+        encoded = json.dumps(state, sort_keys=True, separators=(',', ':'), default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
+    def dump(self, simulation) -> bool:
+        """Queue the current state of the simulation to be written, if it has changed since the last dump.
+        Returns True if a dump was queued."""
+        state_short = simulation.world.to_json(short=True)
+        digest = self.digest(state_short)
+        if digest == self._last_digest:
+            self.dumps_skipped += 1
+            return False
+
+        state_full = simulation.to_json(include_tilemap=not self._tilemap_unchanged(simulation))
+        tilemap_key = self._tilemap_key(simulation)  # Serializing creates the default tilemap if there was none
+        try:
+            self._queue.put_nowait((simulation.tick_count, state_full, state_short))
+        except queue.Full:
+            # Leave the digest (and tilemap key) alone so that the next tick tries again.
+            self.dumps_dropped += 1
+            return False
+
+        self._last_digest = digest
+        self._last_tilemap_key = tilemap_key
+        self._ensure_writer()
+        return True
+
+    @staticmethod
+    def _tilemap_key(simulation) -> Optional[tuple]:
+        tilemap = simulation.world.tilemap
+        return (tilemap, tilemap.version) if tilemap else None
+
+    def _tilemap_unchanged(self, simulation) -> bool:
+        key = self._tilemap_key(simulation)
+        last = self._last_tilemap_key
+        return key is not None and last is not None and key[0] is last[0] and key[1] == last[1]
+
+    def flush(self):
+        """Block until every queued dump has been written to disk."""
+        if self._thread:
+            self._queue.join()
+            self.sync()
+
+    def stop(self):
+        """Write everything still queued, then shut down the writer thread and close any open files.
+        The dumper must not be used afterwards."""
+        self.flush()
+        if self._thread and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+        self.close()
+
+    def sync(self):
+        """Make sure that everything written so far has reached the disk. Called once the writer is idle."""
+        pass
+
+    def close(self):
+        """Close any files held open by the writer. Called once the writer thread has stopped."""
+        pass
+
+    def _ensure_writer(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer_loop, name="StateDumper", daemon=True)
+            self._thread.start()
+
+    def _writer_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                # Sentinel from stop()
+                self._queue.task_done()
+                return
+            tick_count, state_full, state_short = item
+            try:
+                self.write(tick_count, state_full, state_short)
+                self.dumps_written += 1
+            except Exception as e:
+                print(f"[WARN] Failed to write state dump for tick {tick_count}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def write(self, tick_count: int, state_full: Dict[str, Any], state_short: Dict[str, Any]):
+        """Write a single tick's state to disk. Runs on the writer thread."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_json(os.path.join(self.directory, f"sim_state_{tick_count}.json"), state_full)
+        self._write_json(os.path.join(self.directory, f"world_state_{tick_count}.json"), state_short)
+
+    @staticmethod
+    def _write_json(path: str, state: Dict[str, Any]):
+        with open(path, "w") as f:
+            json.dump(state, f, separators=(',', ':'), default=str)
+
+
+class JournalStateDumper(StateDumper):
+    def __init__(self, directory: Optional[str] = None, queue_size: Optional[int] = None, keyframe_interval: Optional[int] = None):
+        super().__init__(directory, queue_size)
+        self.keyframe_interval = keyframe_interval or GlobalConfig.simulation_journal_keyframe_interval
+        self.journal_path = os.path.join(self.directory, f"sim_journal_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl")
+        self._journal: Optional[TickJournalWriter] = None  # Opened lazily, on the writer thread
+        self._tilemap: Optional[Dict[str, Any]] = None  # Last tilemap dumped, carried into ticks that omit it
+
+    def write(self, tick_count: int, state_full: Dict[str, Any], state_short: Dict[str, Any]):
+        # Every journal entry holds the complete state, so fill in the tilemap when it was left out.
+        #  It is normalized once and then shared between entries, so unchanged ticks diff it by identity.
+        tilemap = state_full.get("world", {}).pop("tilemap", None)
+        state = TickJournalWriter.normalize(state_full)
+        if tilemap is not None:
+            self._tilemap = TickJournalWriter.normalize(tilemap)
+        if self._tilemap is not None and "world" in state:
+            state["world"]["tilemap"] = self._tilemap
+        if self._journal is None:
+            self._journal = TickJournalWriter(self.journal_path, self.keyframe_interval)
+        self._journal.append(tick_count, state, normalized=True)
+
+    def sync(self):
+        if self._journal:
+            self._journal.sync()
+
+    def close(self):
+        if self._journal:
+            self._journal.close()
+            self._journal = None
@@ -0,0 +1,63 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+# --- Tick Scheduler ---
+# Fixed-timestep scheduler for the real-time simulation loop.
+#  Rather than sleeping the whole tick period after every tick (which makes the real period
+#  equal to delay + work time, and drift as the world grows), the scheduler keeps an absolute
+#  deadline for every tick and only sleeps for whatever time is left once the tick's own cost
+#  has been subtracted.
+#  If a tick overruns, the following ticks run back-to-back to catch up, but only within a
+#  bounded budget. Beyond that budget, the missed ticks are skipped and the schedule is reset,
+#  so that a world that is too large for the target rate slows down gracefully instead of
+#  spiralling.
+
+class TickScheduler(BaseModel):
+    max_catchup_ticks: int = 5  # How many tick periods behind we are willing to catch up on before skipping
+
+    next_tick_time: Optional[float] = None  # Absolute (monotonic clock) time at which the next tick is due
+    tick_lag: float = 0.0  # How far behind schedule (in seconds) the most recent tick finished. 0 when on time.
+    tick_cost: float = 0.0  # How long (in seconds) the most recent tick took to run
+    catchup_ticks: int = 0  # Number of ticks that were run immediately to catch up on lag
+    skipped_ticks: int = 0  # Number of tick periods dropped because lag exceeded the catch-up budget
+
+    def reset(self):
+        """Forget the current schedule (e.g. after a pause), so that the next tick starts a fresh one."""
+        self.next_tick_time = None
+        self.tick_lag = 0.0
+
+    def next_delay(self, tick_start: float, tick_end: float, period: float) -> float:
+        """Record a completed tick and return how long to sleep before starting the next one.
+
+        Args:
+            tick_start (float): Monotonic time at which the tick began.
+            tick_end (float): Monotonic time at which the tick finished.
+            period (float): Target time between the start of consecutive ticks, in seconds.
+        """
+        self.tick_cost = tick_end - tick_start
+
+        if period <= 0:
+            # No target rate: run as fast as possible, there is no schedule to fall behind on.
+            self.next_tick_time = tick_end
+            self.tick_lag = 0.0
+            return 0.0
+
+        if self.next_tick_time is None:
+            self.next_tick_time = tick_start
+        self.next_tick_time += period
+
+        lag = tick_end - self.next_tick_time
+        if lag <= 0:
+            # On schedule: sleep for whatever is left of the period.
+            self.tick_lag = 0.0
+            return -lag
+
+        self.tick_lag = lag
+        if lag > period * self.max_catchup_ticks:
+            # Too far behind to catch up: drop the backlog and restart the schedule from now.
+            self.skipped_ticks += int(lag // period)
+            self.next_tick_time = tick_end
+        else:
+            self.catchup_ticks += 1
+        return 0.0
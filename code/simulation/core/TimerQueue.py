@@ -0,0 +1,73 @@
+import heapq
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from simulation.core.entity.component.Component import Component
+
+# --- Timer Queue ---
+# A priority queue of callbacks keyed by the world tick at which they are due, so that things that
+#  are waiting (cooldowns, sleeping droids) cost nothing until their deadline instead of being
+#  polled or counted down every tick.
+# Callbacks that are due on the same tick run in the order they were scheduled, so that runs stay
+#  deterministic. There is no way to cancel a timer: callers check whether a timer is still wanted
+#  when it fires (see Component.suspend), which keeps scheduling and rescheduling O(log n).
+# Timers can be tagged with the ID of the entity that they belong to, so that they are dropped when
+#  it leaves the world (see discard_owner).
+
+class Suspension:
+    """The timer that ends a component's suspension (see Component.suspend). A record of its own, rather
+    than a plain callback, so that the world can tell suspensions apart from other timers (see World.fast_forward)."""
+    __slots__ = ('component', 'tick')
+
+    def __init__(self, component: 'Component', tick: int):
+        self.component = component
+        self.tick = tick  # Tick at which the suspension ends
+
+    @property
+    def is_current(self) -> bool:
+        """Whether this is still the component's suspension (rather than an earlier one that was ended or replaced)."""
+        return self.component._suspended_until == self.tick
+
+    def __call__(self):
+        self.component._suspension_expired(self.tick)
+
+class TimerQueue:
+    def __init__(self):
+        self._heap: List[Tuple[int, int, Callable[..., Any], tuple, Optional[str]]] = []  # (tick, sequence, callback, args, owner)
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, tick: int, callback: Callable[..., Any], *args, owner: Optional[str] = None):
+        """Call `callback(*args)` once the world reaches the given tick. `owner` is the ID of the entity that the timer belongs to, if any."""
+        heapq.heappush(self._heap, (tick, self._sequence, callback, args, owner))
+        self._sequence += 1
+
+    def discard_owner(self, owner: str):
+        """Drop every timer that belongs to the given entity."""
+        heap = [entry for entry in self._heap if entry[4] != owner]
+        if len(heap) != len(self._heap):
+            heapq.heapify(heap)
+            self._heap = heap
+
+    def clear(self):
+        self._heap.clear()
+
+    def next_tick(self) -> int | None:
+        """The tick at which the earliest timer is due, or None if there are none."""
+        return self._heap[0][0] if self._heap else None
+
+    def pending(self) -> Iterator[Tuple[int, Callable[..., Any], tuple]]:
+        """Every timer that has not fired yet, as (tick, callback, args), in no particular order."""
+        for tick, _, callback, args, _ in self._heap:
+            yield tick, callback, args
+
+    def advance(self, tick: int) -> int:
+        """Run every callback that is due at or before the given tick. Returns the number of callbacks run."""
+        fired = 0
+        while self._heap and self._heap[0][0] <= tick:
+            _, _, callback, args, _ = heapq.heappop(self._heap)
+            callback(*args)
+            fired += 1
+        return fired
@@ -1,12 +1,24 @@
-from typing import TYPE_CHECKING, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 from simulation.core.entity.Entity import Entity, Location
+from simulation.core.OccupancyIndex import OccupancyIndex
+from simulation.core.pathfinding.AStar import AStar
+from simulation.core.pathfinding.CooperativeAStar import CooperativeAStar
+from simulation.core.pathfinding.FlowField import FlowFieldCache
+from simulation.core.pathfinding.HierarchicalPathfinder import HierarchicalPathfinder
+from simulation.core.pathfinding.PathCache import PathCache
+from simulation.core.pathfinding.ReservationTable import ReservationTable
+from simulation.core.SimulationContext import current_context
+from simulation.core.SpatialHash import SpatialHash
+from simulation.core.TimerQueue import Suspension, TimerQueue
 from simulation.core.tiles.Tilemap import Tilemap
+from simulation.GlobalConfig import GlobalConfig
 
 if TYPE_CHECKING:
     from simulation.core.entity.Chassis import \
         Chassis  # type: ignore
+    from simulation.core.Simulation import Simulation
 
 # --- World System ---
 class World(BaseModel):
@@ -14,32 +26,228 @@ class World(BaseModel):
     entity_thinking_count: int = 0
     tilemap: Optional[Tilemap] = None
 
+    _simulation: Optional['Simulation'] = None  # The simulation that owns this world (set by Simulation)
+
+    # Active set: only entities in here are ticked. Chassis leave it once all of their components are
+    #  dormant, and rejoin when woken (see Chassis.wake). Entities are always ticked in the order that
+    #  they were added to the world, so that skipping idle entities does not change the outcome.
+    _next_sequence: int = 0
+    _sequence: Dict[str, int] = {}  # Entity ID -> order in which it was added
+    _active: Dict[str, int] = {}  # Entity ID -> sequence, for every active entity
+    _active_order: Optional[List[Tuple[str, Callable[[], None]]]] = None  # (ID, bound tick method) of every active entity, in tick order (rebuilt when the active set changes)
+
+    _current_tick: int = -1  # Index of the tick in progress (or the last one to run). The first tick is 0.
+    _timers: TimerQueue = TimerQueue()  # Wake-ups scheduled for future ticks (see Component.suspend)
+
+    _occupancy: OccupancyIndex = OccupancyIndex()  # Which entities occupy which tiles (kept up to date by Entity.__setattr__)
+
+    # Lookup indexes for get_entity / get_entities. Entity IDs are kept in dicts used as ordered sets,
+    #  so that results come back in the order that entities were added, as with a scan of `entities`.
+    _by_class_name: Dict[str, Dict[str, None]] = {}  # Concrete class name -> entity IDs
+    _by_type_name: Dict[str, Dict[str, None]] = {}  # Name of every Entity class in the MRO -> entity IDs
+    _spatial: Dict[str, SpatialHash] = {}  # Concrete class name -> locations of those entities, for nearest()
+
+    _pathfinder: Optional[AStar] = None  # Pathfinder over the current tilemap (see pathfinder)
+    _hierarchical_pathfinder: Optional[HierarchicalPathfinder] = None  # The same, for large maps (see hierarchical_pathfinder)
+    _flow_fields: Optional[FlowFieldCache] = None  # Shared paths to popular destinations (see flow_fields)
+    _path_cache: Optional[PathCache] = None  # Recently found paths (see path_cache)
+    _reservations: ReservationTable = ReservationTable()  # Tiles reserved by cooperatively moving entities, by tick (see CooperativeAStar)
+
     def __init__(self, **data):
         super().__init__(**data)
+        # Register any entities that were passed in directly
+        for entity in list(self.entities.values()):
+            self.add_entity(entity)
+
+    @property
+    def current_tick(self) -> int:
+        """Index of the tick in progress, or of the last tick to run if called between ticks."""
+        return self._current_tick
+
+    def schedule(self, tick: int, callback, *args, owner: Optional[str] = None):
+        """Call `callback(*args)` at the start of the given tick, before any entity is ticked.
+        Timers with an owner (an entity ID) are dropped if that entity leaves the world first."""
+        self._timers.schedule(tick, callback, *args, owner=owner)
+
+    def __getstate__(self):
+        # The pathfinders only hold data derived from the tilemap, which is rebuilt on demand, so leave them out of checkpoints
+        state = super().__getstate__()
+        private = dict(state['__pydantic_private__'] or {})
+        private['_pathfinder'] = None
+        private['_hierarchical_pathfinder'] = None
+        private['_flow_fields'] = None
+        private['_path_cache'] = None
+        state['__pydantic_private__'] = private
+        return state
+
+    @property
+    def pathfinder(self) -> AStar:
+        """The pathfinder for this world's tilemap (creating the default tilemap if there is none yet)."""
+        if self.tilemap is None:
+            self.tilemap = Tilemap.from_default()
+        if self._pathfinder is None or self._pathfinder.tilemap is not self.tilemap:
+            self._pathfinder = AStar(self.tilemap)
+        return self._pathfinder
+
+    @property
+    def hierarchical_pathfinder(self) -> HierarchicalPathfinder:
+        """The hierarchical (HPA*) pathfinder for this world's tilemap, for long paths across large maps."""
+        if self.tilemap is None:
+            self.tilemap = Tilemap.from_default()
+        pathfinder = self._hierarchical_pathfinder
+        if pathfinder is None or pathfinder.tilemap is not self.tilemap or pathfinder.cluster_size != GlobalConfig.pathfinding_cluster_size:
+            pathfinder = self._hierarchical_pathfinder = HierarchicalPathfinder(self.tilemap, GlobalConfig.pathfinding_cluster_size)
+        return pathfinder
+
+    @property
+    def flow_fields(self) -> FlowFieldCache:
+        """Flow fields to the destinations that entities path to most often, shared by all of them."""
+        if self.tilemap is None:
+            self.tilemap = Tilemap.from_default()
+        if self._flow_fields is None or self._flow_fields.tilemap is not self.tilemap:
+            self._flow_fields = FlowFieldCache(self.tilemap, GlobalConfig.flow_field_query_threshold, GlobalConfig.max_flow_fields)
+        return self._flow_fields
+
+    @property
+    def path_cache(self) -> PathCache:
+        """Recently found paths, shared by every entity. See PathCache.stats for its hit rate."""
+        if self.tilemap is None:
+            self.tilemap = Tilemap.from_default()
+        if self._path_cache is None or self._path_cache.tilemap is not self.tilemap or self._path_cache.max_entries != GlobalConfig.path_cache_size:
+            self._path_cache = PathCache(self.tilemap, GlobalConfig.path_cache_size)
+        return self._path_cache
+
+    @property
+    def reservations(self) -> ReservationTable:
+        return self._reservations
+
+    @property
+    def cooperative_pathfinder(self) -> CooperativeAStar:
+        """Space-time planner for entities that move cooperatively, around each other's reservations."""
+        if self.tilemap is None:
+            self.tilemap = Tilemap.from_default()
+        return CooperativeAStar(self, self._reservations)
+
+    def find_path(self, start: Location, goal: Location, size: Tuple[int, int] = (1, 1)) -> Optional[List[Location]]:
+        """A path across the tilemap for an entity of the given size, as the list of locations to step to
+        (excluding start, including goal). Empty if start is the goal. None if there is no path.
+        Recently found paths are reused (see GlobalConfig.path_cache_size). Otherwise, popular destinations are
+        read off a shared flow field (see GlobalConfig.flow_field_query_threshold), and large maps are searched
+        hierarchically (see GlobalConfig.hierarchical_pathfinding_min_tiles). Entities larger than one tile
+        always get a full A* search."""
+        self.pathfinder.tilemap.ensure_initialized()
+        return self.path_cache.get_or_compute(start, goal, tuple(size), self._search_path)
+
+    def _search_path(self, start: Location, goal: Location, size: Tuple[int, int]) -> Optional[List[Location]]:
+        pathfinder = self.pathfinder
+        tilemap = pathfinder.tilemap
+        if size == (1, 1):
+            field = self.flow_fields.get(goal) if GlobalConfig.flow_field_query_threshold > 0 else None
+            if field is not None:
+                return field.path_from(start)
+            if tilemap.width * tilemap.height >= GlobalConfig.hierarchical_pathfinding_min_tiles:
+                return self.hierarchical_pathfinder.find_path(start, goal)
+        return pathfinder.find_path(start, goal, size)
+
+    @property
+    def simulation(self) -> Optional['Simulation']:
+        """The simulation that owns this world. Worlds created on their own fall back to the current simulation."""
+        if self._simulation is not None:
+            return self._simulation
+        return current_context().simulation
 
     def add_entity(self, entity: Entity):
+        existing = self.entities.get(entity.id)
+        if existing is not None and existing is not entity:
+            # IDs are numbered per simulation, so an entity created while another simulation was
+            #  current can clash with one already here. Renumber it rather than replace the other.
+            old_id = entity.id
+            while entity.id in self.entities:
+                entity.id = entity.generate_id(entity.__class__)
+            entity.update_log_spill_path()  # The old spill file belongs to the entity that had the ID first
+            entity.warn(f"Entity ID {old_id} is already in use in this world; renamed to {entity.id}.")
         entity.world = self  # Set the world reference in the entity
         self.entities[entity.id] = entity
+        self._sequence[entity.id] = self._next_sequence
+        self._next_sequence += 1
+        self._occupancy.place(entity.id, entity.footprint)
+        self._index_entity(entity)
+        self.activate_entity(entity)
+
+    @staticmethod
+    def _type_names(entity: Entity) -> List[str]:
+        return [base.__name__ for base in entity.__class__.__mro__ if issubclass(base, Entity)]
+
+    def _index_entity(self, entity: Entity):
+        self._by_class_name.setdefault(entity.__class__.__name__, {})[entity.id] = None
+        for name in self._type_names(entity):
+            self._by_type_name.setdefault(name, {})[entity.id] = None
+        spatial = self._spatial.get(entity.__class__.__name__)
+        if spatial is None:
+            spatial = self._spatial[entity.__class__.__name__] = SpatialHash(GlobalConfig.spatial_hash_cell_size)
+        spatial.place(entity.id, entity.location.x, entity.location.y)
+
+    def _unindex_entity(self, entity: Entity):
+        for index, names in ((self._by_class_name, [entity.__class__.__name__]), (self._by_type_name, self._type_names(entity))):
+            for name in names:
+                entity_ids = index.get(name)
+                if entity_ids is not None:
+                    entity_ids.pop(entity.id, None)
+                    if not entity_ids:
+                        del index[name]
+        spatial = self._spatial.get(entity.__class__.__name__)
+        if spatial is not None:
+            spatial.remove(entity.id)
+
+    def activate_entity(self, entity: Entity):
+        """Add an entity to the active set, so that it is ticked. Entities activated mid-tick are ticked from the next tick."""
+        if entity.id in self._active or entity.id not in self._sequence:
+            return
+        self._active[entity.id] = self._sequence[entity.id]
+        self._active_order = None
+
+    def deactivate_entity(self, entity: Entity):
+        """Remove an entity from the active set, so that it is skipped until it is activated again."""
+        if self._active.pop(entity.id, None) is not None:
+            self._active_order = None
+
+    def is_entity_active(self, entity: Entity) -> bool:
+        return entity.id in self._active
 
     def clear_entities(self):
         """Clear all entities from the world."""
         self.entities.clear()
+        self._sequence.clear()
+        self._active.clear()
+        self._active_order = None
+        self._occupancy.clear()
+        self._timers.clear()
+        self._reservations.clear()
+        self._by_class_name.clear()
+        self._by_type_name.clear()
+        self._spatial.clear()
         self.entity_thinking_count = 0
 
     def remove_entity(self, entity: Entity):
         """Remove an entity from the world."""
         if entity.id in self.entities:
-            del self.entities[entity.id]
-            if entity.thinking:
-                self.entity_thinking_count -= 1
+            self.remove_entity_by_id(entity.id)
 
     def remove_entity_by_id(self, entity_id: str):
         """Remove an entity by its ID."""
         if entity_id in self.entities:
             entity = self.entities[entity_id]
-            if entity.thinking:
+            if entity.is_thinking():
                 self.entity_thinking_count -= 1
             del self.entities[entity_id]
+            del self._sequence[entity_id]
+            if not entity.is_mobile:
+                self._drop_flow_field(entity_id)
+            self._reservations.release(entity_id)
+            self._timers.discard_owner(entity_id)
+            self._occupancy.remove(entity_id)
+            self._unindex_entity(entity)
+            self.deactivate_entity(entity)
 
     def get_entity(self, identifier: Type[Entity] | str) -> Optional[Entity]:
         if isinstance(identifier, str):
@@ -47,7 +255,9 @@ class World(BaseModel):
             return self.entities.get(identifier, None)
         elif isinstance(identifier, type) and issubclass(identifier, Entity):
             # If a Type is provided, return the first entity of that type found
-            for entity in self.entities.values():
+            #  (names can be shared by unrelated classes, so confirm with isinstance)
+            for entity_id in self._by_type_name.get(identifier.__name__, ()):
+                entity = self.entities[entity_id]
                 if isinstance(entity, identifier):
                     return entity
             return None
@@ -55,13 +265,31 @@ class World(BaseModel):
             # TODO: Raise this as an error that can be seen by any AI
             raise TypeError("Identifier must be a Type of Entity or a string representing an entity ID.")
         
-    def get_entities(self, identifier: str) -> List[Entity]:
-        matching_entities = [
-            entity for entity in self.entities.values()
-            if entity.id == identifier or entity.__class__.__name__ == identifier
-            ]
+    def get_entities(self, identifier: str, include_subclasses: bool = False) -> List[Entity]:
+        """Every entity whose ID or class name matches the identifier, in the order they were added.
+        With include_subclasses, the name of any Entity class that they inherit from matches too (e.g. "Vaporator")."""
+        index = self._by_type_name if include_subclasses else self._by_class_name
+        matching_ids = index.get(identifier, {})
+        if identifier in self.entities and identifier not in matching_ids:
+            if not matching_ids:
+                return [self.entities[identifier]]
+            matching_ids = sorted([*matching_ids, identifier], key=self._sequence.__getitem__)
+        return [self.entities[entity_id] for entity_id in matching_ids]
 
-        return matching_entities
+    def nearest(self, identifier: str, from_location: Location, k: int = 1, max_distance: Optional[int] = None) -> List[Entity]:
+        """The k entities matching the identifier (an entity ID or class name, as for get_entities) that are nearest
+        to from_location by Manhattan distance, closest first. Equidistant entities come in the order they were added.
+        Entities further away than max_distance are left out."""
+        spatial = self._spatial.get(identifier)
+        matches = spatial.nearest(from_location.x, from_location.y, k, max_distance, self._sequence.__getitem__) if spatial else []
+        by_id = self.entities.get(identifier)
+        if by_id is not None and (spatial is None or by_id.id not in spatial):
+            distance = from_location.distance_to(by_id.location)
+            if max_distance is None or distance <= max_distance:
+                matches.append((distance, by_id.id))
+                matches.sort(key=lambda match: (match[0], self._sequence[match[1]]))
+                del matches[k:]
+        return [self.entities[entity_id] for _, entity_id in matches]
 
     def tick(self):
         """Advance the world by one tick.
@@ -70,38 +298,106 @@ class World(BaseModel):
         if self.tilemap is None:
             self.tilemap = Tilemap.from_default()
 
-        # 1. Let entities perform their own logic (which may schedule pending moves)
-        for entity in list(self.entities.values()):
-            entity.tick()
+        # 0. Fire any timers that are due, so that whatever they wake up is ticked this tick
+        self._current_tick += 1
+        self._timers.advance(self._current_tick)
+        self._reservations.prune(self._current_tick)
 
-    def is_passable(self, entity: Entity, x: int, y: int) -> bool:
-        # Check every entity in the world for collision
-        entity_bounds = entity.bounds
+        # 1. Let active entities perform their own logic (which may schedule pending moves)
+        if self._active_order is None:
+            self._active_order = [(entity_id, self.entities[entity_id].tick) for entity_id in sorted(self._active, key=self._active.__getitem__)]
+        # Changes to the active set replace _active_order rather than modifying it, so this iterates a snapshot.
+        #  Entities removed from the world mid-tick are skipped.
+        entities = self.entities
+        for entity_id, tick in self._active_order:
+            if entity_id in entities:
+                tick()
+
+    def fast_forward(self, max_ticks: int) -> int:
+        """Skip up to max_ticks ticks at once, if the world is quiescent: nothing is going on other than processes with a
+        closed form (see Chassis.can_fast_forward), such as vaporators condensing and generators recharging.
+        Returns the number of ticks skipped -- 0 if anything (a droid moving or thinking, etc.) has to be ticked.
+        Timers that are not part of such a process are never skipped over."""
+        if max_ticks <= 0 or self.entity_thinking_count > 0:
+            return 0
+
+        ticks = max_ticks
+        chassis_ids = set(self._active)
+        for deadline, callback, args in self._timers.pending():
+            if isinstance(callback, Suspension):
+                if not callback.is_current:
+                    continue  # Stale; will do nothing when it fires
+                component = callback.component
+                if component.chassis is not None and component.chassis.world is self:
+                    chassis_ids.add(component.chassis.id)
+                    continue
+            # Anything else has to happen on its own tick
+            ticks = min(ticks, deadline - self._current_tick - 1)
+        if ticks <= 0:
+            return 0
+
+        chassis_list = [self.entities[entity_id] for entity_id in chassis_ids if entity_id in self.entities]
+        for chassis in chassis_list:
+            can_fast_forward = getattr(chassis, 'can_fast_forward', None)
+            if can_fast_forward is None or not can_fast_forward():
+                return 0
+
+        # Keep to the order in which the world would have ticked them
+        chassis_list.sort(key=lambda chassis: self._sequence[chassis.id])
+        for chassis in chassis_list:
+            chassis.fast_forward(ticks)
+        self._current_tick += ticks
+        return ticks
+
+    def is_any_entity_thinking(self) -> bool:
+        """Check (live, not just as of the last tick) whether any entity is waiting on an LLM response."""
+        return any(entity.is_thinking() for entity in self.entities.values())
 
-        for other_entity in list(self.entities.values()):
-            if other_entity.id == entity.id:
-                continue  # Skip self
-            other_bounds = other_entity.bounds
-            if (other_bounds.intersects(entity_bounds)):
-                return False  # Collision detected
+    def update_entity_footprint(self, entity: Entity):
+        """Re-index an entity after it has moved or changed size."""
+        if self.entities.get(entity.id) is entity:
+            if not entity.is_mobile:
+                self._drop_flow_field(entity.id)
+            self._occupancy.place(entity.id, entity.footprint)
+            self._spatial[entity.__class__.__name__].place(entity.id, entity.location.x, entity.location.y)
+
+    def _drop_flow_field(self, entity_id: str):
+        # Called before a part of the static layout (e.g. a power station, not a droid) moves or leaves: a field to where it
+        #  was is unlikely to be wanted again. Fields only depend on the tilemap, and are dropped when it changes (see
+        #  FlowFieldCache), so droids moving about never touch them.
+        footprint = self._occupancy.footprint_of(entity_id)
+        if footprint is not None and self._flow_fields is not None:
+            self._flow_fields.invalidate(Location(footprint[0], footprint[1]))
+
+    def entities_at(self, x: int, y: int) -> List[Entity]:
+        """Every entity that occupies the tile at (x, y)."""
+        return [self.entities[entity_id] for entity_id in self._occupancy.at(x, y)]
+
+    def is_footprint_free(self, x: int, y: int, width: int = 1, height: int = 1, ignore: Optional[Entity] = None) -> bool:
+        """Whether no entity (other than `ignore`) occupies any tile of the given area."""
+        return self._occupancy.is_free((x, y, width, height), ignore.id if ignore is not None else None)
+
+    def is_passable(self, entity: Entity, x: int, y: int) -> bool:
+        """Whether the entity could stand with its top-left corner at (x, y): no other entity in the way, and every tile passable."""
+        width, height = entity.size
+        if not self.is_footprint_free(x, y, width, height, ignore=entity):
+            return False  # Collision detected
 
         # Check tilemap passability
         if self.tilemap:
-            for ox in range(entity_bounds.width):
-                for oy in range(entity_bounds.height):
-                    tx = x + ox
-                    ty = y + oy
-                    if not self.tilemap.is_passable(tx, ty):
+            for ox in range(width):
+                for oy in range(height):
+                    if not self.tilemap.is_passable(x + ox, y + oy):
                         return False
 
         return True
 
-    def to_json(self, short: bool = False):
+    def to_json(self, short: bool = False, include_tilemap: bool = True):
         val = {
             "entities": {eid: entity.to_json(short) for eid, entity in self.entities.items()},
         }
         # Ensure tilemap present
-        if not short:
+        if not short and include_tilemap:
             if self.tilemap is None:
                 self.tilemap = Tilemap.from_default()
             if self.tilemap:
@@ -2,6 +2,7 @@ import inspect
 import logging
 from typing import TYPE_CHECKING, TypeVar, overload, ClassVar, Dict, Optional, List, Type, Any
 from simulation.core.entity.Entity import Entity, Location, GameObject, LogMessage
+from simulation.core.LogRingBuffer import merge_recent
 from simulation.core.entity.component.Component import Component
 from simulation.llm.ToolCall import ToolCall, _IS_TOOL_FUNCTION
 
@@ -32,15 +33,25 @@ class Chassis(Entity):
     slots: Dict[str, 'ComponentSlot']
     health: int = 100
 
+    _dormant_count: int = 0  # Number of components that have gone dormant since the last wake (lets wake() skip the slot scan)
+    _component_cache: Optional[Dict[Any, Optional[Component]]] = None  # get_component results, by identifier (cleared whenever a slot changes)
+    _tools_cache: Optional[Dict[str, ToolCall]] = None  # get_available_tools result (cleared whenever a slot changes)
+    _tick_list: Optional[List[Component]] = None  # Installed components that are not passive, in slot order (cleared whenever a slot changes)
+
     @property
     def components(self):  # convenience iterable of installed components
         return [slot.component for slot in self.slots.values() if slot.component]
 
+    @property
+    def is_mobile(self) -> bool:
+        return any(component.moves_chassis for component in self.components)
+
     def __init__(__pydantic_self__, **data):
         super().__init__(**data)
         # Ensure every component is properly installed in its slot
         for slot_id, slot in __pydantic_self__.slots.items():
             slot.slot_id = slot.slot_id or slot_id
+            slot._chassis = __pydantic_self__
             if slot.component:
                 __pydantic_self__.install_component(slot.slot_id, slot.component)
 
@@ -58,9 +69,7 @@ class Chassis(Entity):
             # TODO: Do not raise an exception for this, but instead post an error message to the world and/or chassis system
             raise ValueError(f"Slot '{slot_id}' is already occupied by component '{slot.component.id}'.")
 
-        component.chassis = self
-        component.storage_parent = self
-        slot.component = component
+        slot.component = component  # The slot attaches it to this chassis
 
     def uninstall_component(self, slot_id: str) -> Optional[Component]:
         if slot_id not in self.slots:
@@ -72,12 +81,26 @@ class Chassis(Entity):
 
         if slot.component:
             the_component = slot.component
-            the_component.chassis = None
-            the_component.storage_parent = None
-            slot.component = None
+            slot.component = None  # The slot detaches it from this chassis
 
         return the_component
 
+    def _on_slots_changed(self):
+        # Called by ComponentSlot whenever a component is installed, removed or swapped out
+        self._component_cache = None
+        self._tools_cache = None
+        self._tick_list = None
+
+    def __getstate__(self):
+        # Caches are rebuilt on demand, and the tool map holds bound methods, so leave them out of checkpoints
+        state = super().__getstate__()
+        private = dict(state['__pydantic_private__'] or {})
+        private['_component_cache'] = None
+        private['_tools_cache'] = None
+        private['_tick_list'] = None
+        state['__pydantic_private__'] = private
+        return state
+
     @overload
     def get_component(self, identifier: Type[T]) -> Optional[T]: ...
     @overload
@@ -89,7 +112,18 @@ class Chassis(Entity):
     #  If no Slot with that ID exists, it will then return the first Component whose ID matches that identifier.
     #  If no Component with that ID exists, then it will return the first Component whose class or parent class name matches that identifier.
     #  If no matching Component or Slot is found, then it will return None.
+    # Results are cached until the contents of a slot change.
     def get_component(self, identifier: Type[Component] | str) -> Optional[Component]:
+        cache = self._component_cache
+        if cache is None:
+            cache = self._component_cache = {}
+        try:
+            return cache[identifier]
+        except KeyError:
+            component = cache[identifier] = self._find_component(identifier)
+            return component
+
+    def _find_component(self, identifier: Type[Component] | str) -> Optional[Component]:
         if isinstance(identifier, str):
             # Check for a slot with the given ID first
             if identifier in self.slots:
@@ -118,6 +152,12 @@ class Chassis(Entity):
             raise TypeError(f"Identifier must be a Type of Component or a string representing a slot ID or component ID. Got: {identifier}")
 
     def get_available_tools(self) -> Dict[str, ToolCall]:
+        # Built once, then reused until the contents of a slot change
+        if self._tools_cache is None:
+            self._tools_cache = self._collect_tools()
+        return dict(self._tools_cache)
+
+    def _collect_tools(self) -> Dict[str, ToolCall]:
         # Collect all tool calls from all components in the chassis
         all_tools = {}
         for slot in self.slots.values():
@@ -133,20 +173,68 @@ class Chassis(Entity):
 
         return all_tools
     
-    def get_logs(self) -> List[LogMessage]:
-        """Get the log history for this chassis and all components, sorted by timestamp."""
-        logs = super().get_logs()
-        for slot in self.slots.values():
-            if slot.component:
-                logs.extend(slot.component.get_logs())
-        # Sort logs by timestamp
-        logs.sort(key=lambda log: log.timestamp)  # Sort by timestamp
-        return logs
+    def get_logs(self, limit: Optional[int] = None, since: Optional[int] = None) -> List[LogMessage]:
+        """Get the log history for this chassis and all components, oldest first (see GameObject.get_logs for limit / since).
+        Each history is already in order, so they are merged rather than sorted."""
+        histories = [self._log_history] + [component._log_history for component in self.components]
+        return merge_recent(histories, LogMessage.sort_key, limit, since)
     
+    def is_thinking(self) -> bool:
+        return any(component.is_thinking() for component in self.components)
+
+    def wake(self):
+        """Wake every dormant component, and make sure that the world ticks this chassis again."""
+        if self._dormant_count:
+            for slot in self.slots.values():
+                if slot.component:
+                    slot.component._dormant = False
+            self._dormant_count = 0
+        if self.world is not None:
+            self.world.activate_entity(self)
+
+    @property
+    def tick_list(self) -> List[Component]:
+        """The components that Chassis.tick dispatches to: every installed component except passive ones (see
+        Component.is_passive), which would only go dormant again. Built once, then reused until the contents of a slot change."""
+        if self._tick_list is None:
+            self._tick_list = [slot.component for slot in self.slots.values() if slot.component and not slot.component.is_passive()]
+        return self._tick_list
+
     def tick(self):
-        for slot in self.slots.values():
-            if slot.component:
-                slot.component.tick()
+        busy = False
+        # A component moved out of this chassis mid-tick replaces the list rather than modifying it, so check that it is still ours
+        for component in self.tick_list:
+            if not component._dormant and component._suspended_until is None and component.chassis is self:
+                component.tick()
+                busy = busy or not (component._dormant or component._suspended_until is not None)
+
+        # Once every component is dormant or suspended, stop being ticked at all until something wakes us.
+        #  Components can be woken by one another during the tick, so check them all again before going idle.
+        if not busy and self.world is not None and all(c._dormant or c._suspended_until is not None for c in self.tick_list):
+            self.world.deactivate_entity(self)
+
+    def _busy_components(self) -> List[Component]:
+        # Components that will do something if ticks pass: awake ones, and suspended ones (whose timer will fire).
+        #  Passive components are left out: waking them up only ever sends them back to sleep.
+        return [c for c in self.components if (not c._dormant or c._suspended_until is not None) and not c.is_passive()]
+
+    def can_fast_forward(self) -> bool:
+        """Whether everything that is going on in this chassis can be fast-forwarded in closed form (see Component.fast_forward).
+        All busy components must be of one type that supports it, and all others must be passive. Otherwise, a busy component
+        could wake another (e.g. a generator recharging the power pack of a condenser that had run out) and the closed form
+        would no longer hold."""
+        busy = self._busy_components()
+        if not busy:
+            return True
+        component_type = type(busy[0])
+        if not component_type.supports_fast_forward() or any(type(c) is not component_type for c in busy):
+            return False
+        return all(c.is_passive() or type(c) is component_type for c in self.components)
+
+    def fast_forward(self, ticks: int):
+        """Advance every busy component by `ticks` ticks at once. Only valid if can_fast_forward()."""
+        for component in self._busy_components():
+            component.fast_forward(ticks)
 
     def to_json(self, short: bool = False):
         data = {
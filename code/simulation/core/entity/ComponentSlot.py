@@ -3,12 +3,16 @@ from typing import TYPE_CHECKING, Optional, Type
 from pydantic import BaseModel
 from simulation.core.entity.component.Component import Component
 
+if TYPE_CHECKING:
+    from simulation.core.entity.Chassis import Chassis  # type: ignore
+
 
 class ComponentSlot(BaseModel):
     slot_id: Optional[str] = None
     accepts: Optional[Type[Component]] = Component
     _component: Optional[Component] = None
     default_component: Optional[Type[Component]] = None
+    _chassis: Optional['Chassis'] = None  # The chassis that owns this slot (set by Chassis), told whenever the component changes
 
     def __init__(self, slot_id: Optional[str] = None, accepts: Optional[Type[Component]] = Component, component: Optional[Component] = None, default_component: Optional[Type[Component]] = None, **data):
         super().__init__(**data)
@@ -27,7 +31,23 @@ class ComponentSlot(BaseModel):
 
     @component.setter
     def component(self, value: Optional[Component]):
-        # TODO: Also call Chassis.install_component on this (but we need to hold a reference to the chassis on this slot first)
         if value and not isinstance(value, self.accepts):
             raise TypeError(f"Component must be of type {self.accepts.__name__}")
+        previous = self._component
+        chassis = self._chassis
+        if chassis is not None and previous is not None and previous is not value:
+            # End any suspension and wake everything before detaching, so that no state is left behind for this slot
+            previous.resume()
+            chassis.wake()
+            previous.chassis = None
+            previous.storage_parent = None
         self._component = value
+        # Every path that moves components (install / uninstall, Gripper, Storage) goes through here
+        if chassis is not None:
+            if value is not None:
+                value.chassis = chassis
+                value.storage_parent = chassis
+                # A newly installed component may give every component in the chassis something to do
+                value._dormant = False
+                chassis.wake()
+            chassis._on_slots_changed()
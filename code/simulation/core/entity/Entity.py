@@ -1,7 +1,13 @@
-from datetime import datetime
-from typing import ClassVar, Dict, Optional, List, Tuple, Type, TYPE_CHECKING
-from pydantic import BaseModel
+import operator
+import os
+from enum import Enum
+from typing import Callable, ClassVar, Dict, Optional, List, Tuple, Type, TYPE_CHECKING
+from pydantic import BaseModel, PrivateAttr
+from pydantic_core import core_schema
 
+from simulation.core.LogRingBuffer import LogRingBuffer, merge_recent
+from simulation.core.LogSink import log_sink
+from simulation.core.SimulationContext import SimulationContext, current_context
 from simulation.GlobalConfig import GlobalConfig
 
 if TYPE_CHECKING:
@@ -15,34 +21,100 @@ if TYPE_CHECKING:
 
 # Entities can contain Components (see Component.py) that provide functionality or attributes, but these components would not be rendered on the map separately.
 
-class Location(BaseModel):
-    x: int
-    y: int
+# Location and Rectangle are small immutable value types, created in great numbers by pathfinding and
+#  collision checks. They are slotted plain classes rather than models, so that creating one costs no
+#  validation; they are hashable, so they can be used as dict keys and in sets. Models that hold them
+#  (e.g. Entity.location) still validate and serialize them, as {"x": ..., "y": ...} dicts.
+class _ValueType:
+    __slots__ = ()
+    _fields: ClassVar[Tuple[str, ...]] = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable; create a new one instead.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)})"
+
+    def __reduce__(self):
+        return (self.__class__, self._values())
+
+    def model_dump(self, **kwargs) -> Dict[str, int]:
+        return {field: getattr(self, field) for field in self._fields}
+
+    @classmethod
+    def _validate(cls, value):
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(*(int(value[field]) for field in cls._fields))
+        if isinstance(value, (tuple, list)) and len(value) == len(cls._fields):
+            return cls(*(int(v) for v in value))
+        raise ValueError(f"Cannot convert {value!r} to {cls.__name__}")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.model_dump()),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema, handler):
+        return {"type": "object", "properties": {field: {"type": "integer"} for field in cls._fields}, "required": list(cls._fields)}
+
+class Location(_ValueType):
+    __slots__ = ('x', 'y')
+    _fields = ('x', 'y')
+
+    def __init__(self, x: int, y: int):
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
 
     def distance_to(self, other: 'Location') -> float:
         # Calculate the Manhattan distance to another location
         return abs(self.x - other.x) + abs(self.y - other.y)
-    
+
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Location):
+        if other.__class__ is not Location:
             return NotImplemented
         return self.x == other.x and self.y == other.y
-    
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
     def __add__(self, other: 'Location') -> 'Location':
         if not isinstance(other, Location):
             return NotImplemented
-        return Location(x=self.x + other.x, y=self.y + other.y)
+        return Location(self.x + other.x, self.y + other.y)
     
     def __sub__(self, other: 'Location') -> 'Location':
         if not isinstance(other, Location):
             return NotImplemented
-        return Location(x=self.x - other.x, y=self.y - other.y)
+        return Location(self.x - other.x, self.y - other.y)
     
-class Rectangle(BaseModel):
-    x: int
-    y: int
-    width: int
-    height: int
+class Rectangle(_ValueType):
+    __slots__ = ('x', 'y', 'width', 'height')
+    _fields = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x: int, y: int, width: int, height: int):
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'width', width)
+        object.__setattr__(self, 'height', height)
 
     def intersects(self, other: 'Rectangle') -> bool:
         return not (self.x + self.width <= other.x or
@@ -50,73 +122,136 @@ class Rectangle(BaseModel):
                     self.y + self.height <= other.y or
                     self.y >= other.y + other.height)
 
-class LogMessage(BaseModel):
-    colors: ClassVar[Dict[str, str]] = {
+# A single log entry. Built for every message that is recorded or printed, so it is kept cheap:
+#  a slotted plain class rather than a model, the message is only formatted (with str.format) from its
+#  arguments when it is first read, and entries are timestamped with the simulation tick plus a
+#  per-simulation sequence number rather than the wall clock (see SimulationContext.next_log_sequence).
+# Only immutable arguments are kept for later: a message with any other argument (a dict, a component)
+#  is formatted straight away, so that it shows the argument as it was when the message was logged.
+#  Formatting never modifies the template or arguments, so a message may be read from any thread.
+_IMMUTABLE_ARG_TYPES = (str, int, float, complex, bytes, type(None), Enum, _ValueType)
+
+def _is_immutable(arg) -> bool:
+    if isinstance(arg, tuple):
+        return all(_is_immutable(item) for item in arg)
+    return isinstance(arg, _IMMUTABLE_ARG_TYPES)
+
+class LogMessage:
+    __slots__ = ('_template', '_args', '_message', 'level', 'tick', 'sequence')
+
+    sort_key: ClassVar[Callable[['LogMessage'], int]] = operator.attrgetter('sequence')  # Orders messages in the order they were logged
+    colors: ClassVar[Dict[int, str]] = {
         0: GlobalConfig.INFO_COLOR,
         1: GlobalConfig.WARN_COLOR,
         2: GlobalConfig.ERR_COLOR
     }
-    message: str
-    level: int            # 0 = info, 1 = warning, 2 = error
-    timestamp: datetime   # Internally used for sorting logs within a single tick
+
+    def __init__(self, message: str, level: int = 0, args: tuple = (), tick: int = 0, sequence: Optional[int] = None):
+        self._template = message
+        self._args = args
+        self._message: Optional[str] = None if args else message  # Formatted message, once it has been read
+        self.level = level  # 0 = info, 1 = warning, 2 = error
+        self.tick = tick  # Simulation tick on which the message was logged
+        self.sequence = current_context().next_log_sequence() if sequence is None else sequence  # Orders messages logged on the same tick
+        if args and not _is_immutable(args):
+            self._message = message.format(*args)
+
+    @property
+    def message(self) -> str:
+        message = self._message
+        if message is None:
+            message = self._message = self._template.format(*self._args)
+        return message
+
+    @property
+    def timestamp(self) -> Tuple[int, int]:
+        # Internally used for sorting logs
+        return (self.tick, self.sequence)
+
+    @property
+    def plain_text(self) -> str:
+        level_str = ["INFO", "WARN", "ERROR"][self.level]
+        return f"[tick {self.tick}] [{level_str}] {self.message}"
 
     def __str__(self):
         level_str = ["INFO", "WARN", "ERROR"][self.level]
-        return f"[{self.timestamp}] [{self.colors[self.level]}{level_str}{GlobalConfig.colors.RESET}] {self.message}"
+        return f"[tick {self.tick}] [{self.colors[self.level]}{level_str}{GlobalConfig.colors.RESET}] {self.message}"
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        if not self.timestamp:
-            self.timestamp = datetime.now()
+    def __repr__(self):
+        return f"LogMessage(level={self.level}, tick={self.tick}, message={self.message!r})"
+
+    def __getstate__(self):
+        return (self.message, self.level, self.tick, self.sequence)
+
+    def __setstate__(self, state):
+        self._message, self.level, self.tick, self.sequence = state
+        self._template = self._message
+        self._args = ()
 
     def to_json(self):
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "tick": self.tick,
             "message": self.message,
             "level": self.level,
         }
 
 class GameObject(BaseModel):
     id: Optional[str] = None
-    _log_history: List[LogMessage] = []  # List of LogMessage objects
+    _log_history: LogRingBuffer = PrivateAttr(default_factory=LogRingBuffer)  # Most recent LogMessages (bounded by GlobalConfig.max_log_entries)
 
-    _type_counter: ClassVar[Dict[Type, int]] = {}
     @classmethod
     def generate_id(cls, obj_type: Type) -> str:
         # Generate a unique ID based on the type of the object
         #  Ex: "Motivator_1", "Motivator_2", "PowerPack_1", etc.
-        cls._type_counter.setdefault(obj_type, 0)
-        cls._type_counter[obj_type] += 1
-        return f"{obj_type.__name__}_{cls._type_counter[obj_type]}"
+        # IDs are numbered per simulation (see SimulationContext.py).
+        return current_context().generate_id(obj_type)
 
     def __init__(self, **data):
         super().__init__(**data)
         if not self.id:
             self.id = self.generate_id(self.__class__)
+        self.update_log_spill_path()
 
-    def log(self, message: str, level:int = 0):
-        """Log a message with a specific level (0 = info, 1 = warning, 2 = error)"""
-        timestamp = datetime.now()
-        log_message = LogMessage(message=message, level=level, timestamp=timestamp)
-        self._log_history.append(log_message)
-        if level >= GlobalConfig.log_print_level:
-            print(log_message)
+    def log(self, message: str, level: int = 0, *args):
+        """Log a message with a specific level (0 = info, 1 = warning, 2 = error).
+        Any args are formatted into the message with str.format, but only if the message is ever read,
+        so pass them separately on hot paths: self.info("Moving to {}", location)"""
+        record = level >= GlobalConfig.log_record_level
+        show = level >= GlobalConfig.log_print_level
+        if not (record or show):
+            return
+        context = current_context()
+        simulation = context.simulation
+        log_message = LogMessage(message, level, args, simulation.tick_count if simulation is not None else 0, context.next_log_sequence())
+        if record:
+            self._log_history.append(log_message)
+        if show:
+            # Formatted here rather than on the sink's thread
+            log_message.message
+            log_sink().emit(log_message)
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Log an informational message"""
-        self.log(message, level=0)
+        self.log(message, 0, *args)
 
-    def warn(self, message: str):
+    def warn(self, message: str, *args):
         """Log a warning message"""
-        self.log(message, level=1)
+        self.log(message, 1, *args)
 
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log an error message"""
-        self.log(message, level=2)
+        self.log(message, 2, *args)
 
-    def get_logs(self) -> List[LogMessage]:
-        """Return the log history for this object."""
-        return self._log_history
+    def get_logs(self, limit: Optional[int] = None, since: Optional[int] = None) -> List[LogMessage]:
+        """Return the (most recent) log history for this object, oldest first.
+
+        Args:
+            limit (int): Only return the most recent `limit` messages.
+            since (int): Only return messages logged after the one with this sequence number (e.g. the last one already seen).
+        """
+        if limit is None and since is None:
+            return self._log_history.to_list()
+        return merge_recent([self._log_history], LogMessage.sort_key, limit, since)
 
     def to_json(self, short: bool = False):
         return {
@@ -125,11 +260,20 @@ class GameObject(BaseModel):
             # "logs": [log.to_json() for log in self.get_logs()]
         }
     
+    def flush_logs(self):
+        """Write any evicted log entries that are still waiting to the spill file (see GlobalConfig.log_spill_dir)."""
+        self._log_history.flush()
+
+    def update_log_spill_path(self, context: Optional[SimulationContext] = None):
+        """Point the spill file at <log_spill_dir>/<run ID>/<object ID>.jsonl, for the run that numbered this object's ID
+        (the current one by default). Call again whenever the ID or run changes."""
+        if GlobalConfig.log_spill_dir:
+            run_id = (context or current_context()).run_id
+            self._log_history.spill_to(os.path.join(GlobalConfig.log_spill_dir, run_id, f"{self.id}.jsonl"))
+
     def last_message(self) -> Optional[LogMessage]:
         """Return the last log message, or None if there are no logs."""
-        if self._log_history and len(self._log_history) > 0:
-            return self._log_history[-1]
-        return None
+        return self._log_history.last()
 
 class Entity(GameObject):
     location: Location = Location(x=0, y=0)  # Default location
@@ -139,14 +283,31 @@ class Entity(GameObject):
     world: Optional['World'] = None  # Reference to the world this entity belongs to
     model: str = "Generic Entity"  # Default model name
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Keep the world's occupancy index up to date (Locations are immutable, so moving always goes through here)
+        if (name == 'location' or name == 'size') and self.world is not None:
+            self.world.update_entity_footprint(self)
+
     # Manhattan distance to another entity
     def distance_to(self, other: 'Entity') -> float:
         return abs(self.location.x - other.location.x) + abs(self.location.y - other.location.y)
 
+    @property
+    def simulation(self) -> Optional['Simulation']:
+        # The simulation this entity belongs to (through its world), or the current one if it is not in a world yet.
+        if self.world is not None:
+            return self.world.simulation
+        return current_context().simulation
+
     def tick(self):
         # This method is called every tick in the simulation.
         # Entities can override this method to implement their own behavior.
-        self.info(f"Entity {self.id} at {self.location} ticked.")
+        self.info("Entity {} at {} ticked.", self.id, self.location)
+
+    def is_thinking(self) -> bool:
+        # Whether this entity is currently waiting on an outstanding LLM response.
+        return False
 
     def to_json(self, short: bool = False):
         val = {
@@ -174,6 +335,16 @@ class Entity(GameObject):
             height=self.size[1]
         )
     
+    @property
+    def footprint(self) -> Tuple[int, int, int, int]:
+        # (x, y, width, height), as indexed by the world's OccupancyIndex
+        return (self.location.x, self.location.y, self.size[0], self.size[1])
+
+    @property
+    def is_mobile(self) -> bool:
+        """Whether the entity moves around by itself (e.g. a droid). Entities that do not are part of the static layout of the world."""
+        return False
+
     def occupied_tiles(self, at_location: Location | None = None):
         loc = at_location or self.location
         for oy in range(self.size[1]):
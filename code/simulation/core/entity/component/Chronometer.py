@@ -1,5 +1,4 @@
 from simulation.core.entity.component.Component import Component
-from simulation.core.Simulation import Simulation
 from simulation.llm.ToolCall import ToolCallResult, ToolCallState, tool
 
 
@@ -20,12 +19,13 @@ class Chronometer(Component):
         if ticks <= 0:
             raise ValueError("Ticks must be a positive integer.")
         self.info(f"Sleeping for {ticks} ticks.")
-        self.wake_time = Simulation.get_instance().tick_count + ticks
+        self.wake_time = self.chassis.simulation.tick_count + ticks
         self.info(f"Will wake up at tick {self.wake_time}.")
 
         return ToolCallResult(
             state=ToolCallState.IN_PROCESS,
-            callback=self.sleep_isdone
+            callback=self.sleep_isdone,
+            retry_after=ticks
         )
 
     def sleep_isdone(self) -> ToolCallResult:
@@ -34,6 +34,6 @@ class Chronometer(Component):
         Returns:
             ToolCallResult: The result of the tool call.
         """
-        if Simulation.get_instance().tick_count >= self.wake_time:
+        if self.chassis.simulation.tick_count >= self.wake_time:
             return ToolCallResult(state=ToolCallState.SUCCESS, message=f"Woke up from sleep at {self.wake_time} ticks.")
         return ToolCallResult(state=ToolCallState.IN_PROCESS)
@@ -2,6 +2,7 @@ import inspect
 import logging
 from typing import TYPE_CHECKING, TypeVar, overload, ClassVar, Dict, Optional, List, Type, Any, Union
 from simulation.core.entity.Entity import Entity, Location, GameObject, LogMessage
+from simulation.core.TimerQueue import Suspension
 from simulation.llm.ToolCall import ToolCall, _IS_TOOL_FUNCTION
 
 if TYPE_CHECKING:
@@ -23,6 +24,19 @@ if TYPE_CHECKING:
 #  that can be called as tools, such as moving to a location, charging
 #  equipment, or recharging itself. These functions are defined in the
 #  `provides` method of the Component class and its subclasses.
+# Components that have nothing to do can go dormant (see go_dormant), and are
+#  then skipped by Chassis.tick until something wakes them: a tool call, being
+#  installed, or a change to the state of any component in the same chassis.
+# Components that are waiting for a known number of ticks (cooldowns, sleeps)
+#  can instead suspend themselves (see suspend), and are skipped until the
+#  world's timer resumes them.
+# Components whose behaviour over many ticks has a closed form (e.g. a generator
+#  that recharges every N ticks) can implement fast_forward, so that a world with
+#  nothing else going on can skip over long idle stretches (see World.fast_forward).
+# Components that do not override tick() are passive, and are never ticked at
+#  all (see Chassis.tick_list).
+
+_tool_names_by_class: Dict[type, List[str]] = {}
 
 class Component(GameObject):
     name: Optional[str] = None
@@ -31,16 +45,119 @@ class Component(GameObject):
     chassis: Optional['Chassis'] = None
     storage_parent: Optional[Union['ComponentSlot', 'Component']] = None
 
+    moves_chassis: ClassVar[bool] = False  # Whether this component moves its chassis around the world (see Chassis.is_mobile)
+
+    _dormant: bool = False  # Whether this component is skipped by Chassis.tick until woken
+    _suspended_until: Optional[int] = None  # World tick at which a suspended component resumes
+
+    def __setattr__(self, name, value):
+        # Any change to a component's state may give it, or the rest of its chassis, something to do.
+        #  An identity check is enough here: a spurious wake only costs a tick.
+        if name in self.__class__.model_fields and self.__dict__.get(name) is not value:
+            super().__setattr__(name, value)
+            self.wake()
+        else:
+            super().__setattr__(name, value)
+
     def tick(self):
+        # Nothing to do every tick, so sleep until something changes.
+        self.go_dormant()
+
+    @property
+    def is_dormant(self) -> bool:
+        # Passive components are never ticked (see Chassis.tick_list), so they never have anything to do
+        return self._dormant or self.is_passive()
+
+    def go_dormant(self):
+        """Stop ticking until woken. Call this from tick() when there is nothing to do until something changes."""
+        if not self._dormant:
+            self._dormant = True
+            if self.chassis is not None:
+                self.chassis._dormant_count += 1
+
+    def wake(self):
+        """Resume ticking. Wakes the whole chassis, since a change here may give the other components work to do."""
+        if self.chassis is not None:
+            self.chassis.wake()
+        else:
+            self._dormant = False
+
+    @property
+    def is_suspended(self) -> bool:
+        return self._suspended_until is not None
+
+    @property
+    def suspended_ticks(self) -> int:
+        """Number of ticks that a suspended component will still skip. 0 if not suspended."""
+        if self._suspended_until is None:
+            return 0
+        return max(0, self._suspended_until - self.chassis.world.current_tick - 1)
+
+    def suspend(self, ticks: int) -> bool:
+        """Skip the next `ticks` ticks at no cost, then resume (and call on_resume).
+        Unlike a dormant component, a suspended one is not woken by changes to its chassis, only by its timer or resume().
+        Returns False, without suspending, if we are not in a world -- callers should then keep counting down themselves."""
+        world = self.chassis.world if self.chassis is not None else None
+        if world is None or ticks <= 0:
+            return False
+        self._suspend_until(world.current_tick + ticks + 1)
+        return True
+
+    def _suspend_until(self, tick: int):
+        # Resume at the start of the given world tick
+        self._suspended_until = tick
+        self.chassis.world.schedule(tick, Suspension(self, tick), owner=self.chassis.id)
+
+    def resume(self):
+        """End a suspension (early, or on time from the world's timer)."""
+        if self._suspended_until is None:
+            return
+        self._suspended_until = None
+        self.wake()
+
+    def on_resume(self):
+        """Called when a suspension has run its full course. Override to catch up on state that was not counted down while suspended."""
         pass
 
+    def _suspension_expired(self, tick: int):
+        # Timers cannot be cancelled, so ignore any that belong to an earlier suspension
+        if self._suspended_until == tick:
+            self.resume()
+            self.on_resume()
+
+    def fast_forward(self, ticks: int):
+        """Advance this component's state by `ticks` ticks at once, in closed form, leaving it exactly as ticking it would have.
+        Called (with the world still at the tick before the jump) by World.fast_forward while nothing else is going on in
+        the world; see Chassis.can_fast_forward for when that is. Components that support it override this."""
+        raise NotImplementedError(f"{self.__class__.__name__} cannot be fast-forwarded.")
+
+    @classmethod
+    def supports_fast_forward(cls) -> bool:
+        return cls.fast_forward is not Component.fast_forward
+
+    @classmethod
+    def is_passive(cls) -> bool:
+        """Whether this kind of component does nothing when ticked (other than going dormant again)."""
+        return cls.tick is Component.tick
+
+    def is_thinking(self) -> bool:
+        # Whether this component is waiting on an outstanding LLM (or other slow external) response.
+        return False
+
+    @classmethod
+    def tool_names(cls) -> List[str]:
+        """Names of all methods (including inherited) marked as tool functions. Found once per class."""
+        names = _tool_names_by_class.get(cls)
+        if names is None:
+            names = _tool_names_by_class[cls] = [
+                name for name, member in inspect.getmembers(cls, predicate=inspect.isfunction)
+                if getattr(member, _IS_TOOL_FUNCTION, False)
+            ]
+        return names
+
     def provides_tools(self) -> Dict[str, ToolCall]:
-        # Find all methods (including inherited) marked as tool functions
-        tool_methods = {}
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if getattr(method, _IS_TOOL_FUNCTION, False):
-                tool_methods[name] = ToolCall(method)
-        return tool_methods
+        # Binding a tool to this component is cheap: its docstring and schema are parsed once (see ToolCall.tool_spec)
+        return {name: ToolCall(getattr(self, name)) for name in self.tool_names()}
 
     def to_json(self, short: bool = False):
         excludes_list = {'chassis',
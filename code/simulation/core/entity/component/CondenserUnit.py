@@ -17,21 +17,25 @@ class CondenserUnit(Component):
         if not tank:
             self.error("No water tank found in the chassis. CondenserUnit cannot function without a water tank.")
             # TODO: Post an error message that the AI can see
+            self.go_dormant()  # Woken when a component is installed
             return
 
         power = self.chassis.get_component(PowerPack)
         if not power:
             self.error("No power pack found in the chassis. CondenserUnit cannot function without a power pack.")
             # TODO: Post an error message that the AI can see
+            self.go_dormant()  # Woken when a component is installed
             return
 
         if tank.fill >= tank.capacity:
             #self.warn("Water tank is full. CondenserUnit cannot condense more water.")
             # TODO: Post an error message to world and/or chassis system?
+            self.go_dormant()  # Woken when the tank is drained
             return
         if power.charge <= 0:
             #self.warn("Power pack is empty. CondenserUnit cannot condense water.")
             # TODO: Post an error message to world and/or chassis system?
+            self.go_dormant()  # Woken when the power pack is recharged
             return
             
         # Condense water
@@ -40,5 +44,19 @@ class CondenserUnit(Component):
         power.charge -= 1
         tank.fill += self.water_per_charge
 
+    def fast_forward(self, ticks: int):
+        # One unit of charge per tick, until the tank is full or the power pack is empty
+        tank = self.chassis.get_component(WaterTank)
+        power = self.chassis.get_component(PowerPack)
+        steps = 0
+        if tank and power and tank.fill < tank.capacity and power.charge > 0:
+            tank_steps = -(-(tank.capacity - tank.fill) // self.water_per_charge) if self.water_per_charge > 0 else ticks
+            steps = min(ticks, power.charge, tank_steps)
+            power.charge -= steps
+            tank.fill += steps * self.water_per_charge
+        if steps < ticks:
+            # Ran out of something along the way, so would have gone dormant
+            self.go_dormant()
+
 class AdvancedCondenserUnit(CondenserUnit):
     water_per_charge: int = 2 # More efficient condenser, condenses more water per unit of charge
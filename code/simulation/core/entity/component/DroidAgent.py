@@ -14,7 +14,6 @@ from simulation.GlobalConfig import GlobalConfig
 from simulation.llm.QueuedWebRequest import QueuedHttpRequest
 from simulation.llm.ToolCall import ToolCall, ToolCallResult, ToolCallState, tool
 from simulation.core.World import World
-from simulation.core.Simulation import Simulation
 
 class ContextMessage(BaseModel):
     role:str = "user"
@@ -167,9 +166,9 @@ class DroidAgent(Component):
 
         # Save the web request to a file so that we can see what was sent
         if GlobalConfig.llm_dump_http_requests:
-            os.makedirs("logs", exist_ok=True)
-            filename = f"queued_http_request_{self.chassis.id}_{Simulation.get_instance().tick_count}_out.json"
-            with open(f"logs/{filename}", "w") as f:
+            os.makedirs(GlobalConfig.simulation_dump_dir, exist_ok=True)
+            filename = f"queued_http_request_{self.chassis.id}_{self.chassis.simulation.tick_count}_out.json"
+            with open(os.path.join(GlobalConfig.simulation_dump_dir, filename), "w") as f:
                 json.dump(queued_http_request.data, f, indent=2)
 
         queued_http_request.begin_send() #timeout=GlobalConfig.llm_timeout_seconds)
@@ -177,10 +176,14 @@ class DroidAgent(Component):
         self.queued_http_request = queued_http_request
 
 
+    def is_thinking(self) -> bool:
+        return self.queued_http_request is not None and self.queued_http_request.in_progress
+
     def tick(self):
         # A re-entrant ReAct agent "loop" that steps forward every tick
         if not self.is_active:
-            # If the agent is not active, do nothing
+            # If the agent is not active, sleep until it is activated
+            self.go_dormant()
             return
 
         world:World = self.chassis.world
@@ -190,18 +193,18 @@ class DroidAgent(Component):
                 # TODO: What's the best way to let the simulation know that the agent is thinking?
                 # HACK: For now, set a flag on the world manually
                 world.entity_thinking_count += 1
-                self.info(f'Agent is thinking... (World thinking count: {world.entity_thinking_count})')
+                self.info('Agent is thinking... (World thinking count: {})', world.entity_thinking_count)
             else:
                 # If the queued web request is done, we can process the response
                 resp = self.queued_http_request.response
-                self.info(f'Agent received response from web request: {resp}')
+                self.info('Agent received response from web request: {}', resp)
                 self.queued_http_request = None
 
                 # Save the response to a file so that we can see what was received
                 if GlobalConfig.llm_dump_http_requests:
-                    os.makedirs("logs", exist_ok=True)
-                    filename = f"queued_http_request_{self.chassis.id}_{Simulation.get_instance().tick_count}_in.json"
-                    with open(f"logs/{filename}", "w") as f:
+                    os.makedirs(GlobalConfig.simulation_dump_dir, exist_ok=True)
+                    filename = f"queued_http_request_{self.chassis.id}_{self.chassis.simulation.tick_count}_in.json"
+                    with open(os.path.join(GlobalConfig.simulation_dump_dir, filename), "w") as f:
                         json.dump(resp, f, indent=2)
 
                 # Gracefully handle error responses that lack 'choices'
@@ -228,7 +231,7 @@ class DroidAgent(Component):
                     content = choice["message"]["content"]
 
                     if content:
-                        self.info(f'Received response: {content}')
+                        self.info('Received response: {}', content)
                         self.context.append_message(ContextMessage(role="assistant", content=content))
 
                 if "finish_reason" in choice:
@@ -245,7 +248,7 @@ class DroidAgent(Component):
 
                             params = tool_call["function"]["arguments"]
                             params = json.loads(params) if isinstance(params, str) else params  # Ensure params is a dict
-                            self.info(f'Executing tool call: {tool_name} with params: {params}')
+                            self.info('Executing tool call: {} with params: {}', tool_name, params)
 
                             tools = self.chassis.get_available_tools()
 
@@ -262,6 +265,7 @@ class DroidAgent(Component):
                                         self.pending_tool_completion_callback = tool_call_result.callback
                                         self.pending_tool_call_id = tool_call_id  # Save the ID of the pending tool call so that its results can be added later
                                         self.info(f'Tool call {tool_name} is in process, saving callback for later execution.')
+                                        self._wait_for_tool_result(tool_call_result)
                                     elif tool_call_result.state == ToolCallState.SUCCESS:
                                         # Immediate success: use the local tool reference (pending_tool_call not set)
                                         tool_message = f"{tool.function_ptr.__name__} executed successfully:"
@@ -327,7 +331,8 @@ class DroidAgent(Component):
                 tool_call_result:ToolCallResult = self.pending_tool_completion_callback()
                 if tool_call_result.state == ToolCallState.IN_PROCESS:
                     # If the tool call is still in progress, do nothing for this tick
-                    self.info(f'Tool call `{self.pending_tool_call.function_ptr.__name__}` is still in progress...')
+                    self.info('Tool call `{}` is still in progress...', self.pending_tool_call.function_ptr.__name__)
+                    self._wait_for_tool_result(tool_call_result)
                 elif tool_call_result.state == ToolCallState.SUCCESS:
                     # If the tool call has completed, we can append the result to the agent context
                     tool_message = f"{self.pending_tool_call.function_ptr.__name__} executed successfully:"
@@ -384,6 +389,12 @@ class DroidAgent(Component):
                 queued_web_request.begin_send() #timeout=GlobalConfig.llm_timeout_seconds)
                 self.queued_http_request = queued_web_request
 
+    def _wait_for_tool_result(self, tool_call_result: ToolCallResult):
+        # If the tool tells us how long it will take (e.g. Chronometer.sleep), sleep until then instead of polling every tick.
+        #  We poll on the tick that the result is due, so skip one tick fewer than that.
+        if tool_call_result.retry_after:
+            self.suspend(tool_call_result.retry_after - 1)
+
     def _attempt_parse_and_execute_goal(self) -> bool:
         """Heuristic fallback: parse very simple movement goals without LLM guidance.
         Returns True if an action was scheduled, False otherwise."""
@@ -406,6 +417,7 @@ class DroidAgent(Component):
                 # Generate a synthetic tool call id for message threading
                 self.pending_tool_call_id = f"heuristic_move_{x}_{y}"
                 self.info(f"Heuristic scheduled movement to ({x}, {y}).")
+                self._wait_for_tool_result(result)
                 return True
             elif result.state == ToolCallState.SUCCESS:
                 self.context.append_message(ContextMessage(role="tool", content=f"Heuristic move succeeded to ({x}, {y}).", tool_call_id=f"heuristic_move_{x}_{y}", tool_name=tool_call.function_ptr.__name__))
@@ -46,15 +46,13 @@ class Gripper(Component):
                 message="Gripper is not installed in a chassis or chassis is not in a world."
             )
         
-        entities = self.chassis.world.get_entities(target_entity)
+        entities = self.chassis.world.nearest(target_entity, self.chassis.location)
         if not entities:
             return ToolCallResult(
                 state=ToolCallState.FAILURE,
                 message=f"No entities found with identifier '{target_entity}'."
             )
         
-        # Sort by distance and check adjacency
-        entities.sort(key=lambda e: self.chassis.location.distance_to(e.location))
         entity = entities[0]
         
         distance = self.chassis.location.distance_to(entity.location)
@@ -85,10 +83,8 @@ class Gripper(Component):
                                 break
                     if match:
                         found_component = comp
-                        # Remove from slot
+                        # Remove from slot (which also detaches it from the chassis)
                         slot.component = None
-                        found_component.chassis = None
-                        found_component.storage_parent = None
                         break
         
         # If not found in slots, search in Storage components
@@ -156,15 +152,13 @@ class Gripper(Component):
                 message="Gripper is not installed in a chassis or chassis is not in a world."
             )
         
-        entities = self.chassis.world.get_entities(target_entity)
+        entities = self.chassis.world.nearest(target_entity, self.chassis.location)
         if not entities or len(entities) == 0:
             return ToolCallResult(
                 state=ToolCallState.FAILURE,
                 message=f"No entities found with identifier '{target_entity}'."
             )
         
-        # Sort by distance and check adjacency
-        entities.sort(key=lambda e: self.chassis.location.distance_to(e.location))
         entity = entities[0]
 
         # Check to see if it is a Chassis object
@@ -238,15 +232,13 @@ class Gripper(Component):
         target_entity_obj = self.chassis  # Default to our own entity
         
         if target_entity:
-            entities = self.chassis.world.get_entities(target_entity)
+            entities = self.chassis.world.nearest(target_entity, self.chassis.location)
             if not entities:
                 return ToolCallResult(
                     state=ToolCallState.FAILURE,
                     message=f"No entities found with identifier '{target_entity}'."
                 )
             
-            # Sort by distance and check adjacency
-            entities.sort(key=lambda e: self.chassis.location.distance_to(e.location))
             target_entity_obj = entities[0]
             
             distance = self.chassis.location.distance_to(target_entity_obj.location)
@@ -1,11 +1,13 @@
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, ClassVar, List, Optional
 
+from pydantic import field_serializer
 from simulation.core.entity.Chassis import Chassis
 from simulation.core.entity.component.Component import Component
 from simulation.core.entity.component.PowerPack import PowerPack
 from simulation.core.entity.ComponentSlot import ComponentSlot
 from simulation.core.entity.Entity import Location
 from simulation.core.World import World
+from simulation.GlobalConfig import GlobalConfig
 from simulation.llm.ToolCall import ToolCallResult, ToolCallState, tool
 
 # --- Droid Components ---
@@ -15,6 +17,8 @@ class Motivator(Component):
     # They can be simple (like a basic movement system) or complex (like an A* pathfinding system).
     # Motivators can be installed in Chassis to provide movement capabilities.
 
+    moves_chassis: ClassVar[bool] = True
+
     destination: Optional[Location] = None  # The destination the chassis is moving towards
     destination_identifier: Optional[str] = None  # The identifier of the destination entity
 
@@ -23,9 +27,12 @@ class Motivator(Component):
     cooldown_delay: int = 1  # Delay in ticks between movements
     power_cost_per_step: int = 1  # Power cost for each movement step
     last_block_reason: Optional[str] = None
+    cooperative: bool = True  # Whether to take turns with other entities (see step); otherwise only the tilemap is taken into account
 
     deterministic_paths: bool = True  # for test stability
 
+    _stalls: int = 0  # Number of times in a row that other entities have kept us from making progress
+
     # Can move to an entity by its type or by its ID
     #  If a type is provided, it will find the nearest entity of that type.
     #  If more than one entity matches and is equidistant, it will choose the first one found.
@@ -41,13 +48,10 @@ class Motivator(Component):
         world: World = self.chassis.world
 
         # Find the entity by ID and set the destination to its location
-        entities = world.get_entities(identifier)
+        entities = world.nearest(identifier, self.chassis.location)
 
         if len(entities) == 0:
             raise ValueError(f"No entities found with identifier `{identifier}`.")
-        
-        # Sort entities by distance to the chassis
-        entities.sort(key=lambda e: self.chassis.location.distance_to(e.location))
 
         entity = entities[0]  # Get the closest entity
 
@@ -132,14 +136,27 @@ class Motivator(Component):
             path.append(curr)
         return path
 
+    # While suspended for a cooldown, cooldown_remaining keeps the value it had when the cooldown started.
+    #  current_cooldown is always up to date, and is what gets serialized (state dumps, journal, LLM state).
     @property
     def current_cooldown(self) -> int:
+        if self.is_suspended:
+            return self.suspended_ticks
         return self.cooldown_remaining
 
+    @field_serializer('cooldown_remaining')
+    def _serialize_cooldown_remaining(self, value: int) -> int:
+        return self.current_cooldown
+
     @current_cooldown.setter
     def current_cooldown(self, v: int):
+        self.resume()
         self.cooldown_remaining = max(0, v)
 
+    def on_resume(self):
+        # The suspension covered the whole cooldown
+        self.cooldown_remaining = 0
+
     def tick(self):
         # TODO: If we are moving towards a specific entity, we can check to see if it has moved and update our path accordingly.
 
@@ -149,12 +166,16 @@ class Motivator(Component):
             self.destination_identifier = None
             self.path_to_destination = None
             self.cooldown_remaining = 0
+            self._stop()
+            # Nothing to do until we are given a new destination
+            self.go_dormant()
             return
         
         if self.cooldown_remaining > 0:
-            # We are currently cooling down, so do nothing for this tick
+            # We are currently cooling down, so do nothing for this tick, and sleep through the rest of the cooldown
             self.cooldown_remaining -= 1
             self.last_block_reason = 'cooldown'
+            self.suspend(self.cooldown_remaining)
             return
 
         power: PowerPack = self.chassis.get_component(PowerPack)  # type: ignore
@@ -165,6 +186,9 @@ class Motivator(Component):
         if power.charge < self.power_cost_per_step:
             self.last_block_reason = "no_power"
             self.warn("Insufficient power to issue movement intent.")
+            self._stop()
+            # Woken again when our power pack's charge changes
+            self.go_dormant()
             return
 
         if not self.path_to_destination:
@@ -177,30 +201,156 @@ class Motivator(Component):
             self.destination_identifier = None
             return
 
+        self.step(power)
+
+    def step(self, power: PowerPack):
+        """Take the next step along path_to_destination. Called by tick() once any cooldown is over, with a path to follow and the power for a step."""
         # Peek at the next location in the path
         next_location = self.path_to_destination[0]
 
         # Ensure that the location is available
         if not self.chassis.world.tilemap.is_passable(next_location.x, next_location.y):
             self.last_block_reason = "blocked_tile"
-            self.warn(f"Next tile at {next_location} is not passable.")
+            self.warn("Next tile at {} is not passable.", next_location)
             self.path_to_destination.clear()
             return
-        
-        # Move to the next location
-        self.chassis.location = next_location
+
+        world: World = self.chassis.world
+        if self.cooperative and not self._claim(world, next_location):
+            self._step_aside(world, power)
+            return
+
+        self._stalls = 0
         self.path_to_destination.pop(0)  # Remove the first location from the path
+        self.move_chassis(next_location, power)
+
+    def move_chassis(self, location: Location, power: PowerPack):
+        # Move to the next location
+        self.chassis.location = location
 
         # Consume power for the movement
         power.charge = max(0, power.charge - self.power_cost_per_step)
         self.cooldown_remaining = self.cooldown_delay
         self.last_block_reason = None
+        # The cooldown starts next tick, which reports it as the block reason, then sleeps through the rest of it
+
+    # --- Taking turns ---
+    # Droids keep out of each other's way through the world's reservation table (see pathfinding/ReservationTable.py):
+    #  every step first reserves the tile that it moves to, for as long as the step takes, so that other droids
+    #  (including those that plan ahead, see AStarMotivator) do not step there too. If another entity is in the
+    #  way, we take the first step of a short cooperative plan around it if there is one, or wait our turn, and
+    #  give up after GlobalConfig.cooperative_max_stalls tries in a row.
+
+    def _claim(self, world: World, location: Location) -> bool:
+        # Reserve the location for our next step, if no other entity is there or has reserved it
+        planner = world.cooperative_pathfinder
+        period = self.cooldown_delay + 1
+        width, height = self.chassis.size
+        if not world.is_footprint_free(location.x, location.y, width, height, ignore=self.chassis) or \
+                not planner.can_enter(self.chassis, location.x, location.y, world.current_tick, period):
+            return False
+        planner.reserve(self.chassis, [location], period)
+        return True
+
+    def _step_aside(self, world: World, power: PowerPack):
+        self._stalls += 1
+        if self._stalls >= GlobalConfig.cooperative_max_stalls:
+            self._give_up()
+            return
+
+        planner = world.cooperative_pathfinder
+        period = self.cooldown_delay + 1
+        window = GlobalConfig.cooperative_window
+        path = self.path_to_destination
+        location = planner.plan(self.chassis, path[min(window, len(path)) - 1], period, window)[0]
+        if location == self.chassis.location:
+            # Hold on to where we are for a whole window, so that others plan around us rather than wait for us
+            planner.reserve(self.chassis, [location] * window, period)
+            self._wait()
+            return
+
+        planner.reserve(self.chassis, [location], period)
+        self.move_chassis(location, power)
+        # Carry on towards the destination from wherever we stepped to
+        self.path_to_destination = self.find_path(location, self.destination)
+
+    def _wait(self):
+        # Let others go first, and try again after a cooldown
+        self.last_block_reason = "waiting"
+        self.cooldown_remaining = self.cooldown_delay
+        self.suspend(self.cooldown_delay)
+
+    def _give_up(self):
+        self.warn("Gave up on reaching {}: the way is blocked by other entities.", self.destination)
+        self.last_block_reason = "blocked_by_entity"
+        self.destination = None
+        self.destination_identifier = None
+        self.path_to_destination = None
+        self._stop()
+
+    def _stop(self):
+        # Stopped (arrived, gave up, or out of power): give up our reservations, and be an obstacle like any other entity
+        self._stalls = 0
+        if self.chassis is not None and self.chassis.world is not None:
+            self.chassis.world.reservations.release(self.chassis.id)
 
 class AStarMotivator(Motivator):
     name: str = "Advanced Motivator"
+    # Plans around impassable tiles, preferring faster ground, using the world's pathfinders (see World.find_path).
+    # Moves cooperatively: follows that path a few steps at a time, planning around other entities and reserving
+    #  the tiles that it will use in the world's reservation table, so that other cooperative movers go around
+    #  it or wait for it to pass (see pathfinding/CooperativeAStar.py).
+
+    _plan: List[Location] = []  # Steps still to take from the last cooperative plan (the same location again for a wait)
 
     def find_path(self, start: Location, end: Location) -> List[Location]:
-        # A* pathfinding logic
-        # TODO: Use the world's collision map to find a valid path
-        return super().find_path(start, end)
+        world: Optional[World] = self.chassis.world if self.chassis else None
+        if world is None:
+            return super().find_path(start, end)
+        path = world.find_path(start, end, self.chassis.size)
+        if path is None:
+            # Unreachable: an empty path makes tick() give up on the destination straight away
+            self.last_block_reason = "no_path"
+            return []
+        return path
+
+    def _stop(self):
+        self._plan = []
+        super()._stop()
+
+    def step(self, power: PowerPack):
+        world: Optional[World] = self.chassis.world
+        if not self.cooperative or world is None:
+            return super().step(power)
+
+        if not self._plan or not self._can_step_to(world, self._plan[0]):
+            self._plan = self._make_plan(world)
+            if self._stalls >= GlobalConfig.cooperative_max_stalls:
+                self._give_up()
+                return
+
+        next_location = self._plan.pop(0)
+        if next_location == self.chassis.location or not self._can_step_to(world, next_location):
+            self._wait()
+            return
+
+        path = self.path_to_destination
+        if next_location in path:
+            del path[:path.index(next_location) + 1]
+        self.move_chassis(next_location, power)
+
+    def _can_step_to(self, world: World, location: Location) -> bool:
+        return location == self.chassis.location or world.is_passable(self.chassis, location.x, location.y)
+
+    def _make_plan(self, world: World) -> List[Location]:
+        # Plan (and reserve) a window of steps towards a waypoint along our path, then follow the first half of it before planning again
+        window = GlobalConfig.cooperative_window
+        path = self.path_to_destination
+        waypoint = path[min(window, len(path)) - 1]
+        period = self.cooldown_delay + 1
+        planner = world.cooperative_pathfinder
+        steps = planner.plan(self.chassis, waypoint, period, window)
+        planner.reserve(self.chassis, steps, period)
+        self._stalls = self._stalls + 1 if all(step == self.chassis.location for step in steps) else 0
+        return steps[:max(1, window // 2)]
 
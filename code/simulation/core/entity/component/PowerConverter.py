@@ -35,15 +35,13 @@ class PowerConverter(Component):
         world: World = self.chassis.world
 
         # Find the entity by ID and set the destination to its location
-        entities = world.get_entities(identifier)
+        entities = world.nearest(identifier, self.chassis.location)
 
         if len(entities) == 0:
             msg = f"{mode} failed. No entity found with identifier `{identifier}`."
             self.error(msg)
             return ToolCallResult(state=ToolCallState.FAILURE, message=msg)
 
-        # Sort entities by distance to the chassis
-        entities.sort(key=lambda e: self.chassis.location.distance_to(e.location))
         entity = entities[0]  # Get the closest entity
 
         # Check if the entity is adjacent
@@ -61,7 +59,8 @@ class PowerConverter(Component):
 
     def tick(self):
         if not self.transfer_target_id:
-            # Nothing to do, so just return.
+            # Nothing to do until a transfer is started
+            self.go_dormant()
             return
 
         them: Chassis = self.chassis.world.get_entity(self.transfer_target_id)
@@ -110,7 +109,7 @@ class PowerConverter(Component):
 
         if needed_charge > 0 and supply_charge < self.transfer_rate:
             # Warn if the other powerpack is low on charge, but do not fail.
-            self.warn(f"{charge_source.chassis.id} is low on power ({charge_source.charge}/{charge_source.charge_max}).")
+            self.warn("{} is low on power ({}/{}).", charge_source.chassis.id, charge_source.charge, charge_source.charge_max)
 
         charge_amount = min(needed_charge, supply_charge, self.transfer_rate)
 
@@ -1,4 +1,6 @@
 # A PowerGenerator is a component that can automatically recharge adjacent power packs.
+from pydantic import field_serializer
+
 from simulation.core.entity.component.PowerPack import PowerPack
 from simulation.core.entity.component.Component import Component
 
@@ -7,19 +9,34 @@ class PowerGenerator(Component):
     cooldown_delay:     int = 8  # Cooldown delay in ticks
     recharge_amount:    int = 10  # Amount of charge to add per cycle
 
+    # While suspended for a cooldown, cooldown_remaining keeps the value it had when the cooldown started.
+    #  current_cooldown is always up to date, and is what gets serialized (state dumps, journal, LLM state).
     @property
     def current_cooldown(self) -> int:
+        if self.is_suspended:
+            return self.suspended_ticks
         return self.cooldown_remaining
 
+    @field_serializer('cooldown_remaining')
+    def _serialize_cooldown_remaining(self, value: int) -> int:
+        return self.current_cooldown
+
     @current_cooldown.setter
     def current_cooldown(self, v: int):
+        self.resume()
         self.cooldown_remaining = max(0, v)
 
     # TODO: Bring CooldownComponent into its own class, and make use of it here and in Motivator
 
+    def on_resume(self):
+        # The suspension covered the whole cooldown
+        self.cooldown_remaining = 0
+
     def tick(self):
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
+        if self.cooldown_remaining > 0:
+            self.cooldown_remaining -= 1
+            # Sleep through the rest of the cooldown rather than counting it down every tick
+            self.suspend(self.cooldown_remaining)
             return False
 
         # Recharge other power packs in this same entity
@@ -28,5 +45,34 @@ class PowerGenerator(Component):
             power_pack.charge += self.recharge_amount
             power_pack.charge = min(power_pack.charge, power_pack.charge_max)
 
-        self.current_cooldown = self.cooldown_delay
+        self.cooldown_remaining = self.cooldown_delay
+        self.suspend(self.cooldown_delay)
         return
+
+    def fast_forward(self, ticks: int):
+        # Recharges happen every cooldown_delay + 1 ticks, starting from the end of the current cooldown
+        start = self.chassis.world.current_tick
+        end = start + ticks
+        period = self.cooldown_delay + 1
+        if self.is_suspended:
+            first = self._suspended_until
+        else:
+            first = start + 1 + self.cooldown_remaining
+            if self.cooldown_remaining > 0:
+                # What the first tick would have done: count down once, then sleep through the rest
+                self.cooldown_remaining -= 1
+                if self.cooldown_remaining > 0:
+                    self._suspend_until(first)
+        if first > end:
+            return
+
+        recharges = 1 + (end - first) // period
+        last = first + (recharges - 1) * period
+        power_pack: PowerPack = self.chassis.get_component(PowerPack)
+        if power_pack:
+            power_pack.charge = min(power_pack.charge + recharges * self.recharge_amount, power_pack.charge_max)
+
+        self._suspended_until = None
+        self.cooldown_remaining = self.cooldown_delay
+        if self.cooldown_delay > 0:
+            self._suspend_until(last + period)
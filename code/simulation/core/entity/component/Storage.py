@@ -91,9 +91,7 @@ class Storage(Component):
             # Find the slot containing this component and remove it
             for slot_id, slot in component.chassis.slots.items():
                 if slot.component is component:
-                    slot.component = None
-                    component.chassis = None
-                    component.storage_parent = None  # Clear any storage parent reference
+                    slot.component = None  # Also clears the component's chassis and storage parent
                     self.info(f"Removed component {component.id} from slot {slot_id} in chassis {component.chassis.id if component.chassis else 'unknown'}")
                     return True
             
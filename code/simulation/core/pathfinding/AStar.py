@@ -0,0 +1,164 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from simulation.core.entity.Entity import Location
+from simulation.core.tiles.Tilemap import Tilemap
+
+# --- A* Pathfinding ---
+# Finds the cheapest 4-connected path across a Tilemap. Tiles are addressed by flat integer node IDs
+#  (y * width + x) rather than Locations, and the per-tile costs are flattened into a list, so the
+#  search loop does nothing but integer arithmetic and list lookups.
+# The cost of a step is the cost of the tile being entered (see Tilemap.move_cost), so faster ground
+#  is preferred. Entities larger than one tile can only stand where their whole footprint is passable,
+#  and pay the cost of the slowest tile under them.
+# Goals that cannot be reached at all are rejected up front: every tile is labelled with the connected
+#  region that it belongs to, so a query across regions fails without searching.
+
+Size = Tuple[int, int]  # Footprint (width, height) in tiles
+
+class SearchGrid:
+    """Flattened costs and regions of a Tilemap, for one footprint size, as of one tilemap version."""
+    __slots__ = ('width', 'height', 'costs', 'regions', 'min_cost')
+
+    def __init__(self, tilemap: Tilemap, size: Size = (1, 1)):
+        tilemap.ensure_initialized()
+        self.width = tilemap.width
+        self.height = tilemap.height
+        self.costs: List[Optional[float]] = self._footprint_costs(tilemap, size)  # Cost of entering each node; None if blocked
+        self.regions: List[int] = self._label_regions()  # Connected region of each node; -1 if blocked
+        passable = [cost for cost in self.costs if cost is not None]
+        self.min_cost = min(passable) if passable else 1.0  # Cheapest step anywhere, which keeps the heuristic admissible
+
+    def _footprint_costs(self, tilemap: Tilemap, size: Size) -> List[Optional[float]]:
+        width, height = self.width, self.height
+        tile_costs = [tilemap.move_cost(x, y) for y in range(height) for x in range(width)]
+        footprint_width, footprint_height = size
+        if footprint_width == 1 and footprint_height == 1:
+            return tile_costs
+        costs: List[Optional[float]] = [None] * (width * height)
+        for y in range(height - footprint_height + 1):
+            for x in range(width - footprint_width + 1):
+                footprint = [tile_costs[(y + oy) * width + x + ox] for oy in range(footprint_height) for ox in range(footprint_width)]
+                if None not in footprint:
+                    costs[y * width + x] = max(footprint)
+        return costs
+
+    def _label_regions(self) -> List[int]:
+        width, height, costs = self.width, self.height, self.costs
+        regions = [-1] * (width * height)
+        region = 0
+        for seed in range(width * height):
+            if costs[seed] is None or regions[seed] != -1:
+                continue
+            regions[seed] = region
+            stack = [seed]
+            while stack:
+                node = stack.pop()
+                for neighbor in self.neighbors(node):
+                    if costs[neighbor] is not None and regions[neighbor] == -1:
+                        regions[neighbor] = region
+                        stack.append(neighbor)
+            region += 1
+        return regions
+
+    def node(self, x: int, y: int) -> Optional[int]:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+    def location(self, node: int) -> Location:
+        return Location(node % self.width, node // self.width)
+
+    def neighbors(self, node: int) -> List[int]:
+        # In a fixed order (east, west, south, north), so that searches are deterministic
+        width = self.width
+        x = node % width
+        result = []
+        if x + 1 < width:
+            result.append(node + 1)
+        if x > 0:
+            result.append(node - 1)
+        if node + width < width * self.height:
+            result.append(node + width)
+        if node >= width:
+            result.append(node - width)
+        return result
+
+    def is_open(self, node: int) -> bool:
+        return self.costs[node] is not None
+
+class AStar:
+    """A* pathfinder over a Tilemap. Rebuilds its search grids whenever the tilemap's version changes."""
+
+    def __init__(self, tilemap: Tilemap):
+        self.tilemap = tilemap
+        self._grids: Dict[Size, SearchGrid] = {}
+        self._version: Optional[int] = None
+        self.nodes_expanded = 0  # Number of nodes expanded by the last search
+
+    def grid(self, size: Size = (1, 1)) -> SearchGrid:
+        if self._version != self.tilemap.version:
+            self._grids.clear()
+            self._version = self.tilemap.version
+        grid = self._grids.get(size)
+        if grid is None:
+            grid = self._grids[size] = SearchGrid(self.tilemap, size)
+            self._version = self.tilemap.version  # Building the grid may have initialized the map
+        return grid
+
+    def is_reachable(self, start: Location, goal: Location, size: Size = (1, 1)) -> bool:
+        """Whether a path could exist between the two locations (without searching for it)."""
+        grid = self.grid(size)
+        start_node, goal_node = grid.node(start.x, start.y), grid.node(goal.x, goal.y)
+        if start_node is None or goal_node is None or not grid.is_open(goal_node):
+            return False
+        # An entity stuck on a blocked tile may still be able to step off it, so only regions of open tiles are compared
+        return not grid.is_open(start_node) or grid.regions[start_node] == grid.regions[goal_node]
+
+    def find_path(self, start: Location, goal: Location, size: Size = (1, 1)) -> Optional[List[Location]]:
+        """The cheapest path from start to goal, as the list of locations to step to (excluding start, including goal).
+        Empty if start is the goal. None if there is no path."""
+        self.nodes_expanded = 0
+        if start == goal:
+            return []
+        if not self.is_reachable(start, goal, size):
+            return None
+
+        grid = self.grid(size)
+        width, costs = grid.width, grid.costs
+        start_node, goal_node = grid.node(start.x, start.y), grid.node(goal.x, goal.y)
+        goal_x, goal_y = goal.x, goal.y
+        min_cost = grid.min_cost
+
+        best: Dict[int, float] = {start_node: 0.0}
+        came_from: Dict[int, int] = {}
+        h = (abs(start.x - goal_x) + abs(start.y - goal_y)) * min_cost
+        # (f, h, g, node): ties on f are broken towards the goal, then by node ID
+        open_heap: List[Tuple[float, float, float, int]] = [(h, h, 0.0, start_node)]
+        while open_heap:
+            _, _, g, node = heapq.heappop(open_heap)
+            if node == goal_node:
+                return self._reconstruct(grid, came_from, goal_node)
+            if g > best[node]:
+                continue  # Stale entry; this node was already reached more cheaply
+            self.nodes_expanded += 1
+            for neighbor in grid.neighbors(node):
+                cost = costs[neighbor]
+                if cost is None:
+                    continue
+                new_g = g + cost
+                if new_g < best.get(neighbor, float('inf')):
+                    best[neighbor] = new_g
+                    came_from[neighbor] = node
+                    new_h = (abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)) * min_cost
+                    heapq.heappush(open_heap, (new_g + new_h, new_h, new_g, neighbor))
+        return None
+
+    @staticmethod
+    def _reconstruct(grid: SearchGrid, came_from: Dict[int, int], node: int) -> List[Location]:
+        nodes = []
+        while node in came_from:
+            nodes.append(node)
+            node = came_from[node]
+        nodes.reverse()
+        return [grid.location(node) for node in nodes]
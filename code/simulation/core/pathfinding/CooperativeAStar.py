@@ -0,0 +1,123 @@
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from simulation.core.entity.Entity import Entity, Location
+from simulation.core.pathfinding.ReservationTable import ReservationTable
+
+if TYPE_CHECKING:
+    from simulation.core.World import World
+
+# --- Cooperative Pathfinding (windowed, as in WHCA*) ---
+# Entities that move through the world together plan their next few steps in space-time: every step is
+#  a move to a neighbouring tile, or a wait where they are, and takes `period` ticks (the motivator's
+#  cooldown). A step may only be taken if no other entity has reserved the tiles for those ticks (see
+#  ReservationTable), and the entity then reserves its own steps, so that those planning after it go
+#  around it, or wait for it to pass, instead of running into it. Conflicts are settled at planning time.
+# Each plan only looks `window` steps ahead, towards a waypoint further along the entity's spatial path
+#  (which only takes the tilemap into account). If the waypoint cannot be reached within the window, the
+#  plan gets as close to it as it can. Entities that are not moving cooperatively (with no reservations)
+#  are obstacles wherever they stand.
+
+# Actions in a fixed order (east, west, south, north, wait), so that plans are deterministic
+_ACTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (0, 0))
+
+class CooperativeAStar:
+    """Space-time A* over a world's tilemap, entities and reservations."""
+
+    def __init__(self, world: 'World', reservations: ReservationTable):
+        self.world = world
+        self.reservations = reservations
+        self.nodes_expanded = 0  # Number of space-time nodes expanded by the last plan
+
+    def _footprint(self, entity: Entity, x: int, y: int) -> List[Tuple[int, int]]:
+        return [(x + ox, y + oy) for oy in range(entity.size[1]) for ox in range(entity.size[0])]
+
+    def plan(self, entity: Entity, waypoint: Location, period: int, window: int, max_expansions: int = 4000) -> List[Location]:
+        """The entity's next steps (at most `window`), starting on the current tick, as the location that it is at
+        after each one (the same location again for a wait). Ends at the waypoint if it can be reached in time,
+        otherwise as close to it as possible. Does not reserve anything (see reserve)."""
+        world = self.world
+        tilemap = world.tilemap
+        reservations = self.reservations
+        start = entity.location
+        start_tick = world.current_tick
+        entity_id = entity.id
+        period = max(1, period)
+
+        static: Dict[Tuple[int, int], bool] = {}
+        def is_open(x: int, y: int) -> bool:
+            # Passable, and not in the way of an entity that stays put
+            result = static.get((x, y))
+            if result is None:
+                result = static[(x, y)] = all(
+                    tilemap.move_cost(tx, ty) is not None and
+                    all(other.id == entity_id or reservations.holds(other.id) for other in world.entities_at(tx, ty))
+                    for tx, ty in self._footprint(entity, x, y))
+            return result
+
+        def is_free(x: int, y: int, arrival: int) -> bool:
+            return self.can_enter(entity, x, y, arrival, period)
+
+        def distance(x: int, y: int) -> int:
+            return abs(x - waypoint.x) + abs(y - waypoint.y)
+
+        # States are (x, y, steps taken). Ties on f are broken towards the waypoint, then in order of discovery.
+        counter = itertools.count()
+        start_state = (start.x, start.y, 0)
+        came_from: Dict[Tuple[int, int, int], Tuple[int, int, int]] = {}
+        visited = {start_state}
+        best_state, best_key = start_state, (distance(start.x, start.y), 0)
+        heap = [(distance(start.x, start.y), distance(start.x, start.y), next(counter), start_state)]
+        self.nodes_expanded = 0
+        while heap and self.nodes_expanded < max_expansions:
+            _, h, _, state = heapq.heappop(heap)
+            x, y, steps = state
+            if (h, steps) < best_key:
+                best_state, best_key = state, (h, steps)
+            if h == 0 and steps > 0:
+                break
+            if steps >= window:
+                continue
+            self.nodes_expanded += 1
+            arrival = start_tick + steps * period
+            for dx, dy in _ACTIONS:
+                nx, ny = x + dx, y + dy
+                next_state = (nx, ny, steps + 1)
+                if next_state in visited:
+                    continue
+                if (dx or dy) and not is_open(nx, ny):
+                    continue
+                if not is_free(nx, ny, arrival):
+                    continue
+                visited.add(next_state)
+                came_from[next_state] = state
+                next_h = distance(nx, ny)
+                heapq.heappush(heap, (steps + 1 + next_h, next_h, next(counter), next_state))
+
+        steps: List[Location] = []
+        state = best_state
+        while state in came_from:
+            steps.append(Location(state[0], state[1]))
+            state = came_from[state]
+        steps.reverse()
+        return steps or [start]  # Nowhere better to be: wait
+
+    def can_enter(self, entity: Entity, x: int, y: int, arrival: int, period: int) -> bool:
+        """Whether no other entity has reserved the tiles for the entity to stand at (x, y), from the tick it arrives to the tick it leaves again."""
+        reservations, entity_id = self.reservations, entity.id
+        footprint = self._footprint(entity, x, y)
+        return all(reservations.is_free(tx, ty, tick, entity_id) for tick in range(arrival, arrival + period + 1) for tx, ty in footprint)
+
+    def reserve(self, entity: Entity, steps: List[Location], period: int):
+        """Reserve the entity's current tiles for this tick, and the tiles of each planned step for as long as it will be on them."""
+        tick = self.world.current_tick
+        period = max(1, period)
+        cells = [(x, y, tick) for x, y in self._footprint(entity, entity.location.x, entity.location.y)]
+        for index, step in enumerate(steps):
+            arrival = tick + index * period
+            cells += [(x, y, t) for t in range(arrival, arrival + period + 1) for x, y in self._footprint(entity, step.x, step.y)]
+        self.reservations.reserve(entity.id, cells)
+
+    def release(self, entity: Entity):
+        self.reservations.release(entity.id)
@@ -0,0 +1,136 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from simulation.core.entity.Entity import Location
+from simulation.core.tiles.Tilemap import Tilemap
+
+# --- Flow Fields ---
+# Many droids head for the same few places over and over (power stations, vaporators), each planning its
+#  own path there. A flow field is computed once per destination, with a Dijkstra search outwards from it
+#  over the whole Tilemap, and records, for every tile that can reach the destination, the next tile to
+#  step to and the remaining cost. Any number of droids can then follow it, at one lookup per step.
+# Fields are only built for destinations that are asked for often (see FlowFieldCache), and are dropped
+#  whenever the tilemap changes. Like AStar, tiles are flat integer node IDs, and steps cost the tile being
+#  entered, so paths read off a field cost the same as those from AStar.
+
+class FlowField:
+    """Cheapest paths from every tile of a Tilemap to one goal tile."""
+    __slots__ = ('goal', 'width', 'height', 'version', 'costs', 'next_nodes')
+
+    def __init__(self, tilemap: Tilemap, goal: Location):
+        tilemap.ensure_initialized()
+        self.goal = goal
+        self.width, self.height = tilemap.width, tilemap.height
+        self.version = tilemap.version  # Version of the tilemap that the field was computed for
+        self.costs: Dict[int, float] = {}  # Node -> cost of getting from it to the goal
+        self.next_nodes: Dict[int, int] = {}  # Node -> next node on the way to the goal
+        self._build(tilemap)
+
+    def _build(self, tilemap: Tilemap):
+        width, height = self.width, self.height
+        goal = self.goal
+        if not (0 <= goal.x < width and 0 <= goal.y < height) or tilemap.move_cost(goal.x, goal.y) is None:
+            return  # Nothing can reach it
+        tile_costs = [tilemap.move_cost(x, y) for y in range(height) for x in range(width)]
+        goal_node = goal.y * width + goal.x
+        costs, next_nodes = self.costs, self.next_nodes
+        costs[goal_node] = 0.0
+        heap: List[Tuple[float, int]] = [(0.0, goal_node)]
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if cost > costs[node]:
+                continue
+            if node != goal_node and tile_costs[node] is None:
+                continue  # An entity stuck on a blocked tile can step off it, but nothing can pass through it
+            # Stepping from a neighbour to this node costs this node's tile
+            step = tile_costs[node]
+            x = node % width
+            for neighbor in (node + 1 if x + 1 < width else -1, node - 1 if x > 0 else -1,
+                             node + width if node + width < width * height else -1, node - width):
+                if neighbor < 0:
+                    continue
+                new_cost = cost + step
+                if new_cost < costs.get(neighbor, float('inf')):
+                    costs[neighbor] = new_cost
+                    next_nodes[neighbor] = node
+                    heapq.heappush(heap, (new_cost, neighbor))
+
+    def cost_from(self, location: Location) -> Optional[float]:
+        """The cost of getting from the location to the goal, or None if it cannot."""
+        if not (0 <= location.x < self.width and 0 <= location.y < self.height):
+            return None
+        return self.costs.get(location.y * self.width + location.x)
+
+    def next_step(self, location: Location) -> Optional[Location]:
+        """The tile to step to from the location, on the way to the goal. None at the goal, or if it cannot be reached."""
+        if not (0 <= location.x < self.width and 0 <= location.y < self.height):
+            return None
+        node = self.next_nodes.get(location.y * self.width + location.x)
+        if node is None:
+            return None
+        return Location(node % self.width, node // self.width)
+
+    def path_from(self, start: Location) -> Optional[List[Location]]:
+        """The path from start to the goal, as the list of locations to step to (excluding start, including goal).
+        Empty if start is the goal. None if there is no path."""
+        if start == self.goal:
+            return []
+        if self.cost_from(start) is None:
+            return None
+        width, next_nodes = self.width, self.next_nodes
+        node = next_nodes[start.y * width + start.x]
+        path = [Location(node % width, node // width)]
+        while node in next_nodes:
+            node = next_nodes[node]
+            path.append(Location(node % width, node // width))
+        return path
+
+class FlowFieldCache:
+    """Flow fields to the destinations that are asked for most, built once a destination has been asked for
+    `threshold` times, and dropped whenever the tilemap changes. At most `max_fields` are kept; when full, the
+    field that has been used least is dropped."""
+
+    def __init__(self, tilemap: Tilemap, threshold: int = 3, max_fields: int = 16):
+        self.tilemap = tilemap
+        self.threshold = threshold
+        self.max_fields = max_fields
+        self.query_counts: Dict[Location, int] = {}  # Destination -> number of times that it has been asked for
+        self._fields: Dict[Location, FlowField] = {}
+        self._version: Optional[int] = None
+        self.fields_built = 0  # Number of fields built, in total
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, goal: Location) -> bool:
+        self._sync()
+        return goal in self._fields
+
+    def _sync(self):
+        if self._version != self.tilemap.version:
+            self._fields.clear()
+            self._version = self.tilemap.version
+
+    def invalidate(self, goal: Optional[Location] = None):
+        """Drop the field to the given destination (e.g. when something there changes), or every field."""
+        if goal is None:
+            self._fields.clear()
+        else:
+            self._fields.pop(goal, None)
+
+    def get(self, goal: Location) -> Optional[FlowField]:
+        """Count a query for the destination, and return its flow field, building it if it is now asked for often enough.
+        None if the destination is not (yet) popular enough to have a field."""
+        self._sync()
+        if goal not in self.query_counts and len(self.query_counts) >= 64 * self.max_fields:
+            # Forget the counts of one-off destinations, so that they do not pile up
+            self.query_counts = {kept: self.query_counts[kept] for kept in self._fields}
+        count = self.query_counts[goal] = self.query_counts.get(goal, 0) + 1
+        field = self._fields.get(goal)
+        if field is None and count >= self.threshold:
+            if len(self._fields) >= self.max_fields:
+                del self._fields[min(self._fields, key=self.query_counts.__getitem__)]
+            field = self._fields[goal] = FlowField(self.tilemap, goal)
+            self._version = self.tilemap.version  # Building the field may have initialized the map
+            self.fields_built += 1
+        return field
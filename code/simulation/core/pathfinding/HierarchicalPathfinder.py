@@ -0,0 +1,302 @@
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
+
+from simulation.core.entity.Entity import Location
+from simulation.core.tiles.Tilemap import Tilemap
+
+# --- Hierarchical Pathfinding (HPA*) ---
+# For maps that are too large to search tile by tile on every query. The map is split into square
+#  clusters. Wherever two neighbouring clusters share a run of open tiles along their border, that run
+#  gets one or two entrances (a pair of tiles, one on each side). The costs of getting from an entrance
+#  to every other entrance of its cluster are computed the first time that a query passes through it, and
+#  kept until the cluster changes. Together, these give a small abstract graph of entrances.
+# A query links its start and goal to the entrances of their own clusters, searches the abstract graph,
+#  and then refines each abstract step into tiles with a search bounded to a single cluster. The cost of
+#  a query therefore grows with the length of the path rather than with the size of the map. Paths are
+#  near-optimal: they always pass through entrances, and the abstract search is weighted towards the goal.
+# When tiles change, only the clusters that contain them (and their neighbours, whose entrances may have
+#  moved) are rebuilt, using the tilemap's change log (see Tilemap.changes_since).
+# Like AStar, nodes are flat integer tile IDs (y * width + x), and steps cost the tile being entered.
+
+Bounds = Tuple[int, int, int, int]  # (x0, y0, x1, y1): inclusive tile bounds of a cluster
+
+_START = -1  # Abstract nodes standing for the start and goal of a query
+_GOAL = -2
+
+def _neighbors(node: int, width: int, bounds: Bounds) -> List[int]:
+    # In a fixed order (east, west, south, north), as AStar does
+    x0, y0, x1, y1 = bounds
+    x, y = node % width, node // width
+    result = []
+    if x < x1:
+        result.append(node + 1)
+    if x > x0:
+        result.append(node - 1)
+    if y < y1:
+        result.append(node + width)
+    if y > y0:
+        result.append(node - width)
+    return result
+
+def _distances(costs: List[Optional[float]], width: int, source: int, bounds: Bounds) -> Dict[int, float]:
+    """Dijkstra: cost of the cheapest path from source to every node within bounds that it can reach."""
+    best: Dict[int, float] = {source: 0.0}
+    heap: List[Tuple[float, int]] = [(0.0, source)]
+    while heap:
+        g, node = heapq.heappop(heap)
+        if g > best[node]:
+            continue
+        for neighbor in _neighbors(node, width, bounds):
+            cost = costs[neighbor]
+            if cost is not None and g + cost < best.get(neighbor, float('inf')):
+                best[neighbor] = g + cost
+                heapq.heappush(heap, (g + cost, neighbor))
+    return best
+
+def _search(costs: List[Optional[float]], width: int, start: int, goal: int, bounds: Bounds, min_cost: float) -> Optional[List[int]]:
+    """A* from start to goal without leaving bounds. Returns the nodes stepped to (excluding start), or None."""
+    goal_x, goal_y = goal % width, goal // width
+    best: Dict[int, float] = {start: 0.0}
+    came_from: Dict[int, int] = {}
+    h = (abs(start % width - goal_x) + abs(start // width - goal_y)) * min_cost
+    heap: List[Tuple[float, float, float, int]] = [(h, h, 0.0, start)]
+    while heap:
+        _, _, g, node = heapq.heappop(heap)
+        if node == goal:
+            nodes = []
+            while node in came_from:
+                nodes.append(node)
+                node = came_from[node]
+            nodes.reverse()
+            return nodes
+        if g > best[node]:
+            continue
+        for neighbor in _neighbors(node, width, bounds):
+            cost = costs[neighbor]
+            if cost is not None and g + cost < best.get(neighbor, float('inf')):
+                best[neighbor] = g + cost
+                came_from[neighbor] = node
+                new_h = (abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)) * min_cost
+                heapq.heappush(heap, (g + cost + new_h, new_h, g + cost, neighbor))
+    return None
+
+class HierarchicalPathfinder:
+    """HPA* pathfinder over a Tilemap, for single-tile entities. Keeps itself up to date with the tilemap's version."""
+
+    def __init__(self, tilemap: Tilemap, cluster_size: int = 16, heuristic_weight: float = 1.2):
+        self.tilemap = tilemap
+        self.cluster_size = cluster_size
+        self.heuristic_weight = heuristic_weight  # Inflation of the abstract search's heuristic (1 = admissible)
+        self._version: Optional[int] = None
+        self.width = 0
+        self.height = 0
+        self.clusters_x = 0
+        self.clusters_y = 0
+        self.min_cost = 1.0
+        self._costs: List[Optional[float]] = []
+        self._transitions: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}  # (cluster, cluster to its east or south) -> entrance tile pairs
+        self._entrances: Dict[int, Set[int]] = {}  # Cluster -> its entrance tiles
+        self._intra: Dict[int, Dict[int, float]] = {}  # Entrance -> other entrance of its cluster -> cost of getting there (built lazily)
+        self._inter: Dict[int, Dict[int, float]] = {}  # Entrance -> paired entrance in the next cluster -> cost of the step
+        self.nodes_expanded = 0  # Number of abstract nodes expanded by the last query
+        self.clusters_rebuilt = 0  # Number of clusters whose entrances were recomputed, in total
+
+    # --- Abstraction ---
+
+    def cluster_of(self, node: int) -> int:
+        return (node // self.width) // self.cluster_size * self.clusters_x + (node % self.width) // self.cluster_size
+
+    def bounds(self, cluster: int) -> Bounds:
+        x0 = cluster % self.clusters_x * self.cluster_size
+        y0 = cluster // self.clusters_x * self.cluster_size
+        return (x0, y0, min(x0 + self.cluster_size, self.width) - 1, min(y0 + self.cluster_size, self.height) - 1)
+
+    def entrances(self, cluster: int) -> Set[int]:
+        self._sync()
+        return self._entrances.get(cluster, set())
+
+    def _sync(self):
+        tilemap = self.tilemap
+        if self._version == tilemap.version:
+            return
+        tilemap.ensure_initialized()
+        changes = tilemap.changes_since(self._version) if self._version is not None else None
+        if changes is None or (tilemap.width, tilemap.height) != (self.width, self.height):
+            self._build()
+        else:
+            for x, y in changes:
+                self._costs[y * self.width + x] = tilemap.move_cost(x, y)
+            self._rebuild_clusters({self.cluster_of(y * self.width + x) for x, y in changes})
+        self._version = tilemap.version
+
+    def _build(self):
+        tilemap = self.tilemap
+        self.width, self.height = tilemap.width, tilemap.height
+        self.clusters_x = -(-self.width // self.cluster_size)
+        self.clusters_y = -(-self.height // self.cluster_size)
+        self._costs = [tilemap.move_cost(x, y) for y in range(self.height) for x in range(self.width)]
+        self._transitions.clear()
+        self._entrances.clear()
+        self._intra.clear()
+        self._inter.clear()
+        self._rebuild_clusters(set(range(self.clusters_x * self.clusters_y)))
+
+    def _rebuild_clusters(self, dirty: Set[int]):
+        # Faster ground anywhere lowers the cheapest possible step, which the heuristics rely on
+        speeds = [tt.move_speed_scalar for tt in self.tilemap.tile_types.values() if tt.passable and tt.move_speed_scalar > 0]
+        self.min_cost = 1.0 / max(speeds) if speeds else 1.0
+
+        borders = {border for cluster in dirty for border in self._borders(cluster)}
+        for border in borders:
+            for tile_a, tile_b in self._transitions.get(border, ()):
+                self._inter[tile_a].pop(tile_b, None)
+                self._inter[tile_b].pop(tile_a, None)
+            self._transitions[border] = transitions = self._scan_border(*border)
+            for tile_a, tile_b in transitions:
+                self._inter.setdefault(tile_a, {})[tile_b] = self._costs[tile_b]
+                self._inter.setdefault(tile_b, {})[tile_a] = self._costs[tile_a]
+
+        # Clusters on the other side of a rescanned border may have gained or lost entrances too
+        affected = dirty | {cluster for border in borders for cluster in border}
+        for cluster in affected:
+            for entrance in self._entrances.get(cluster, ()):
+                self._intra.pop(entrance, None)
+            entrances = set()
+            for a, b in self._borders(cluster):
+                for tile_a, tile_b in self._transitions.get((a, b), ()):
+                    entrances.add(tile_a if a == cluster else tile_b)
+            self._entrances[cluster] = entrances
+        self.clusters_rebuilt += len(affected)
+
+    def _borders(self, cluster: int) -> List[Tuple[int, int]]:
+        cx, cy = cluster % self.clusters_x, cluster // self.clusters_x
+        borders = []
+        if cx > 0:
+            borders.append((cluster - 1, cluster))
+        if cx + 1 < self.clusters_x:
+            borders.append((cluster, cluster + 1))
+        if cy > 0:
+            borders.append((cluster - self.clusters_x, cluster))
+        if cy + 1 < self.clusters_y:
+            borders.append((cluster, cluster + self.clusters_x))
+        return borders
+
+    def _scan_border(self, a: int, b: int) -> List[Tuple[int, int]]:
+        # Find the runs of open tile pairs across the border, and place an entrance in the middle of short
+        #  runs, or at both ends of long ones
+        x0, y0, x1, y1 = self.bounds(a)
+        width = self.width
+        if b == a + 1:
+            pairs = [(y * width + x1, y * width + x1 + 1) for y in range(y0, y1 + 1)]
+        else:
+            pairs = [(y1 * width + x, (y1 + 1) * width + x) for x in range(x0, x1 + 1)]
+        transitions = []
+        run: List[Tuple[int, int]] = []
+        for pair in pairs + [None]:
+            if pair is not None and self._costs[pair[0]] is not None and self._costs[pair[1]] is not None:
+                run.append(pair)
+                continue
+            if len(run) >= 6:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        return transitions
+
+    def _entrance_edges(self, entrance: int) -> Dict[int, float]:
+        edges = self._intra.get(entrance)
+        if edges is None:
+            cluster = self.cluster_of(entrance)
+            distances = _distances(self._costs, self.width, entrance, self.bounds(cluster))
+            edges = self._intra[entrance] = {other: distances[other] for other in sorted(self._entrances[cluster]) if other != entrance and other in distances}
+        return edges
+
+    # --- Queries ---
+
+    def find_path(self, start: Location, goal: Location) -> Optional[List[Location]]:
+        """A path from start to goal, as the list of locations to step to (excluding start, including goal).
+        Empty if start is the goal. None if there is no path."""
+        waypoints = self.plan(start, goal)
+        if waypoints is None:
+            return None
+        path: List[Location] = []
+        previous = start
+        for waypoint in waypoints:
+            path += self.refine(previous, waypoint)
+            previous = waypoint
+        return path
+
+    def plan(self, start: Location, goal: Location) -> Optional[List[Location]]:
+        """The abstract path from start to goal: the entrances that it passes through, then the goal.
+        Consecutive waypoints are always either in the same cluster, or on either side of a border (see refine).
+        None if there is no path."""
+        self._sync()
+        self.nodes_expanded = 0
+        width, costs = self.width, self._costs
+        if not (0 <= start.x < width and 0 <= start.y < self.height and 0 <= goal.x < width and 0 <= goal.y < self.height):
+            return None
+        start_node, goal_node = start.y * width + start.x, goal.y * width + goal.x
+        if costs[goal_node] is None:
+            return None
+        if start_node == goal_node:
+            return []
+
+        start_cluster, goal_cluster = self.cluster_of(start_node), self.cluster_of(goal_node)
+        if start_cluster == goal_cluster and _search(costs, width, start_node, goal_node, self.bounds(start_cluster), self.min_cost) is not None:
+            return [goal]
+
+        # Link the start and goal into the abstract graph. Steps cost the tile entered, so the cost from an
+        #  entrance to the goal is the cost from the goal to it, less the entrance's own tile, plus the goal's.
+        from_start = _distances(costs, width, start_node, self.bounds(start_cluster))
+        start_edges = {entrance: from_start[entrance] for entrance in sorted(self._entrances.get(start_cluster, ())) if entrance in from_start}
+        from_goal = _distances(costs, width, goal_node, self.bounds(goal_cluster))
+        goal_edges = {entrance: from_goal[entrance] - costs[entrance] + costs[goal_node] if entrance != goal_node else 0.0
+                      for entrance in self._entrances.get(goal_cluster, ()) if entrance in from_goal}
+
+        # The heuristic is inflated: paths through entrances are never quite straight, so an admissible one
+        #  would expand every entrance in a wide band around the straight line for little gain
+        goal_x, goal_y, min_cost = goal.x, goal.y, self.min_cost * self.heuristic_weight
+        best: Dict[int, float] = {_START: 0.0}
+        came_from: Dict[int, int] = {}
+        # (f, h, g, node): ties on f are broken towards the goal, as in AStar
+        heap: List[Tuple[float, float, float, int]] = [(0.0, 0.0, 0.0, _START)]
+        while heap:
+            _, _, g, node = heapq.heappop(heap)
+            if node == _GOAL:
+                nodes = []
+                node = came_from[_GOAL]
+                while node != _START:
+                    nodes.append(node)
+                    node = came_from[node]
+                nodes.reverse()
+                return [Location(node % width, node // width) for node in nodes] + [goal]
+            if g > best[node]:
+                continue
+            self.nodes_expanded += 1
+            if node == _START:
+                edges = start_edges.items()
+            else:
+                edges = list(self._entrance_edges(node).items()) + list(self._inter.get(node, {}).items())
+                if node in goal_edges:
+                    edges.append((_GOAL, goal_edges[node]))
+            for neighbor, cost in edges:
+                if g + cost < best.get(neighbor, float('inf')):
+                    best[neighbor] = g + cost
+                    came_from[neighbor] = node
+                    h = 0.0 if neighbor == _GOAL else (abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)) * min_cost
+                    heapq.heappush(heap, (g + cost + h, h, g + cost, neighbor))
+        return None
+
+    def refine(self, start: Location, waypoint: Location) -> List[Location]:
+        """The tiles to step to, to get from one waypoint of a plan to the next, searching only within one cluster."""
+        self._sync()
+        width = self.width
+        start_node, waypoint_node = start.y * width + start.x, waypoint.y * width + waypoint.x
+        if start_node == waypoint_node:
+            return []
+        if waypoint_node in self._inter.get(start_node, ()):
+            return [waypoint]  # Across a border
+        nodes = _search(self._costs, width, start_node, waypoint_node, self.bounds(self.cluster_of(start_node)), self.min_cost)
+        if nodes is None:
+            raise ValueError(f"No path from {start} to {waypoint} within their cluster; waypoints must come from plan()")
+        return [Location(node % width, node // width) for node in nodes]
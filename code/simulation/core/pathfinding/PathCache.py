@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from simulation.core.entity.Entity import Location
+from simulation.core.tiles.Tilemap import Tilemap
+
+# --- Path Cache ---
+# Droids in a routine (recharge, charge, repeat) ask for the same paths over and over. The most recently
+#  used paths are kept, keyed by start, goal, footprint size and the version of the tilemap that they were
+#  computed for, and every cached path is dropped as soon as the tilemap changes.
+# A path from any tile along a cached path to the same goal is the rest of that path, so such queries are
+#  served from it too (a suffix hit), without a path of their own being stored.
+
+Size = Tuple[int, int]
+PathKey = Tuple[Location, Location, Size, int]  # (start, goal, size, tilemap version)
+RouteKey = Tuple[Location, Size, int]  # (goal, size, tilemap version)
+
+class PathCache:
+    """Bounded LRU cache of paths across one Tilemap. Unreachable goals are cached too."""
+
+    def __init__(self, tilemap: Tilemap, max_entries: int = 512):
+        self.tilemap = tilemap
+        self.max_entries = max_entries
+        self._paths: 'OrderedDict[PathKey, Optional[Tuple[Location, ...]]]' = OrderedDict()
+        self._routes: Dict[RouteKey, Dict[Location, PathKey]] = {}  # (goal, size, version) -> tile on a cached path -> that path
+        self._version: Optional[int] = None
+        self.hits = 0  # Queries answered with a cached path
+        self.suffix_hits = 0  # Queries answered with the rest of a cached path that passes through their start
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @property
+    def hit_rate(self) -> float:
+        queries = self.hits + self.suffix_hits + self.misses
+        return (self.hits + self.suffix_hits) / queries if queries else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {"entries": len(self._paths), "max_entries": self.max_entries, "hits": self.hits,
+                "suffix_hits": self.suffix_hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+    def clear(self):
+        self._paths.clear()
+        self._routes.clear()
+
+    def get_or_compute(self, start: Location, goal: Location, size: Size,
+                       compute: Callable[[Location, Location, Size], Optional[List[Location]]]) -> Optional[List[Location]]:
+        """The path from start to goal (see World.find_path), from the cache if possible, otherwise from compute()."""
+        version = self.tilemap.version
+        if self._version != version:
+            self.clear()
+            self._version = version
+        key = (start, goal, size, version)
+        if key in self._paths:
+            self._paths.move_to_end(key)
+            self.hits += 1
+            path = self._paths[key]
+            return list(path) if path is not None else None
+
+        route = self._routes.get((goal, size, version), {}).get(start)
+        if route is not None:
+            self._paths.move_to_end(route)
+            self.suffix_hits += 1
+            path = self._paths[route]
+            return list(path[path.index(start) + 1:])
+
+        self.misses += 1
+        path = compute(start, goal, size)
+        # Computing the path may have initialized the map
+        if self.tilemap.version != version:
+            return path
+        self._store(key, tuple(path) if path is not None else None)
+        return path
+
+    def _store(self, key: PathKey, path: Optional[Tuple[Location, ...]]):
+        if self.max_entries <= 0:
+            return
+        while len(self._paths) >= self.max_entries:
+            self._evict()
+        self._paths[key] = path
+        if path:
+            start, goal, size, version = key
+            route = self._routes.setdefault((goal, size, version), {})
+            route[start] = key
+            for location in path[:-1]:
+                route[location] = key
+
+    def _evict(self):
+        key, path = self._paths.popitem(last=False)
+        start, goal, size, version = key
+        route = self._routes.get((goal, size, version))
+        if route is None:
+            return
+        for location in (start, *(path or ())):
+            if route.get(location) == key:
+                del route[location]
+        if not route:
+            del self._routes[(goal, size, version)]
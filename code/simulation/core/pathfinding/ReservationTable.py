@@ -0,0 +1,86 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# --- Reservation Table ---
+# Shared space-time bookings for cooperative pathfinding (see CooperativeAStar). An entity that plans its
+#  next few steps reserves every tile that it will stand on, for every tick that it will stand there, and
+#  other entities plan around those reservations rather than walking into each other and re-planning.
+# Reservations are kept per tick, so that those in the past can be dropped cheaply as the world ticks on.
+
+Tile = Tuple[int, int]
+
+class ReservationTable:
+    """Which entity has reserved which tile on which world tick."""
+
+    def __init__(self):
+        self._by_tick: Dict[int, Dict[Tile, str]] = {}  # Tick -> tile -> ID of the entity that reserved it
+        self._by_entity: Dict[str, List[Tuple[int, Tile]]] = {}  # Entity ID -> its reservations, as (tick, tile)
+        self._last_tick: Dict[str, int] = {}  # Entity ID -> last tick that it has reserved
+        self._pruned_until = 0  # Every reservation before this tick has been dropped
+
+    def __len__(self) -> int:
+        return sum(len(tiles) for tiles in self._by_tick.values())
+
+    def holds(self, entity_id: str) -> bool:
+        """Whether the entity has any reservations (i.e. is moving cooperatively)."""
+        return entity_id in self._by_entity
+
+    def holder(self, x: int, y: int, tick: int) -> Optional[str]:
+        tiles = self._by_tick.get(tick)
+        return tiles.get((x, y)) if tiles else None
+
+    def is_free(self, x: int, y: int, tick: int, entity_id: Optional[str] = None) -> bool:
+        """Whether the tile is free on the tick, for the given entity (its own reservations do not count)."""
+        holder = self.holder(x, y, tick)
+        return holder is None or holder == entity_id
+
+    def reserve(self, entity_id: str, cells: Iterable[Tuple[int, int, int]]) -> bool:
+        """Replace the entity's reservations with the given (x, y, tick) cells. Cells held by another entity are
+        left with it. Returns False if there were any such conflicts."""
+        self.release(entity_id)
+        reserved: List[Tuple[int, Tile]] = []
+        conflict = False
+        for x, y, tick in cells:
+            if tick < self._pruned_until:
+                continue
+            tiles = self._by_tick.setdefault(tick, {})
+            holder = tiles.get((x, y))
+            if holder is None:
+                tiles[(x, y)] = entity_id
+                reserved.append((tick, (x, y)))
+            elif holder != entity_id:
+                conflict = True
+        if reserved:
+            self._by_entity[entity_id] = reserved
+            self._last_tick[entity_id] = max(tick for tick, _ in reserved)
+        return not conflict
+
+    def release(self, entity_id: str):
+        """Drop every reservation held by the entity."""
+        self._last_tick.pop(entity_id, None)
+        for tick, tile in self._by_entity.pop(entity_id, ()):
+            tiles = self._by_tick.get(tick)
+            if tiles is not None and tiles.get(tile) == entity_id:
+                del tiles[tile]
+                if not tiles:
+                    del self._by_tick[tick]
+
+    def clear(self):
+        self._by_tick.clear()
+        self._by_entity.clear()
+        self._last_tick.clear()
+
+    def prune(self, tick: int):
+        """Drop every reservation for ticks before the given one."""
+        if tick <= self._pruned_until:
+            return
+        if tick - self._pruned_until > len(self._by_tick):
+            expired = [past for past in self._by_tick if past < tick]
+        else:
+            expired = range(self._pruned_until, tick)
+        for past in expired:
+            self._by_tick.pop(past, None)
+        self._pruned_until = tick
+        # Entities whose reservations have all passed no longer count as moving
+        for entity_id in [entity_id for entity_id, last_tick in self._last_tick.items() if last_tick < tick]:
+            del self._by_entity[entity_id]
+            del self._last_tick[entity_id]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Iterable
+from typing import ClassVar, Dict, List, Optional, Iterable, Set, Tuple
 import random
 from .TileTypes import TileType
 
@@ -24,6 +24,14 @@ class Tilemap:
     tiles: List[List[int]] = field(default_factory=list)
     # tile type registry (id -> TileType)
     tile_types: Dict[int, TileType] = field(default_factory=dict)
+    # bumped on every change to the grid or the registry; anything derived from the map (e.g. pathfinding
+    # grids) is keyed on it. Change tiles through set_tile (or call touch) rather than editing `tiles` directly.
+    version: int = 0
+    # recent single-tile changes, as (version, x, y), so that derived data can be updated incrementally (see changes_since)
+    _change_log: List[Tuple[int, int, int]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _log_floor: int = field(default=0, init=False, repr=False, compare=False)  # versions up to this one are not covered by the log
+
+    max_change_log: ClassVar[int] = 1024
 
     def ensure_initialized(self):
         """Lazily create the default map if not yet initialized.
@@ -51,6 +59,34 @@ class Tilemap:
         # Register default tile types if registry empty
         if not self.tile_types:
             self._register_default_tile_types()
+        self.touch()
+
+    def touch(self, tile: Optional[Tuple[int, int]] = None):
+        """Mark the map as changed, so that anything derived from it is rebuilt.
+        Pass the (x, y) of the tile if only one tile changed; otherwise the whole map counts as changed."""
+        self.version += 1
+        if tile is None:
+            self._change_log.clear()
+            self._log_floor = self.version
+            return
+        self._change_log.append((self.version, tile[0], tile[1]))
+        if len(self._change_log) > self.max_change_log:
+            dropped = self._change_log[:len(self._change_log) // 2]
+            del self._change_log[:len(dropped)]
+            self._log_floor = dropped[-1][0]
+
+    def changes_since(self, version: int) -> Optional[Set[Tuple[int, int]]]:
+        """The (x, y) of every tile changed after the given version, or None if that is not known (the whole map may have changed)."""
+        if version < self._log_floor:
+            return None
+        return {(x, y) for changed_version, x, y in self._change_log if changed_version > version}
+
+    def set_tile(self, x: int, y: int, tid: int):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Tile ({x}, {y}) is outside the {self.width}x{self.height} map")
+        if self.tiles[y][x] != tid:
+            self.tiles[y][x] = tid
+            self.touch((x, y))
 
     # --- Tile type management ---
     def _register_default_tile_types(self):
@@ -61,7 +97,9 @@ class Tilemap:
     def register_tile_type(self, tile_type: TileType):
         if tile_type.id in self.tile_types and self.tile_types[tile_type.id] != tile_type:
             raise ValueError(f"Tile type id {tile_type.id} already registered with different definition")
-        self.tile_types[tile_type.id] = tile_type
+        if tile_type.id not in self.tile_types:
+            self.tile_types[tile_type.id] = tile_type
+            self.touch()
 
     def get_tile_type(self, tid: int) -> TileType:
         return self.tile_types[tid]
@@ -76,6 +114,16 @@ class Tilemap:
             return False
         return tt.passable
 
+    def move_cost(self, x: int, y: int) -> Optional[float]:
+        """Cost of stepping onto the tile at (x, y): 1 for a normal tile, less for faster ground.
+        None if the tile cannot be entered."""
+        if not self.is_passable(x, y):
+            return None
+        scalar = self.tile_types[self.tiles[y][x]].move_speed_scalar
+        if scalar <= 0:
+            return None
+        return 1.0 / scalar
+
     def to_json(self) -> Dict:
         self.ensure_initialized()
         # IMPORTANT: Keep original contract expected by existing tests / clients.
@@ -84,7 +132,7 @@ class Tilemap:
         return {
             "width": self.width,
             "height": self.height,
-            "tiles": self.tiles,
+            "tiles": [list(row) for row in self.tiles],  # Snapshot, so later set_tile calls don't leak into it
             "tile_types": {tid: tt.to_json() for tid, tt in self.tile_types.items()},
         }
 
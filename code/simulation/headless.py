@@ -0,0 +1,48 @@
+"""
+Headless runner - runs a scenario as fast as possible, without any GUI attached.
+
+Ticks are run back-to-back, and the loop only waits while an agent's LLM
+response is actually outstanding. Useful for offline batch runs and benchmarks.
+
+Usage (from the code/ directory):
+    python -m simulation.headless scenarios/example_scenario.json --ticks 10000
+"""
+
+import argparse
+from typing import List, Optional
+
+from simulation.AutoScenarioManager import AutoScenarioManager
+from simulation.core.Simulation import RunStats, Simulation
+from simulation.GlobalConfig import GlobalConfig
+
+
+def run_headless(scenario_path: Optional[str], ticks: int) -> RunStats:
+    """Load a scenario (or an empty world) and run it headless for the given number of ticks."""
+    if scenario_path:
+        simulation = AutoScenarioManager.load_simulation_from_json(scenario_path)
+    else:
+        simulation = Simulation.get_instance()
+
+    # Scenarios are often saved while paused from the GUI -- always run when headless.
+    simulation.paused = False
+    return simulation.run_sync(ticks=ticks, headless=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run a MoistureFarmer scenario headless, as fast as possible.")
+    parser.add_argument("scenario", nargs="?", default=None, help="Path to a scenario JSON file (AutoScenarioManager format). Runs an empty world if omitted.")
+    parser.add_argument("--ticks", type=int, default=1000, help="Number of ticks to run (default: 1000)")
+    parser.add_argument("--dump-state", action="store_true", help="Dump simulation state to logs/ every tick (slow)")
+    parser.add_argument("--log-level", type=int, default=2, help="Minimum log level to print (0 = info, 1 = warning, 2 = error)")
+    args = parser.parse_args(argv)
+
+    GlobalConfig.simulation_dump_state = args.dump_state
+    GlobalConfig.log_print_level = args.log_level
+
+    stats = run_headless(args.scenario, args.ticks)
+    print(f"Headless run complete: {stats}")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
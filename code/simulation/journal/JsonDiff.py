@@ -0,0 +1,70 @@
+import copy
+from typing import Any, List, Union
+
+# --- Structural JSON Diff ---
+# Minimal structural diff between two JSON-compatible values (dicts, lists, and scalars), used to
+#  delta-encode consecutive simulation states in the tick journal.
+# A diff is a list of operations, each of which is a small list so that it stays compact as JSON:
+#  ["set", path, value]  -- set the value at path (creating it if needed)
+#  ["del", path]         -- delete the key at path
+# A path is a list of dict keys and list indices leading from the root to the changed value.
+# Lists are only diffed element-wise when their length is unchanged; otherwise they are replaced.
+
+PathKey = Union[str, int]
+
+
+def diff(old: Any, new: Any) -> List[list]:
+    """Compute the operations that turn `old` into `new`."""
+    ops: List[list] = []
+    _diff(old, new, [], ops)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: List[PathKey], ops: List[list]):
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, new_value in new.items():
+            if key not in old:
+                ops.append(["set", path + [key], new_value])
+            else:
+                _diff(old[key], new_value, path + [key], ops)
+        for key in old:
+            if key not in new:
+                ops.append(["del", path + [key]])
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_value, new_value) in enumerate(zip(old, new)):
+            _diff(old_value, new_value, path + [index], ops)
+    else:
+        ops.append(["set", path, new])
+
+
+def apply(state: Any, ops: List[list]) -> Any:
+    """Apply diff operations to `state` in place, and return the (possibly replaced) root value."""
+    for op in ops:
+        kind, path = op[0], op[1]
+        if not path:
+            # Replacing the root value
+            if kind == "set":
+                state = copy.deepcopy(op[2])
+            continue
+
+        parent = state
+        for key in path[:-1]:
+            parent = parent[_key(parent, key)]
+        last = _key(parent, path[-1])
+
+        if kind == "set":
+            parent[last] = copy.deepcopy(op[2])
+        elif kind == "del":
+            del parent[last]
+        else:
+            raise ValueError(f"Unknown diff operation `{kind}`.")
+    return state
+
+
+def _key(container: Any, key: PathKey) -> PathKey:
+    # JSON round-trips turn every dict key into a string, but list indices stay integers.
+    if isinstance(container, dict) and not isinstance(key, str) and key not in container:
+        return str(key)
+    return key
@@ -0,0 +1,154 @@
+import bisect
+import copy
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from simulation.journal import JsonDiff
+
+# --- Tick Journal ---
+# An append-only, delta-encoded record of simulation states, written as JSON lines.
+#  Every `keyframe_interval` ticks a full keyframe (the output of Simulation.to_json()) is written;
+#  every other recorded tick only stores the structural diff from the previously recorded state.
+#  A small sidecar index (`<journal>.idx`) records the tick and byte offset of every keyframe, so
+#  that a reader can rebuild the state at any tick by seeking straight to the nearest keyframe and
+#  replaying only the deltas after it.
+#
+# Line formats:
+#  {"k":1,"t":<tick>,"s":<full state>}
+#  {"t":<tick>,"d":<diff operations>}
+
+class TickJournalWriter:
+    def __init__(self, path: str, keyframe_interval: int = 100):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.keyframe_interval = keyframe_interval
+
+        self._previous_state: Optional[Dict[str, Any]] = None
+        self._last_keyframe_tick: Optional[int] = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Start a fresh journal
+        self._file = open(self.path, "wb")
+        self._index_file = open(self.index_path, "w")
+
+    @staticmethod
+    def normalize(value: Any) -> Any:
+        """Normalize through a JSON round-trip, so that keys and values compare exactly as a reader
+        will see them (e.g. integer dict keys become strings), and so we own an independent copy."""
+        return json.loads(json.dumps(value, default=str))
+
+    def append(self, tick: int, state: Dict[str, Any], normalized: bool = False):
+        """Record the state of the simulation at the given tick.
+        Pass normalized=True if the state has already been through normalize() and will not be mutated afterwards."""
+        if not normalized:
+            state = self.normalize(state)
+
+        is_keyframe = (self._previous_state is None
+                       or tick - self._last_keyframe_tick >= self.keyframe_interval)
+
+        if is_keyframe:
+            offset = self._file.tell()
+            record = {"k": 1, "t": tick, "s": state}
+            self._index_file.write(f"{tick} {offset}\n")
+            self._index_file.flush()
+            self._last_keyframe_tick = tick
+        else:
+            record = {"t": tick, "d": JsonDiff.diff(self._previous_state, state)}
+
+        self._file.write(json.dumps(record, separators=(',', ':')).encode())
+        self._file.write(b"\n")
+        self._file.flush()
+
+        self._previous_state = state
+
+    def sync(self):
+        """Flush the journal and its index all the way to disk."""
+        for f in (self._file, self._index_file):
+            f.flush()
+            os.fsync(f.fileno())
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.sync()
+        self._file.close()
+        self._index_file.close()
+
+
+class TickJournalReader:
+    def __init__(self, path: str):
+        self.path = path
+        self.keyframes: List[Tuple[int, int]] = self._load_index()  # (tick, byte offset), sorted by tick
+        self._keyframe_ticks = [tick for tick, _ in self.keyframes]
+
+    def _load_index(self) -> List[Tuple[int, int]]:
+        index_path = self.path + ".idx"
+        keyframes: List[Tuple[int, int]] = []
+        if os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        tick, offset = line.split()
+                        keyframes.append((int(tick), int(offset)))
+            return keyframes
+
+        # No index (e.g. it was deleted): rebuild it by scanning for keyframe lines.
+        #  Only the short prefix of each keyframe line needs to be decoded.
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                if line.startswith(b'{"k":1,"t":'):
+                    tick = int(line[len(b'{"k":1,"t":'):line.index(b',', len(b'{"k":1,"t":'))])
+                    keyframes.append((tick, offset))
+                offset += len(line)
+        return keyframes
+
+    @property
+    def first_tick(self) -> Optional[int]:
+        return self._keyframe_ticks[0] if self._keyframe_ticks else None
+
+    def state_at(self, tick: int) -> Optional[Dict[str, Any]]:
+        """Rebuild the most recently recorded state at or before the given tick.
+        Returns None if the journal has no state that early."""
+        for record_tick, state in self.iter_states(tick, tick):
+            return state
+        return None
+
+    def iter_states(self, start_tick: int, end_tick: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (tick, state) for every recorded tick between start_tick and end_tick (inclusive).
+        The first yielded state is the one in effect at start_tick, which may have been recorded earlier.
+        Yielded states are independent copies, and are safe to keep or modify."""
+        position = bisect.bisect_right(self._keyframe_ticks, start_tick) - 1
+        if position < 0:
+            return
+        _, offset = self.keyframes[position]
+
+        state = None
+        state_tick = None
+        started = False
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                record = json.loads(line)
+                record_tick = record["t"]
+                if record_tick > start_tick and not started:
+                    # Emit the state that was in effect at start_tick before moving past it
+                    started = True
+                    yield state_tick, copy.deepcopy(state)
+                if end_tick is not None and record_tick > end_tick:
+                    return
+
+                if "k" in record:
+                    state = record["s"]
+                else:
+                    state = JsonDiff.apply(state, record["d"])
+                state_tick = record_tick
+
+                if started:
+                    yield state_tick, copy.deepcopy(state)
+
+        if not started and state is not None:
+            yield state_tick, copy.deepcopy(state)
@@ -0,0 +1,44 @@
+"""
+Tick journal replay tool - rebuilds the simulation state at any tick from a tick journal.
+
+Usage (from the code/ directory):
+    python -m simulation.journal.replay logs/sim_journal_<timestamp>.jsonl --info
+    python -m simulation.journal.replay logs/sim_journal_<timestamp>.jsonl --tick 500
+    python -m simulation.journal.replay logs/sim_journal_<timestamp>.jsonl --tick 500 --short
+"""
+
+import argparse
+import json
+from typing import List, Optional
+
+from simulation.journal.TickJournal import TickJournalReader
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Rebuild simulation state from a MoistureFarmer tick journal.")
+    parser.add_argument("journal", help="Path to a sim_journal_*.jsonl file")
+    parser.add_argument("--tick", type=int, default=None, help="Tick to rebuild the state at")
+    parser.add_argument("--short", action="store_true", help="Only print the entities, without the tilemap and simulation settings")
+    parser.add_argument("--info", action="store_true", help="List the keyframes in the journal")
+    args = parser.parse_args(argv)
+
+    reader = TickJournalReader(args.journal)
+
+    if args.info or args.tick is None:
+        print(f"{args.journal}: {len(reader.keyframes)} keyframes, first tick {reader.first_tick}")
+        for tick, offset in reader.keyframes:
+            print(f"  keyframe at tick {tick} (byte offset {offset})")
+        return
+
+    state = reader.state_at(args.tick)
+    if state is None:
+        print(f"No state recorded at or before tick {args.tick}.")
+        return
+
+    if args.short:
+        state = {"tick_count": state.get("tick_count"), "entities": state.get("world", {}).get("entities", {})}
+    print(json.dumps(state, indent=2))
+
+
+if __name__ == "__main__":
+    main()
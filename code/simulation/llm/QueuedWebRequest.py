@@ -15,6 +15,15 @@ class QueuedHttpRequest(BaseModel):
     def __init__(self, url: str, data: Optional[dict] = None, headers: Optional[dict] = {'Content-Type': 'application/json'}):
         super().__init__(url=url, data=data, headers=headers)
 
+    def __getstate__(self):
+        # The worker thread cannot be copied. A request that is still in flight is recorded as
+        #  interrupted, so that a restored agent handles it like any other failed request.
+        state = super().__getstate__()
+        state['__pydantic_private__'] = {**(state['__pydantic_private__'] or {}), '_thread': None}
+        if self.in_progress:
+            state['__dict__'] = {**state['__dict__'], 'in_progress': False, 'response': {'error': 'interrupted by checkpoint'}}
+        return state
+
     def begin_send(self, timeout: Optional[float] = None):
         self.in_progress = True
         self.response = None
@@ -2,8 +2,9 @@
 # Information needed to call a function as a tool
 #  This is used to define the tools that a Component provides to the agentic AI.
 from enum import Enum
+import functools
 import inspect
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pydantic import BaseModel
 from docstring_parser import parse
 
@@ -14,10 +15,19 @@ _IS_TOOL_FUNCTION = "_is_tool_function"
 # Note: Any function marked as a tool MUST have a complete docstring
 #  that describes itself and its parameters, with Pydantic types and descriptions for all
 def tool(func):
-    setattr(func, _IS_TOOL_FUNCTION, True)
     if not func.__doc__:
         raise ValueError(f"Function {func.__name__} must have a docstring if it is going to be used as a tool.")
-    return func
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # Calling a tool wakes a dormant component (see Component.go_dormant)
+        wake = getattr(self, "wake", None)
+        if wake:
+            wake()
+        return func(self, *args, **kwargs)
+
+    setattr(wrapper, _IS_TOOL_FUNCTION, True)
+    return wrapper
 
 class ToolCallParameter(BaseModel):
     name: str
@@ -36,9 +46,10 @@ class ToolCallResult(BaseModel):
     message: Optional[str] = None # Optional message to provide additional context
     data: Optional[Any] = None    # Optional data returned by the tool call
     callback: Optional[Callable[[], "ToolCallResult"]] = None  # Optional callback to call when the tool call is complete
+    retry_after: Optional[int] = None  # Optional hint: the callback will not complete for at least this many ticks, so there is no need to poll it until then
 
-    def __init__(self, state: ToolCallState, message: str = None, data: Any = None, callback: Callable[[], "ToolCallResult"] = None):
-        super().__init__(state=state, message=message, data=data)
+    def __init__(self, state: ToolCallState, message: str = None, data: Any = None, callback: Callable[[], "ToolCallResult"] = None, retry_after: Optional[int] = None):
+        super().__init__(state=state, message=message, data=data, retry_after=retry_after)
         self.callback = callback
         if callback and not callable(callback):
             raise ValueError("Callback must be a callable function that returns a ToolCallResult.")
@@ -82,7 +93,8 @@ class ToolCall(BaseModel):
     #  https://platform.openai.com/docs/guides/function-calling?api-mode=responses&strict-mode=enabled#defining-functions
     #  https://cookbook.openai.com/examples/how_to_call_functions_with_chat_models
     def to_openai_json(self) -> dict:
-        return self.function_to_schema(self.function_ptr)
+        # Built once per tool function (see tool_spec) and shared -- do not modify
+        return tool_spec(self.function_ptr)[2]
         """
         return {
             "type": "function",
@@ -101,7 +113,8 @@ class ToolCall(BaseModel):
         }
         """
     
-    def function_to_schema(self, func) -> dict:
+    @staticmethod
+    def function_to_schema(func) -> dict:
         # https://github.com/openai/build-hours/blob/main/2-assistants/demo_util.py
         # https://github.com/openai/openai-cookbook/blob/main/examples/Orchestrating_agents.ipynb
         type_map = {
@@ -156,31 +169,48 @@ class ToolCall(BaseModel):
         }
     
     def __init__(self, function_ptr: Callable[..., ToolCallResult]):
-        # Use docstring_parser to extract the function's docstring and parameters
-        docstring = parse(function_ptr.__doc__)
-        # Assert that we have a short description
-        if not docstring.short_description:
-            raise ValueError(f"Function {function_ptr.__name__} must have a docstring with a short description.")
-        description = docstring.short_description
-        parameters = []
-        for param in docstring.params:
-            # Create a ToolCallParameter for each parameter in the function's docstring
-            if not param.description:
-                raise ValueError(f"Function {function_ptr.__name__} parameter '{param.arg_name}' must have a description.")
-            if not param.type_name:
-                raise ValueError(f"Function {function_ptr.__name__} parameter '{param.arg_name}' must have a Pydantic type specified.")
-
-            parameters.append(
-                ToolCallParameter(
-                    name=param.arg_name,
-                    description=param.description,
-                    type=param.type_name,
-                    required=True  # Assume all parameters are required by default
-                )
+        # Docstrings are parsed (and schemas built) once per tool function, and shared by every ToolCall bound to it
+        description, parameters, _ = tool_spec(function_ptr)
+        super().__init__(function_ptr=function_ptr, description=description, parameters=parameters)
+
+
+# Parsed description, parameters and OpenAI schema of every tool function seen so far, keyed by the underlying function
+_tool_specs: Dict[Callable, Tuple[str, List[ToolCallParameter], dict]] = {}
+
+
+def tool_spec(function_ptr: Callable) -> Tuple[str, List[ToolCallParameter], dict]:
+    """The description, parameters and OpenAI schema of a tool function (or of a method bound to one), parsed once."""
+    func = getattr(function_ptr, "__func__", function_ptr)
+    spec = _tool_specs.get(func)
+    if spec is not None:
+        return spec
+
+    # Use docstring_parser to extract the function's docstring and parameters
+    docstring = parse(func.__doc__)
+    # Assert that we have a short description
+    if not docstring.short_description:
+        raise ValueError(f"Function {func.__name__} must have a docstring with a short description.")
+    description = docstring.short_description
+    parameters = []
+    for param in docstring.params:
+        # Create a ToolCallParameter for each parameter in the function's docstring
+        if not param.description:
+            raise ValueError(f"Function {func.__name__} parameter '{param.arg_name}' must have a description.")
+        if not param.type_name:
+            raise ValueError(f"Function {func.__name__} parameter '{param.arg_name}' must have a Pydantic type specified.")
+
+        parameters.append(
+            ToolCallParameter(
+                name=param.arg_name,
+                description=param.description,
+                type=param.type_name,
+                required=True  # Assume all parameters are required by default
             )
+        )
 
-        super().__init__(function_ptr=function_ptr, description=description, parameters=parameters)
+    # If the function has a return type, add it to the parameters
+    # TODO: Are there tool call formats that expect this? OpenAI does not.
+    # if docstring.returns:
 
-        # If the function has a return type, add it to the parameters
-        # TODO: Are there tool call formats that expect this? OpenAI does not.
-        # if docstring.returns:
+    spec = _tool_specs[func] = (description, parameters, ToolCall.function_to_schema(func))
+    return spec
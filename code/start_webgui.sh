@@ -6,6 +6,6 @@ else
     UVICORN_CMD="uvicorn"
 fi
 # Clear our logs folder
-rm logs/*.json
+rm -f logs/*.json logs/*.jsonl logs/*.jsonl.idx
 
 MF_DEFAULT_SCENARIO="$(dirname "$0")/scenarios/example_scenario.json" $UVICORN_CMD webgui.server:app --reload
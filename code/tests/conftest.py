@@ -9,6 +9,7 @@ if proj_root not in sys.path:
 
 # Import simulation package early to run centralized model rebuilds
 import simulation  # noqa: F401
+from simulation.GlobalConfig import GlobalConfig
 
 # Convert Pydantic forward-ref user errors into test failures if they appear as warnings.
 # (Pydantic raises errors normally; to catch latent forward ref warnings we elevate them.)
@@ -28,3 +29,8 @@ def fail_on_forward_ref_warnings():
             message=r".*not fully defined.*model_rebuild.*",
         )
         yield
+
+@pytest.fixture(autouse=True)
+def state_dumps_in_tmp_path(tmp_path, monkeypatch):
+    # Keep state dumps, tick journals and HTTP request dumps written by tests out of the working tree
+    monkeypatch.setattr(GlobalConfig, "simulation_dump_dir", str(tmp_path / "dumps"))
@@ -0,0 +1,47 @@
+import os
+import random
+
+from simulation.batch import format_summary, make_jobs, run_batch, run_job
+from simulation.core.Simulation import Simulation
+from simulation.GlobalConfig import GlobalConfig
+
+SCENARIO = os.path.join(os.path.dirname(__file__), "..", "scenarios", "example_scenario.json")
+
+
+def test_make_jobs_seeds_each_run():
+    jobs = make_jobs([SCENARIO, SCENARIO], ticks=10, runs=3, base_seed=100)
+    assert len(jobs) == 6
+    assert [job.seed for job in jobs] == list(range(100, 106))
+
+def test_run_job_collects_metrics():
+    result = run_job(make_jobs([SCENARIO], ticks=50)[0])
+    assert result.error is None
+    assert result.ticks == 50
+    assert result.water_produced > 0
+    assert 0 < result.charge_total <= result.charge_capacity
+    assert result.ticks_per_second > 0
+
+def test_run_batch_in_parallel_is_reproducible():
+    jobs = make_jobs([SCENARIO], ticks=50, runs=2)
+    results = run_batch(jobs, max_workers=2)
+    assert [r.seed for r in results] == [0, 1]
+    assert all(r.error is None for r in results)
+    # The same job gives the same outcome, in a worker process or not
+    assert results[0].water_produced == run_job(jobs[0]).water_produced
+
+def test_run_job_reports_errors():
+    result = run_job(make_jobs(["does_not_exist.json"], ticks=10)[0])
+    assert result.error is not None
+    assert "FAILED" in format_summary([result])
+
+def test_run_batch_in_process_leaves_globals_alone():
+    simulation = Simulation(simulation_delay=0)
+    config = {name: getattr(GlobalConfig, name) for name in GlobalConfig.__class_vars__}
+    random.seed(1234)
+    random_state = random.getstate()
+
+    results = run_batch(make_jobs([SCENARIO], ticks=10), max_workers=1)
+    assert results[0].error is None
+    assert {name: getattr(GlobalConfig, name) for name in GlobalConfig.__class_vars__} == config
+    assert random.getstate() == random_state
+    assert Simulation.get_instance() is simulation
@@ -0,0 +1,97 @@
+import time
+
+import pytest
+from simulation.core.Checkpoint import CheckpointError
+from simulation.core.entity.component.DroidAgent import DroidAgent
+from simulation.core.entity.component.Motivator import Motivator
+from simulation.core.entity.component.WaterTank import WaterTank
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+from simulation.llm.QueuedWebRequest import QueuedHttpRequest
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_checkpoint_round_trip(simulation: Simulation):
+    simulation.world.add_entity(GX1_Vaporator(location=Location(x=5, y=5)))
+    simulation.world.add_entity(GonkDroid(location=Location(x=1, y=1)))
+    simulation.run_sync(ticks=10)
+
+    blob = simulation.checkpoint()
+    restored = Simulation.restore(blob)
+
+    assert isinstance(blob, bytes)
+    assert restored is not simulation
+    assert Simulation.get_instance() is restored
+    assert restored.tick_count == 10
+    assert restored.to_json()["world"] == simulation.to_json()["world"]
+
+def test_checkpoint_preserves_in_flight_movement(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    simulation.world.add_entity(droid)
+    droid.get_component(Motivator).move_to_location(8, 1)
+    simulation.run_sync(ticks=2)
+
+    restored = Simulation.restore(simulation.checkpoint())
+    restored_droid = restored.world.get_entity(droid.id)
+    restored_motivator = restored_droid.get_component(Motivator)
+    assert restored_motivator.path_to_destination == droid.get_component(Motivator).path_to_destination
+
+    # Both copies keep moving, and arrive at the same place.
+    simulation.run_sync(ticks=30)
+    restored.run_sync(ticks=30)
+    assert restored_droid.location == droid.location == Location(x=8, y=1)
+
+def test_fork_is_independent(simulation: Simulation):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+
+    forked = simulation.fork()
+    assert Simulation.get_instance() is simulation
+
+    forked.run_sync(ticks=20)
+    forked_tank = forked.world.get_entity(vaporator.id).get_component(WaterTank)
+    assert forked_tank.fill > 0
+    assert vaporator.get_component(WaterTank).fill == 0
+    assert simulation.tick_count == 0
+    # Its logs spill to files of its own
+    assert forked.context.run_id != simulation.context.run_id
+
+def test_checkpoint_drops_process_state(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    simulation.world.add_entity(droid)
+    agent = droid.get_component(DroidAgent)
+    agent.queued_http_request = QueuedHttpRequest(url="http://localhost:0")
+    agent.queued_http_request.in_progress = True
+    simulation.subscribe_on_tick(lambda sim: None)
+
+    restored = Simulation.restore(simulation.checkpoint())
+
+    assert restored._on_tick_subscribers == []
+    request = restored.world.get_entity(droid.id).get_component(DroidAgent).queued_http_request
+    assert not request.in_progress
+    assert "error" in request.response
+    # The original is untouched
+    assert agent.queued_http_request.in_progress
+
+def test_restore_is_fast(simulation: Simulation):
+    for i in range(20):
+        simulation.world.add_entity(GX1_Vaporator(location=Location(x=i, y=5)))
+    blob = simulation.checkpoint()
+
+    start = time.perf_counter()
+    for _ in range(10):
+        Simulation.restore(blob, make_current=False)
+    assert (time.perf_counter() - start) / 10 < 0.1
+
+def test_restore_rejects_other_data():
+    with pytest.raises(CheckpointError):
+        Simulation.restore(b"not a checkpoint")
@@ -0,0 +1,61 @@
+import pytest
+from simulation.core.entity.component.Motivator import Motivator
+from simulation.core.entity.component.PowerPack import PowerPack, SmallPowerPack
+from simulation.core.entity.component.Storage import Storage
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_get_component_is_cached(simulation: Simulation, monkeypatch):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    power = droid.get_component(PowerPack)
+    assert droid.get_component("PowerPack") is power
+    assert droid.get_component(power.id) is power
+
+    calls = []
+    original = droid.__class__._find_component
+    monkeypatch.setattr(droid.__class__, "_find_component", lambda self, identifier: calls.append(identifier) or original(self, identifier))
+    assert droid.get_component(PowerPack) is power
+    assert droid.get_component("PowerPack") is power
+    assert droid.get_component("Nothing") is None
+    assert droid.get_component("Nothing") is None
+    assert calls == ["Nothing"]
+
+def test_cache_is_cleared_when_components_move(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    slot_id = next(slot_id for slot_id, slot in droid.slots.items() if isinstance(slot.component, PowerPack))
+    power = droid.get_component(PowerPack)
+
+    assert droid.uninstall_component(slot_id) is power
+    assert droid.get_component(PowerPack) is None
+
+    replacement = SmallPowerPack()
+    droid.install_component(slot_id, replacement)
+    assert droid.get_component(PowerPack) is replacement
+    assert droid.get_component("SmallPowerPack") is replacement
+
+    # Moving a component into storage takes it straight out of its slot
+    storage = Storage(capacity=2)
+    assert storage.store_component(droid.get_component(Motivator))
+    assert droid.get_component(Motivator) is None
+    assert storage.inventory[0].chassis is None
+
+def test_slot_assignment_installs_the_component(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    slot = next(slot for slot in droid.slots.values() if isinstance(slot.component, PowerPack))
+    power = slot.component
+
+    replacement = SmallPowerPack()
+    slot.component = replacement
+    assert replacement.chassis is droid and replacement.storage_parent is droid
+    assert power.chassis is None and power.storage_parent is None
+    assert droid.get_component(PowerPack) is replacement
@@ -0,0 +1,155 @@
+import pytest
+from simulation.core.entity.Chassis import Chassis
+from simulation.core.entity.component.Motivator import AStarMotivator, Motivator
+from simulation.core.entity.component.PowerPack import PowerPack
+from simulation.core.entity.ComponentSlot import ComponentSlot
+from simulation.core.entity.Entity import Location
+from simulation.core.pathfinding.ReservationTable import ReservationTable
+from simulation.core.Simulation import Simulation
+from simulation.core.tiles.Tilemap import Tilemap
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.GlobalConfig import GlobalConfig
+
+ROCK = 1
+
+class CooperativeDroid(Chassis):
+    slots: dict = {
+        "power_pack": ComponentSlot(accepts=PowerPack, default_component=PowerPack),
+        "motivator": ComponentSlot(accepts=Motivator, default_component=AStarMotivator),
+    }
+
+class Crate(Chassis):
+    slots: dict = {}
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def _corridor(tilemap: Tilemap, y: int, x_from: int, x_to: int):
+    # Rock on both sides of row y, between x_from and x_to
+    for x in range(x_from, x_to + 1):
+        tilemap.set_tile(x, y - 1, ROCK)
+        tilemap.set_tile(x, y + 1, ROCK)
+
+def _run_without_collisions(simulation: Simulation, droids, ticks: int):
+    for _ in range(ticks):
+        simulation.run_sync(ticks=1)
+        locations = [droid.location for droid in droids]
+        assert len(locations) == len(set(locations))
+
+def test_reservation_table_reserve_release_and_prune():
+    table = ReservationTable()
+    assert table.reserve("a", [(1, 1, 0), (2, 1, 1), (2, 1, 2)])
+    assert table.holds("a")
+    assert table.holder(2, 1, 1) == "a"
+    assert table.is_free(2, 1, 1, "a")
+    assert not table.is_free(2, 1, 1, "b")
+
+    # Conflicting cells stay with whoever reserved them first
+    assert not table.reserve("b", [(2, 1, 2), (3, 1, 2)])
+    assert table.holder(2, 1, 2) == "a"
+    assert table.holder(3, 1, 2) == "b"
+
+    # Reserving again replaces an entity's previous reservations
+    assert table.reserve("b", [(4, 1, 5)])
+    assert table.holder(3, 1, 2) is None
+
+    table.prune(2)
+    assert table.holder(1, 1, 0) is None
+    assert table.holder(2, 1, 2) == "a"
+    table.prune(3)
+    assert not table.holds("a")  # Every reservation has passed
+    assert table.holds("b")
+    table.release("b")
+    assert len(table) == 0
+
+def test_droids_swap_places_through_a_corridor(simulation: Simulation):
+    tilemap = Tilemap.from_default()
+    _corridor(tilemap, 5, 3, 14)
+    tilemap.set_tile(8, 6, 0)  # A passing place
+    simulation.world.tilemap = tilemap
+    west = CooperativeDroid(location=Location(x=2, y=5))
+    east = CooperativeDroid(location=Location(x=15, y=5))
+    simulation.world.add_entity(west)
+    simulation.world.add_entity(east)
+
+    west.get_available_tools()["move_to_location"].execute(x=15, y=5)
+    east.get_available_tools()["move_to_location"].execute(x=2, y=5)
+    _run_without_collisions(simulation, [west, east], 200)
+
+    assert west.location == Location(x=15, y=5)
+    assert east.location == Location(x=2, y=5)
+    assert len(simulation.world.reservations) == 0
+
+def test_droids_cross_paths(simulation: Simulation):
+    droids = [CooperativeDroid(location=Location(x=2, y=10)), CooperativeDroid(location=Location(x=10, y=2)),
+              CooperativeDroid(location=Location(x=18, y=10)), CooperativeDroid(location=Location(x=10, y=18))]
+    goals = [Location(x=18, y=10), Location(x=10, y=18), Location(x=2, y=10), Location(x=10, y=2)]
+    for droid, goal in zip(droids, goals):
+        simulation.world.add_entity(droid)
+        droid.get_available_tools()["move_to_location"].execute(x=goal.x, y=goal.y)
+    _run_without_collisions(simulation, droids, 200)
+
+    assert [droid.location for droid in droids] == goals
+
+def test_droid_goes_around_entities_that_stand_still(simulation: Simulation):
+    droid = CooperativeDroid(location=Location(x=2, y=5))
+    crate = Crate(location=Location(x=5, y=5))
+    simulation.world.add_entity(droid)
+    simulation.world.add_entity(crate)
+
+    droid.get_available_tools()["move_to_location"].execute(x=8, y=5)
+    _run_without_collisions(simulation, [droid, crate], 60)
+    assert droid.location == Location(x=8, y=5)
+
+def test_droid_gives_up_when_blocked_in(simulation: Simulation, monkeypatch):
+    monkeypatch.setattr(GlobalConfig, "cooperative_max_stalls", 3)
+    tilemap = Tilemap.from_default()
+    # A dead end, with a crate between the droid and the way out
+    _corridor(tilemap, 5, 1, 10)
+    tilemap.set_tile(1, 5, ROCK)
+    simulation.world.tilemap = tilemap
+    droid = CooperativeDroid(location=Location(x=2, y=5))
+    crate = Crate(location=Location(x=6, y=5))
+    simulation.world.add_entity(droid)
+    simulation.world.add_entity(crate)
+    motivator = droid.get_component(Motivator)
+
+    droid.get_available_tools()["move_to_location"].execute(x=12, y=5)
+    simulation.run_sync(ticks=100)
+    assert motivator.destination is None
+    assert motivator.last_block_reason == "blocked_by_entity"
+    assert droid.location == Location(x=5, y=5)
+    assert not simulation.world.reservations.holds(droid.id)
+
+def test_stock_droids_cross_paths(simulation: Simulation):
+    # Droids with the basic Motivator take turns too
+    across = GonkDroid(location=Location(x=2, y=10))
+    down = GonkDroid(location=Location(x=10, y=2))
+    simulation.world.add_entity(across)
+    simulation.world.add_entity(down)
+    assert type(across.get_component(Motivator)) is Motivator
+
+    across.get_available_tools()["move_to_location"].execute(x=18, y=10)
+    down.get_available_tools()["move_to_location"].execute(x=10, y=18)
+    _run_without_collisions(simulation, [across, down], 100)
+
+    assert across.location == Location(x=18, y=10)
+    assert down.location == Location(x=10, y=18)
+    assert len(simulation.world.reservations) == 0
+
+def test_stock_droids_pass_head_on(simulation: Simulation):
+    west = GonkDroid(location=Location(x=2, y=10))
+    east = GonkDroid(location=Location(x=12, y=10))
+    simulation.world.add_entity(west)
+    simulation.world.add_entity(east)
+
+    west.get_available_tools()["move_to_location"].execute(x=12, y=10)
+    east.get_available_tools()["move_to_location"].execute(x=2, y=10)
+    _run_without_collisions(simulation, [west, east], 100)
+
+    assert west.location == Location(x=12, y=10)
+    assert east.location == Location(x=2, y=10)
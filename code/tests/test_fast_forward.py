@@ -0,0 +1,86 @@
+import pytest
+from simulation.core.entity.component.Motivator import Motivator
+from simulation.core.entity.component.PowerPack import PowerPack
+from simulation.core.entity.component.WaterTank import WaterTank
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.PowerStationModels import SolarPowerStation
+from simulation.equipment.VaporatorModels import GX1_Vaporator, GX8_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def _state(simulation: Simulation):
+    state = {"tick_count": simulation.tick_count, "current_tick": simulation.world.current_tick}
+    for entity in simulation.world.entities.values():
+        for component in entity.components:
+            state[component.id] = component.model_dump(exclude={'chassis', 'storage_parent'})
+            state[component.id]["current_cooldown"] = getattr(component, "current_cooldown", None)
+    return state
+
+def _build_farm(simulation: Simulation):
+    # Vaporators that will fill up, run out of power, or keep going; a station that recharges; an idle droid
+    for i, (vaporator_type, charge, fill) in enumerate([(GX1_Vaporator, 1000, 0), (GX8_Vaporator, 7, 0), (GX1_Vaporator, 50, 0), (GX8_Vaporator, 1000, 0)]):
+        vaporator = vaporator_type(location=Location(x=10 * i, y=0))
+        vaporator.get_component(PowerPack).charge = charge
+        tank = vaporator.get_component(WaterTank)
+        tank.fill = tank.capacity - 3 if i == 2 else fill
+        simulation.world.add_entity(vaporator)
+    station = SolarPowerStation(location=Location(x=0, y=20))
+    station.get_component(PowerPack).charge = 0
+    simulation.world.add_entity(station)
+    simulation.world.add_entity(GonkDroid(location=Location(x=20, y=20)))
+
+@pytest.mark.parametrize("ticks", [1, 2, 7, 50, 333, 5000])
+def test_fast_forward_matches_ticking(simulation: Simulation, ticks: int):
+    _build_farm(simulation)
+    simulation.run_sync(ticks=3)  # Let things settle into their cooldowns
+
+    ticked = simulation.fork()
+    ticked.run_sync(ticks=ticks, headless=True)
+
+    simulation.idle_fast_forward = True
+    simulation.run_sync(ticks=ticks, headless=True)
+
+    assert _state(simulation) == _state(ticked)
+
+def test_fast_forward_skips_ticks(simulation: Simulation):
+    _build_farm(simulation)
+    simulation.run_sync(ticks=3)
+
+    stepped = []
+    simulation.subscribe_on_tick(lambda sim: stepped.append(sim.tick_count))
+    simulation.idle_fast_forward = True
+    stats = simulation.run_sync(ticks=1000, headless=True)
+
+    assert stats.ticks == 1000
+    assert simulation.tick_count == 1003
+    assert simulation.world.current_tick == 1002
+    # Vaporators and solar panels are all skipped over in one go; only the last tick is stepped
+    assert stepped == [1003]
+
+def test_fast_forward_blocked_by_moving_droid(simulation: Simulation):
+    _build_farm(simulation)
+    droid = simulation.world.get_entity(GonkDroid)
+    simulation.run_sync(ticks=1)
+    assert simulation.world.fast_forward(10) == 10
+
+    droid.get_component(Motivator).move_to_location(40, 20)
+    assert simulation.world.fast_forward(10) == 0
+
+def test_fast_forward_stops_before_other_timers(simulation: Simulation):
+    _build_farm(simulation)
+    simulation.run_sync(ticks=1)
+    fired = []
+    simulation.world.schedule(simulation.world.current_tick + 5, fired.append, "due")
+
+    assert simulation.world.fast_forward(100) == 4
+    simulation.step()
+    assert fired == ["due"]
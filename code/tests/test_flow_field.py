@@ -0,0 +1,105 @@
+import pytest
+from simulation.core.entity.Entity import Location
+from simulation.core.pathfinding.AStar import AStar
+from simulation.core.pathfinding.FlowField import FlowField, FlowFieldCache
+from simulation.core.Simulation import Simulation
+from simulation.core.tiles.Tilemap import Tilemap
+from simulation.core.tiles.TileTypes import TileType
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.PowerStationModels import PowerStation
+from simulation.GlobalConfig import GlobalConfig
+
+ROCK = 1
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def _path_cost(tilemap: Tilemap, path):
+    return sum(tilemap.move_cost(step.x, step.y) for step in path)
+
+def _maze() -> Tilemap:
+    tilemap = Tilemap.from_default()
+    tilemap.register_tile_type(TileType(id=3, name="mud", passable=True, move_speed_scalar=0.5))
+    for y in range(1, 60):
+        tilemap.set_tile(20, y, ROCK)
+    for y in range(30, 127):
+        tilemap.set_tile(40, y, ROCK)
+    for x in range(50, 70):
+        tilemap.set_tile(x, 50, 3)
+    return tilemap
+
+def test_flow_field_paths_are_as_cheap_as_astar():
+    tilemap = _maze()
+    goal = Location(60, 60)
+    field = FlowField(tilemap, goal)
+    astar = AStar(tilemap)
+
+    for start in (Location(2, 2), Location(30, 100), Location(60, 40), Location(126, 126), Location(60, 60)):
+        optimal = astar.find_path(start, goal)
+        path = field.path_from(start)
+        assert (path is None) == (optimal is None)
+        if path:
+            assert path[-1] == goal
+            assert _path_cost(tilemap, path) == pytest.approx(_path_cost(tilemap, optimal))
+            assert field.cost_from(start) == pytest.approx(_path_cost(tilemap, path))
+            assert field.next_step(start) == path[0]
+    assert field.path_from(goal) == []
+    assert field.path_from(Location(0, 5)) is not None  # Stuck on the border rock, but can step off it
+    assert FlowField(tilemap, Location(20, 20)).path_from(Location(2, 2)) is None  # Rock
+
+def test_flow_fields_are_built_for_popular_destinations_only():
+    tilemap = _maze()
+    cache = FlowFieldCache(tilemap, threshold=3, max_fields=2)
+    popular = Location(60, 60)
+
+    assert cache.get(popular) is None
+    assert cache.get(popular) is None
+    assert cache.get(popular) is not None
+    assert cache.get(popular) is not None
+    assert cache.fields_built == 1
+
+    # Changing the map drops the field; it is rebuilt on the next query
+    tilemap.set_tile(61, 60, ROCK)
+    assert popular not in cache
+    assert cache.get(popular) is not None
+    assert cache.fields_built == 2
+
+    # When full, the least asked-for destination loses its field
+    for goal in (Location(10, 10), Location(100, 100)):
+        for _ in range(3):
+            cache.get(goal)
+    assert len(cache) == 2
+    assert popular in cache
+    assert Location(100, 100) in cache
+
+def test_world_shares_flow_fields_between_droids(simulation: Simulation):
+    world = simulation.world
+    world.tilemap = _maze()
+    station = PowerStation(location=Location(x=60, y=60))
+    world.add_entity(station)
+
+    paths = [world.find_path(Location(2, y), station.location) for y in range(2, 8)]
+    assert all(path[-1] == station.location for path in paths)
+    assert station.location in world.flow_fields
+    assert world.flow_fields.fields_built == 1
+
+    # Droids moving around (even through popular destinations) leave the fields alone
+    droid = GonkDroid(location=Location(x=2, y=2))
+    world.add_entity(droid)
+    for y in range(3, 6):
+        world.find_path(Location(2, y), droid.location)
+    assert droid.location in world.flow_fields
+    for x in range(3, 8):
+        droid.location = Location(x=x, y=2)
+    world.remove_entity(droid)
+    assert Location(2, 2) in world.flow_fields
+    assert station.location in world.flow_fields
+    assert world.flow_fields.fields_built == 2
+
+    # Moving the destination drops its field
+    station.location = Location(x=70, y=70)
+    assert Location(60, 60) not in world.flow_fields
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+from simulation.core.entity.component.DroidAgent import DroidAgent
+from simulation.core.entity.component.WaterTank import WaterTank
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+from simulation.llm.QueuedWebRequest import QueuedHttpRequest
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    # A large delay would make this test take minutes if headless mode did not skip it.
+    sim = Simulation(simulation_delay=10.0, simulation_delay_max=10.0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_headless_runs_back_to_back(simulation: Simulation):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+
+    stats = simulation.run_sync(ticks=100, headless=True)
+
+    assert stats.ticks == 100
+    assert simulation.tick_count == 100
+    assert stats.elapsed_seconds < 10.0
+    assert stats.ticks_per_second > 0
+    assert stats.llm_wait_seconds == 0
+
+    tank: WaterTank = vaporator.get_component(WaterTank)
+    assert tank.fill == tank.capacity
+
+def test_headless_waits_for_outstanding_llm_response(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=5, y=5))
+    simulation.world.add_entity(droid)
+    agent: DroidAgent = droid.get_component(DroidAgent)
+
+    # Simulate an LLM request that takes a little while to come back.
+    request = QueuedHttpRequest("http://example.com/api")
+    request.in_progress = True
+    agent.queued_http_request = request
+    agent.is_active = True
+
+    def respond():
+        request.response = {"error": "mocked"}
+        request.in_progress = False
+    timer = threading.Timer(0.2, respond)
+    timer.start()
+
+    stats = simulation.run_sync(ticks=3, headless=True)
+    timer.join()
+
+    assert stats.ticks == 3
+    assert stats.llm_wait_seconds >= 0.1
+    # The world must not have advanced while the agent was thinking.
+    assert agent.queued_http_request is None
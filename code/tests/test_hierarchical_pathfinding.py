@@ -0,0 +1,143 @@
+import random
+
+import pytest
+from simulation.core.entity.Chassis import Chassis
+from simulation.core.entity.component.Motivator import AStarMotivator, Motivator
+from simulation.core.entity.component.PowerPack import PowerPack
+from simulation.core.entity.ComponentSlot import ComponentSlot
+from simulation.core.entity.Entity import Location
+from simulation.core.pathfinding.AStar import AStar
+from simulation.core.pathfinding.HierarchicalPathfinder import HierarchicalPathfinder
+from simulation.core.Simulation import Simulation
+from simulation.core.tiles.Tilemap import Tilemap
+from simulation.GlobalConfig import GlobalConfig
+
+ROCK = 1
+SAND = 0
+
+class PathfindingDroid(Chassis):
+    slots: dict = {
+        "power_pack": ComponentSlot(accepts=PowerPack, default_component=PowerPack),
+        "motivator": ComponentSlot(accepts=Motivator, default_component=AStarMotivator),
+    }
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def _random_rocks(tilemap: Tilemap, count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        tilemap.set_tile(rng.randrange(1, tilemap.width - 1), rng.randrange(1, tilemap.height - 1), ROCK)
+
+def _large_tilemap(size: int) -> Tilemap:
+    tilemap = Tilemap.from_default()
+    tilemap.width = tilemap.height = size
+    tilemap.tiles = [[ROCK if x in (0, size - 1) or y in (0, size - 1) else SAND for x in range(size)] for y in range(size)]
+    tilemap.touch()
+    return tilemap
+
+def _path_cost(tilemap: Tilemap, path):
+    return sum(tilemap.move_cost(step.x, step.y) for step in path)
+
+def _assert_walkable(tilemap: Tilemap, start: Location, path):
+    previous = start
+    for step in path:
+        assert tilemap.is_passable(step.x, step.y)
+        assert previous.distance_to(step) == 1
+        previous = step
+
+def test_tilemap_change_log():
+    tilemap = Tilemap.from_default()
+    version = tilemap.version
+    assert tilemap.changes_since(version) == set()
+    tilemap.set_tile(3, 4, ROCK)
+    tilemap.set_tile(5, 6, ROCK)
+    tilemap.set_tile(5, 6, ROCK)  # No change
+    assert tilemap.version == version + 2
+    assert tilemap.changes_since(version) == {(3, 4), (5, 6)}
+    assert tilemap.changes_since(version + 1) == {(5, 6)}
+    tilemap.touch()
+    assert tilemap.changes_since(version + 2) is None
+
+def test_hierarchical_paths_match_astar():
+    tilemap = Tilemap.from_default()
+    _random_rocks(tilemap, 2500)
+    astar = AStar(tilemap)
+    hierarchical = HierarchicalPathfinder(tilemap, cluster_size=16)
+
+    rng = random.Random(3)
+    for _ in range(40):
+        start = Location(rng.randrange(1, 127), rng.randrange(1, 127))
+        goal = Location(rng.randrange(1, 127), rng.randrange(1, 127))
+        optimal = astar.find_path(start, goal)
+        path = hierarchical.find_path(start, goal)
+        assert (path is None) == (optimal is None)
+        if path:
+            assert path[-1] == goal
+            _assert_walkable(tilemap, start, path)
+            assert _path_cost(tilemap, path) <= 1.5 * _path_cost(tilemap, optimal)
+
+def test_hierarchical_updates_only_changed_clusters():
+    tilemap = Tilemap.from_default()
+    hierarchical = HierarchicalPathfinder(tilemap, cluster_size=16)
+    start, goal = Location(2, 40), Location(120, 40)
+    assert hierarchical.find_path(start, goal)[-1] == goal
+
+    # Wall off the goal, apart from one gap
+    rebuilt = hierarchical.clusters_rebuilt
+    for y in range(1, 127):
+        if y != 100:
+            tilemap.set_tile(100, y, ROCK)
+    path = hierarchical.find_path(start, goal)
+    assert Location(100, 100) in path
+    _assert_walkable(tilemap, start, path)
+    # Only the column of clusters holding the wall, and their neighbours, were rebuilt
+    assert hierarchical.clusters_rebuilt - rebuilt <= 3 * 8
+
+    tilemap.set_tile(100, 100, ROCK)
+    assert hierarchical.find_path(start, goal) is None
+
+def test_world_uses_hierarchical_pathfinding_on_large_maps(simulation: Simulation, monkeypatch):
+    monkeypatch.setattr(GlobalConfig, "path_cache_size", 0)
+    world = simulation.world
+    world.tilemap = Tilemap.from_default()
+    start, goal = Location(2, 2), Location(100, 90)
+
+    assert world.find_path(start, goal)[-1] == goal
+    assert world.hierarchical_pathfinder.nodes_expanded == 0
+
+    monkeypatch.setattr(GlobalConfig, "hierarchical_pathfinding_min_tiles", 64 * 64)
+    path = world.find_path(start, goal)
+    assert path[-1] == goal
+    assert len(path) == start.distance_to(goal)
+    assert world.hierarchical_pathfinder.nodes_expanded > 0
+
+def test_droid_crosses_a_large_map_hierarchically(simulation: Simulation):
+    # At the default settings, a map this size is searched with HPA* rather than A*
+    assert 256 * 256 >= GlobalConfig.hierarchical_pathfinding_min_tiles
+    tilemap = _large_tilemap(256)
+    _random_rocks(tilemap, 6000)
+    for y in range(1, 255):
+        if y not in (40, 200):
+            tilemap.set_tile(128, y, ROCK)
+    world = simulation.world
+    world.tilemap = tilemap
+    start, goal = Location(3, 120), Location(250, 130)
+    tilemap.set_tile(start.x, start.y, SAND)
+    tilemap.set_tile(goal.x, goal.y, SAND)
+    droid = PathfindingDroid(location=start)
+    world.add_entity(droid)
+
+    droid.get_available_tools()["move_to_location"].execute(x=goal.x, y=goal.y)
+    path = list(droid.get_component(Motivator).path_to_destination)
+    assert world.hierarchical_pathfinder.nodes_expanded > 0
+    assert path[-1] == goal
+    _assert_walkable(tilemap, start, path)
+    assert _path_cost(tilemap, path) <= 1.1 * _path_cost(tilemap, AStar(tilemap).find_path(start, goal))
+
+    simulation.run_sync(ticks=len(path) * 3, headless=True)
+    assert droid.location == goal
@@ -0,0 +1,50 @@
+import copy
+import pickle
+
+import pytest
+from simulation.core.entity.component.Motivator import Motivator
+from simulation.core.entity.Entity import Entity, Location, Rectangle
+from simulation.core.Simulation import Simulation
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_location_is_an_immutable_value():
+    a = Location(x=1, y=2)
+    assert a == Location(1, 2)
+    assert a != Location(2, 1)
+    assert len({a, Location(1, 2), Location(2, 1)}) == 2
+    assert a + Location(1, 1) == Location(2, 3)
+    assert a - Location(1, 1) == Location(0, 1)
+    assert a.distance_to(Location(4, 0)) == 5
+    assert repr(a) == "Location(x=1, y=2)"
+
+    with pytest.raises(AttributeError):
+        a.x = 5
+
+    assert pickle.loads(pickle.dumps(a)) == a
+    assert copy.deepcopy(a) == a
+
+def test_rectangle_intersects():
+    r = Rectangle(x=0, y=0, width=2, height=2)
+    assert r.intersects(Rectangle(1, 1, 2, 2))
+    assert not r.intersects(Rectangle(2, 0, 1, 1))
+    assert hash(r) == hash(Rectangle(0, 0, 2, 2))
+
+def test_models_validate_and_serialize_locations(simulation: Simulation):
+    entity = Entity(location={"x": 3, "y": "4"})
+    assert entity.location == Location(3, 4)
+    assert entity.model_dump(include={'location'}) == {"location": {"x": 3, "y": 4}}
+
+    motivator = Motivator(destination=(5, 6), path_to_destination=[{"x": 4, "y": 6}, Location(5, 6)])
+    assert motivator.destination == Location(5, 6)
+    assert motivator.model_dump(include={'path_to_destination'}) == {"path_to_destination": [{"x": 4, "y": 6}, {"x": 5, "y": 6}]}
+
+    # Default values are still left out of scenario saves
+    assert 'location' not in Entity(location=Location(0, 0)).model_dump(exclude_defaults=True)
@@ -0,0 +1,46 @@
+import pytest
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def _log_everywhere(droid: GonkDroid, count: int):
+    loggers = [droid] + droid.components
+    for i in range(count):
+        loggers[i % len(loggers)].info("message {}", i)
+
+def test_chassis_logs_are_merged_in_order(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    _log_everywhere(droid, 20)
+
+    logs = droid.get_logs()
+    assert [log.message for log in logs] == [f"message {i}" for i in range(20)]
+    # Reading the logs does not change any history
+    assert len(droid.get_logs()) == 20
+    assert len(droid.get_logs(limit=1000)) == 20
+
+def test_chassis_logs_limit_and_since(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    _log_everywhere(droid, 20)
+
+    tail = droid.get_logs(limit=5)
+    assert [log.message for log in tail] == [f"message {i}" for i in range(15, 20)]
+    assert droid.get_logs(limit=0) == []
+
+    # Tail the logs from a cursor
+    cursor = tail[-1].sequence
+    assert droid.get_logs(since=cursor) == []
+    _log_everywhere(droid, 3)
+    assert [log.message for log in droid.get_logs(since=cursor)] == ["message 0", "message 1", "message 2"]
+    assert [log.message for log in droid.get_logs(since=cursor, limit=2)] == ["message 1", "message 2"]
+
+    motivator = droid.components[0]
+    assert [log.message for log in motivator.get_logs(limit=1)] == [motivator.last_message().message]
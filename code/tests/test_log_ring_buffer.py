@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from simulation.core.entity.Entity import Location
+from simulation.core.LogRingBuffer import LogRingBuffer
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_ring_buffer_keeps_most_recent():
+    buffer = LogRingBuffer(maxlen=3)
+    for i in range(5):
+        buffer.append(i)
+
+    assert buffer.to_list() == [2, 3, 4]
+    assert buffer.last() == 4
+    assert buffer.evicted == 2
+
+def test_ring_buffer_spills_evicted_entries(tmp_path):
+    path = tmp_path / "spill" / "entity.jsonl"
+    buffer = LogRingBuffer(maxlen=2, spill_path=str(path))
+    buffer.spill_batch_size = 2
+    for i in range(5):
+        buffer.append({"n": i})
+
+    # Two entries are written as soon as a batch is full, the third on flush
+    assert [json.loads(line)["n"] for line in path.read_text().splitlines()] == [0, 1]
+    buffer.flush()
+    assert [json.loads(line)["n"] for line in path.read_text().splitlines()] == [0, 1, 2]
+    assert [entry["n"] for entry in buffer] == [3, 4]
+
+def test_object_logs_are_bounded(simulation: Simulation, monkeypatch, tmp_path):
+    monkeypatch.setattr(GlobalConfig, "max_log_entries", 10)
+    monkeypatch.setattr(GlobalConfig, "log_spill_dir", str(tmp_path))
+    droid = GonkDroid(location=Location(x=1, y=1))
+    simulation.world.add_entity(droid)
+    for i in range(25):
+        droid.info(f"message {i}")
+
+    logs = droid.get_logs()
+    assert [log.message for log in logs] == [f"message {i}" for i in range(15, 25)]
+    assert droid.last_message().message == "message 24"
+
+    simulation.flush_logs()
+    spilled = [json.loads(line)["message"] for line in (tmp_path / simulation.context.run_id / f"{droid.id}.jsonl").read_text().splitlines()]
+    assert spilled == [f"message {i}" for i in range(15)]
+
+def test_simulations_spill_to_separate_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(GlobalConfig, "max_log_entries", 2)
+    monkeypatch.setattr(GlobalConfig, "log_spill_dir", str(tmp_path))
+    first, second = Simulation(simulation_delay=0), Simulation(simulation_delay=0)
+
+    def add_droid(sim: Simulation, created_in: Simulation, name: str) -> GonkDroid:
+        with created_in.activate():
+            droid = GonkDroid(location=Location(x=1, y=1))
+        with sim.activate():
+            sim.world.add_entity(droid)
+        for i in range(5):
+            droid.info(f"{name} {i}")
+        return droid
+
+    def spilled(sim: Simulation, droid: GonkDroid):
+        sim.flush_logs()
+        path = tmp_path / sim.context.run_id / f"{droid.id}.jsonl"
+        return [json.loads(line)["message"] for line in path.read_text().splitlines() if json.loads(line)["level"] == 0]
+
+    ours = add_droid(first, first, "ours")
+    # A droid numbered by the second simulation clashes with one in the first, so it is renamed there,
+    #  and spills to a file of its own rather than to that of the droid that had the ID first
+    stray = add_droid(first, second, "stray")
+    assert stray.id != ours.id
+    assert spilled(first, stray) == ["stray 0", "stray 1", "stray 2"]
+    assert spilled(first, ours) == ["ours 0", "ours 1", "ours 2"]
+
+    # Objects in different simulations can share an ID, but not a spill file
+    theirs = add_droid(second, second, "theirs")
+    assert theirs.id == stray.id
+    assert first.context.run_id != second.context.run_id
+    assert spilled(second, theirs) == ["theirs 0", "theirs 1", "theirs 2"]
+    assert spilled(first, stray) == ["stray 0", "stray 1", "stray 2"]
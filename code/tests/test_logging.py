@@ -0,0 +1,96 @@
+import io
+import pickle
+
+import pytest
+from simulation.core.entity.Entity import Entity, Location, LogMessage
+from simulation.core.LogSink import LogSink
+from simulation.core.Simulation import Simulation
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+class Unprintable(Location):
+    # Immutable, so kept as it is until the message is read
+    def __format__(self, spec):
+        raise AssertionError("Formatted a message that was never read")
+
+def test_messages_are_formatted_lazily(simulation: Simulation):
+    entity = Entity(location=Location(x=1, y=1))
+    entity.info("Moving to {}", Unprintable(1, 2))
+    entity.info("Charge at {}/{}", 5, 10)
+
+    assert entity.last_message().message == "Charge at 5/10"
+    # Messages without arguments are taken literally
+    entity.info("{not a field}")
+    assert entity.last_message().message == "{not a field}"
+
+def test_mutable_arguments_are_formatted_as_logged(simulation: Simulation):
+    entity = Entity(location=Location(x=1, y=1))
+    state = {"charge": 5}
+    entity.info("State {}", state)
+    state["charge"] = 0
+    assert entity.last_message().message == "State {'charge': 5}"
+
+def test_messages_below_both_levels_are_dropped(simulation: Simulation, monkeypatch):
+    monkeypatch.setattr(GlobalConfig, "log_record_level", 1)
+    entity = Entity(location=Location(x=1, y=1))
+    entity.info("dropped {}", Unprintable(1, 2))
+    entity.warn("kept")
+
+    assert [log.message for log in entity.get_logs()] == ["kept"]
+
+def test_messages_are_stamped_with_the_tick(simulation: Simulation):
+    entity = Entity(location=Location(x=1, y=1))
+    simulation.world.add_entity(entity)
+    entity.info("before")
+    simulation.run_sync(ticks=3)
+    entity.info("after")
+
+    logs = entity.get_logs()
+    assert logs[0].tick == 0
+    assert logs[-1].tick == 3
+    assert [log.sequence for log in logs] == sorted(log.sequence for log in logs)
+
+def test_log_sequence_carries_on_after_restore(simulation: Simulation):
+    entity = Entity(location=Location(x=1, y=1))
+    simulation.world.add_entity(entity)
+    for i in range(5):
+        entity.info("before {}", i)
+    last_seen = entity.last_message().sequence
+    blob = simulation.checkpoint()
+
+    # Another simulation numbers its messages from scratch, as a fresh process would
+    other = Simulation(simulation_delay=0)
+    other_entity = Entity(location=Location(x=1, y=1))
+    other.world.add_entity(other_entity)
+    other_entity.info("elsewhere")
+    assert other_entity.last_message().sequence == 0
+
+    restored = Simulation.restore(blob)
+    restored_entity = restored.world.entities[entity.id]
+    restored_entity.info("after")
+    assert [log.message for log in restored_entity.get_logs(since=last_seen)] == ["after"]
+
+def test_log_messages_survive_pickling():
+    message = LogMessage("Charge at {}", 1, (5,), tick=7)
+    restored = pickle.loads(pickle.dumps(message))
+    assert (restored.message, restored.level, restored.tick, restored.sequence) == ("Charge at 5", 1, 7, message.sequence)
+
+@pytest.mark.parametrize("asynchronous", [True, False])
+def test_log_sink_writes_to_stream_and_file(monkeypatch, tmp_path, asynchronous: bool):
+    monkeypatch.setattr(GlobalConfig, "log_sink_async", asynchronous)
+    log_file = tmp_path / "sim.log"
+    sink = LogSink(log_file=str(log_file))
+    stream = io.StringIO()
+    for i in range(3):
+        sink.emit(LogMessage("message {}", 1, (i,), tick=i), stream)
+    sink.flush()
+
+    assert stream.getvalue().count("message") == 3
+    assert log_file.read_text().splitlines() == [f"[tick {i}] [WARN] message {i}" for i in range(3)]
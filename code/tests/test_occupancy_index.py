@@ -0,0 +1,81 @@
+import pytest
+from simulation.core.entity.Entity import Entity, Location
+from simulation.core.OccupancyIndex import OccupancyIndex
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_occupancy_index_place_and_remove():
+    index = OccupancyIndex()
+    index.place("a", (0, 0, 2, 2))
+    index.place("b", (1, 1, 1, 1))
+
+    assert list(index.at(1, 1)) == ["a", "b"]
+    assert list(index.at(0, 1)) == ["a"]
+    assert not index.is_free((1, 1, 1, 1), ignore="a")
+    assert index.is_free((0, 0, 1, 1), ignore="a")
+
+    index.place("a", (5, 5, 1, 1))
+    assert list(index.at(0, 0)) == []
+    assert list(index.at(1, 1)) == ["b"]
+
+    index.remove("b")
+    assert index.is_free((0, 0, 3, 3))
+    assert len(index) == 1
+
+def test_world_tracks_moves_and_resizes(simulation: Simulation):
+    world = simulation.world
+    droid = GonkDroid(location=Location(x=3, y=4))
+    vaporator = GX1_Vaporator(location=Location(x=10, y=10))
+    world.add_entity(droid)
+    world.add_entity(vaporator)
+
+    assert world.entities_at(3, 4) == [droid]
+    assert not world.is_footprint_free(2, 3, 2, 2)
+
+    droid.location = Location(x=6, y=4)
+    assert world.entities_at(3, 4) == []
+    assert world.entities_at(6, 4) == [droid]
+
+    vaporator.size = (2, 2)
+    assert world.entities_at(11, 11) == [vaporator]
+
+    world.remove_entity(vaporator)
+    assert world.entities_at(10, 10) == []
+    # Entities that have left the world no longer update its index
+    vaporator.location = Location(x=6, y=4)
+    assert world.entities_at(6, 4) == [droid]
+
+def test_is_passable_checks_the_target_footprint(simulation: Simulation):
+    world = simulation.world
+    droid = GonkDroid(location=Location(x=3, y=3))
+    blocker = Entity(location=Location(x=5, y=3), size=(2, 1))
+    world.add_entity(droid)
+    world.add_entity(blocker)
+
+    assert world.is_passable(droid, 3, 3)  # Does not collide with itself
+    assert world.is_passable(droid, 4, 3)
+    assert not world.is_passable(droid, 5, 3)
+    assert not world.is_passable(droid, 6, 3)
+    assert world.is_passable(blocker, 5, 3)
+    assert not world.is_passable(blocker, 2, 3)
+
+def test_motivator_moves_update_index(simulation: Simulation):
+    world = simulation.world
+    droid = GonkDroid(location=Location(x=1, y=1))
+    world.add_entity(droid)
+    droid.get_component("motivator").move_to_location(3, 1)
+    simulation.run_sync(ticks=60)
+
+    assert droid.location == Location(x=3, y=1)
+    assert world.entities_at(3, 1) == [droid]
+    assert world.entities_at(1, 1) == []
@@ -0,0 +1,100 @@
+import pytest
+from simulation.core.entity.Entity import Location
+from simulation.core.pathfinding.AStar import AStar
+from simulation.core.pathfinding.PathCache import PathCache
+from simulation.core.Simulation import Simulation
+from simulation.core.tiles.Tilemap import Tilemap
+from simulation.GlobalConfig import GlobalConfig
+
+ROCK = 1
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+class CountingPathfinder:
+    def __init__(self, tilemap: Tilemap):
+        self.astar = AStar(tilemap)
+        self.calls = 0
+
+    def __call__(self, start: Location, goal: Location, size):
+        self.calls += 1
+        return self.astar.find_path(start, goal, size)
+
+def test_path_cache_hits_and_misses():
+    tilemap = Tilemap.from_default()
+    pathfinder = CountingPathfinder(tilemap)
+    cache = PathCache(tilemap, max_entries=8)
+    start, goal = Location(2, 2), Location(20, 10)
+
+    path = cache.get_or_compute(start, goal, (1, 1), pathfinder)
+    path.pop(0)  # Callers may consume their copy
+    again = cache.get_or_compute(start, goal, (1, 1), pathfinder)
+    assert again == pathfinder.astar.find_path(start, goal)
+    assert pathfinder.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Different footprints are different queries
+    cache.get_or_compute(start, goal, (2, 2), pathfinder)
+    assert pathfinder.calls == 2
+
+    # Unreachable goals are remembered too
+    assert cache.get_or_compute(start, Location(0, 5), (1, 1), pathfinder) is None
+    assert cache.get_or_compute(start, Location(0, 5), (1, 1), pathfinder) is None
+    assert pathfinder.calls == 3
+    assert cache.stats()["hit_rate"] == pytest.approx(2 / 5)
+
+def test_path_cache_serves_suffixes_of_cached_paths():
+    tilemap = Tilemap.from_default()
+    pathfinder = CountingPathfinder(tilemap)
+    cache = PathCache(tilemap)
+    start, goal = Location(2, 2), Location(20, 10)
+    path = cache.get_or_compute(start, goal, (1, 1), pathfinder)
+
+    midway = path[5]
+    assert cache.get_or_compute(midway, goal, (1, 1), pathfinder) == path[6:]
+    assert cache.suffix_hits == 1
+    assert pathfinder.calls == 1
+
+def test_path_cache_is_dropped_when_the_map_changes():
+    tilemap = Tilemap.from_default()
+    pathfinder = CountingPathfinder(tilemap)
+    cache = PathCache(tilemap)
+    start, goal = Location(2, 2), Location(20, 2)
+    path = cache.get_or_compute(start, goal, (1, 1), pathfinder)
+
+    blocked = path[3]
+    tilemap.set_tile(blocked.x, blocked.y, ROCK)
+    new_path = cache.get_or_compute(start, goal, (1, 1), pathfinder)
+    assert blocked not in new_path
+    assert pathfinder.calls == 2
+
+def test_path_cache_evicts_least_recently_used():
+    tilemap = Tilemap.from_default()
+    pathfinder = CountingPathfinder(tilemap)
+    cache = PathCache(tilemap, max_entries=2)
+    first, second, third = Location(10, 10), Location(20, 20), Location(30, 30)
+    start = Location(2, 2)
+
+    first_path = cache.get_or_compute(start, first, (1, 1), pathfinder)
+    cache.get_or_compute(start, second, (1, 1), pathfinder)
+    cache.get_or_compute(start, first, (1, 1), pathfinder)
+    cache.get_or_compute(start, third, (1, 1), pathfinder)  # Evicts the path to `second`
+    assert len(cache) == 2
+
+    calls = pathfinder.calls
+    cache.get_or_compute(start, first, (1, 1), pathfinder)
+    cache.get_or_compute(first_path[3], first, (1, 1), pathfinder)
+    assert pathfinder.calls == calls
+    cache.get_or_compute(start, second, (1, 1), pathfinder)
+    assert pathfinder.calls == calls + 1
+
+def test_world_find_path_uses_the_cache(simulation: Simulation):
+    world = simulation.world
+    start, goal = Location(2, 2), Location(30, 40)
+    path = world.find_path(start, goal)
+    assert world.find_path(start, goal) == path
+    assert world.path_cache.hits == 1
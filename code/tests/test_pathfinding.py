@@ -0,0 +1,114 @@
+import pytest
+from simulation.core.entity.Chassis import Chassis
+from simulation.core.entity.component.Motivator import AStarMotivator, Motivator
+from simulation.core.entity.component.PowerPack import PowerPack
+from simulation.core.entity.ComponentSlot import ComponentSlot
+from simulation.core.entity.Entity import Location
+from simulation.core.pathfinding.AStar import AStar
+from simulation.core.Simulation import Simulation
+from simulation.core.tiles.Tilemap import Tilemap
+from simulation.core.tiles.TileTypes import TileType
+from simulation.GlobalConfig import GlobalConfig
+
+ROCK = 1
+
+class PathfindingDroid(Chassis):
+    slots: dict = {
+        "power_pack": ComponentSlot(accepts=PowerPack, default_component=PowerPack),
+        "motivator": ComponentSlot(accepts=Motivator, default_component=AStarMotivator),
+    }
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def _wall(tilemap: Tilemap, x: int, y_from: int, y_to: int):
+    for y in range(y_from, y_to + 1):
+        tilemap.set_tile(x, y, ROCK)
+
+def _assert_walkable(tilemap: Tilemap, start: Location, path):
+    previous = start
+    for step in path:
+        assert tilemap.is_passable(step.x, step.y)
+        assert previous.distance_to(step) == 1
+        previous = step
+
+def test_astar_goes_around_walls():
+    tilemap = Tilemap.from_default()
+    _wall(tilemap, 5, 1, 8)
+    pathfinder = AStar(tilemap)
+
+    start, goal = Location(2, 2), Location(8, 2)
+    path = pathfinder.find_path(start, goal)
+    assert path[-1] == goal
+    _assert_walkable(tilemap, start, path)
+    # Down past the end of the wall and back up again
+    assert len(path) == 6 + 2 * 7
+
+def test_astar_prefers_faster_ground():
+    tilemap = Tilemap.from_default()
+    tilemap.register_tile_type(TileType(id=3, name="mud", passable=True, move_speed_scalar=0.25))
+    for x in range(3, 8):
+        tilemap.set_tile(x, 5, 3)
+    pathfinder = AStar(tilemap)
+
+    start, goal = Location(2, 5), Location(8, 5)
+    path = pathfinder.find_path(start, goal)
+    assert path[-1] == goal
+    _assert_walkable(tilemap, start, path)
+    assert all(tilemap.tiles[step.y][step.x] != 3 for step in path)
+
+def test_astar_rejects_unreachable_goals_without_searching():
+    tilemap = Tilemap.from_default()
+    # Wall off a pocket in the corner
+    _wall(tilemap, 4, 1, 3)
+    for x in range(1, 4):
+        tilemap.set_tile(x, 4, ROCK)
+    pathfinder = AStar(tilemap)
+
+    assert pathfinder.find_path(Location(10, 10), Location(2, 2)) is None
+    assert pathfinder.nodes_expanded == 0
+    assert pathfinder.find_path(Location(10, 10), Location(0, 5)) is None  # A rock tile
+    assert pathfinder.find_path(Location(10, 10), Location(-1, 5)) is None  # Off the map
+
+    # Opening the pocket up again is picked up through the tilemap's version
+    tilemap.set_tile(4, 2, 0)
+    path = pathfinder.find_path(Location(10, 10), Location(2, 2))
+    assert path[-1] == Location(2, 2)
+
+def test_astar_footprints():
+    tilemap = Tilemap.from_default()
+    # A one-tile gap in a wall: too narrow for a 2x2 entity
+    _wall(tilemap, 5, 1, 126)
+    tilemap.set_tile(5, 10, 0)
+    pathfinder = AStar(tilemap)
+
+    assert pathfinder.find_path(Location(2, 10), Location(8, 10)) is not None
+    assert pathfinder.find_path(Location(2, 10), Location(8, 10), size=(2, 2)) is None
+
+def test_astar_motivator_avoids_rocks(simulation: Simulation):
+    tilemap = Tilemap.from_default()
+    _wall(tilemap, 5, 1, 8)
+    simulation.world.tilemap = tilemap
+    droid = PathfindingDroid(location=Location(x=2, y=2))
+    simulation.world.add_entity(droid)
+
+    droid.get_available_tools()["move_to_location"].execute(x=8, y=2)
+    simulation.run_sync(ticks=60)
+    assert droid.location == Location(x=8, y=2)
+    assert droid.get_component(Motivator).last_block_reason is None
+
+def test_astar_motivator_gives_up_on_unreachable_destinations(simulation: Simulation):
+    droid = PathfindingDroid(location=Location(x=2, y=2))
+    simulation.world.add_entity(droid)
+    motivator = droid.get_component(Motivator)
+
+    droid.get_available_tools()["move_to_location"].execute(x=0, y=5)
+    assert motivator.path_to_destination == []
+    simulation.run_sync(ticks=2)
+    assert motivator.destination is None
+    assert motivator.last_block_reason == "no_path"
+    assert droid.location == Location(x=2, y=2)
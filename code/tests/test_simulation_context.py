@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from simulation.core.entity.component.Chronometer import Chronometer
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_newest_simulation_is_current(simulation: Simulation):
+    assert Simulation.get_instance() is simulation
+    other = Simulation(simulation_delay=0)
+    assert Simulation.get_instance() is other
+    assert other.world is not simulation.world
+    assert other.world.simulation is other
+
+    simulation.make_current()
+    assert Simulation.get_instance() is simulation
+
+def test_ids_are_numbered_per_simulation(simulation: Simulation):
+    other = Simulation(simulation_delay=0)
+    with simulation.activate():
+        assert Simulation.get_instance() is simulation
+        first = GX1_Vaporator(location=Location(x=1, y=1))
+    with other.activate():
+        second = GX1_Vaporator(location=Location(x=1, y=1))
+    assert Simulation.get_instance() is other
+
+    assert first.id == second.id == "GX1_Vaporator_1"
+
+def test_clashing_ids_are_renumbered(simulation: Simulation):
+    first = GX1_Vaporator(location=Location(x=1, y=1))
+    second = GX1_Vaporator(id=first.id, location=Location(x=5, y=5))
+    simulation.world.add_entity(first)
+    simulation.world.add_entity(second)
+
+    assert second.id != first.id
+    assert simulation.world.get_entity(first.id) is first
+    assert simulation.world.get_entity(second.id) is second
+
+def test_components_use_their_own_simulation(simulation: Simulation):
+    other = Simulation(simulation_delay=0)
+    other.run_sync(ticks=100)
+
+    droid = GonkDroid(location=Location(x=1, y=1))
+    simulation.world.add_entity(droid)
+    chronometer = Chronometer(chassis=droid)
+
+    # `other` is current, but the droid lives in `simulation`, which is still at tick 0
+    chronometer.sleep(5)
+    assert chronometer.wake_time == 5
+
+def test_concurrent_simulations_stay_isolated(simulation: Simulation):
+    other = Simulation(simulation_delay=0)
+    seen = {id(simulation): set(), id(other): set()}
+
+    def on_tick(sim: Simulation):
+        seen[id(sim)].add(id(Simulation.get_instance()))
+
+    simulation.subscribe_on_tick(on_tick)
+    other.subscribe_on_tick(on_tick)
+
+    async def run_both():
+        await asyncio.gather(simulation.run(ticks=20, headless=True), other.run(ticks=30, headless=True))
+
+    asyncio.new_event_loop().run_until_complete(run_both())
+
+    assert simulation.tick_count == 20
+    assert other.tick_count == 30
+    assert seen[id(simulation)] == {id(simulation)}
+    assert seen[id(other)] == {id(other)}
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.core.SpatialHash import SpatialHash
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+@pytest.mark.parametrize("cell_size", [1, 4, 16])
+def test_spatial_hash_matches_sorting(cell_size: int):
+    rng = random.Random(cell_size)
+    spatial = SpatialHash(cell_size)
+    positions = {}
+    for i in range(200):
+        positions[f"e{i}"] = (rng.randrange(-50, 50), rng.randrange(-50, 50))
+        spatial.place(f"e{i}", *positions[f"e{i}"])
+    for i in range(0, 200, 3):
+        spatial.remove(f"e{i}")
+        del positions[f"e{i}"]
+    order = {entity_id: n for n, entity_id in enumerate(positions)}
+
+    for _ in range(50):
+        x, y = rng.randrange(-80, 80), rng.randrange(-80, 80)
+        for k, max_distance in [(1, None), (5, None), (3, 20), (1000, 30)]:
+            expected = sorted(((abs(px - x) + abs(py - y), order[entity_id], entity_id) for entity_id, (px, py) in positions.items()))
+            expected = [(d, entity_id) for d, _, entity_id in expected if max_distance is None or d <= max_distance][:k]
+            assert spatial.nearest(x, y, k, max_distance, order.__getitem__) == expected
+
+def test_world_nearest(simulation: Simulation):
+    world = simulation.world
+    far = GX1_Vaporator(location=Location(x=40, y=40))
+    near = GX1_Vaporator(location=Location(x=5, y=5))
+    tied = GX1_Vaporator(location=Location(x=3, y=7))
+    droid = GonkDroid(location=Location(x=4, y=4))
+    for entity in (far, near, tied, droid):
+        world.add_entity(entity)
+
+    origin = Location(x=4, y=6)
+    # near and tied are equidistant; near was added first
+    assert world.nearest("GX1_Vaporator", origin) == [near]
+    assert world.nearest("GX1_Vaporator", origin, k=3) == [near, tied, far]
+    assert world.nearest("GX1_Vaporator", origin, k=3, max_distance=10) == [near, tied]
+    assert world.nearest(far.id, origin) == [far]
+    assert world.nearest(far.id, origin, max_distance=10) == []
+    assert world.nearest("Nothing", origin) == []
+
+    # Moving and removing entities keeps the index up to date
+    far.location = Location(x=4, y=5)
+    assert world.nearest("GX1_Vaporator", origin) == [far]
+    world.remove_entity(far)
+    assert world.nearest("GX1_Vaporator", origin) == [near]
@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.core.StateDumper import StateDumper
+from simulation.core.tiles.Tilemap import Tilemap
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_only_changed_states_are_written(simulation: Simulation, tmp_path):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    dumper = StateDumper(directory=str(tmp_path))
+
+    # The vaporator fills its tank (50 ticks), after which the world stops changing
+    for _ in range(60):
+        simulation.step()
+        dumper.dump(simulation)
+    dumper.flush()
+
+    assert dumper.dumps_written == 50
+    assert dumper.dumps_skipped == 10
+    assert dumper.dumps_dropped == 0
+    assert os.path.exists(tmp_path / "world_state_50.json")
+    assert not os.path.exists(tmp_path / "world_state_51.json")
+
+    # Output is compact and round-trips
+    with open(tmp_path / "sim_state_50.json") as f:
+        text = f.read()
+    assert "\n" not in text
+    state = json.loads(text)
+    assert state["tick_count"] == 50
+
+def test_full_queue_drops_without_blocking(simulation: Simulation, tmp_path):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    dumper = StateDumper(directory=str(tmp_path), queue_size=1)
+    # Never start the writer thread, so the queue cannot drain
+    dumper._ensure_writer = lambda: None
+
+    simulation.step()
+    assert dumper.dump(simulation)
+    simulation.step()
+    assert not dumper.dump(simulation)
+    assert dumper.dumps_dropped == 1
+
+def test_tilemap_only_dumped_when_changed(simulation: Simulation, tmp_path):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    dumper = StateDumper(directory=str(tmp_path))
+    tilemap = simulation.world.tilemap = Tilemap.from_default()
+
+    for _ in range(3):
+        simulation.step()
+        dumper.dump(simulation)
+    tilemap.set_tile(0, 0, 2 if tilemap.tiles[0][0] != 2 else 1)
+    simulation.step()
+    dumper.dump(simulation)
+    dumper.flush()
+
+    def load(tick):
+        with open(tmp_path / f"sim_state_{tick}.json") as f:
+            return json.load(f)
+    assert "tilemap" in load(1)["world"]
+    assert "tilemap" not in load(2)["world"]
+    assert "tilemap" not in load(3)["world"]
+    assert load(4)["world"]["tilemap"]["tiles"][0][0] == tilemap.tiles[0][0]
+
+def test_tilemap_json_is_a_snapshot(simulation: Simulation):
+    tilemap = simulation.world.tilemap = Tilemap.from_default()
+    state = tilemap.to_json()
+    original = state["tiles"][0][0]
+    tilemap.set_tile(0, 0, 2 if original != 2 else 1)
+    assert state["tiles"][0][0] == original
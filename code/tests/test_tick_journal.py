@@ -0,0 +1,131 @@
+import json
+import os
+
+import pytest
+from simulation.core.entity.component.WaterTank import WaterTank
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.core.StateDumper import JournalStateDumper
+from simulation.core.tiles.Tilemap import Tilemap
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+from simulation.journal import JsonDiff
+from simulation.journal.TickJournal import TickJournalReader, TickJournalWriter
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def normalized(state):
+    return json.loads(json.dumps(state, default=str))
+
+def test_json_diff_round_trip():
+    old = {"a": 1, "b": {"c": [1, 2, 3], "d": "x"}, "gone": True}
+    new = {"a": 2, "b": {"c": [1, 5, 3], "d": "x", "e": None}, "list": [1, 2]}
+    ops = JsonDiff.diff(old, new)
+    assert ["del", ["gone"]] in ops
+    assert JsonDiff.apply(json.loads(json.dumps(old)), ops) == new
+    assert JsonDiff.diff(new, new) == []
+
+def test_replay_matches_recorded_states(simulation: Simulation, tmp_path):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    path = str(tmp_path / "journal.jsonl")
+    writer = TickJournalWriter(path, keyframe_interval=10)
+
+    recorded = {}
+    for _ in range(45):
+        simulation.step()
+        state = simulation.to_json()
+        writer.append(simulation.tick_count, state)
+        recorded[simulation.tick_count] = normalized(state)
+    writer.close()
+
+    reader = TickJournalReader(path)
+    assert [tick for tick, _ in reader.keyframes] == [1, 11, 21, 31, 41]
+    for tick in (1, 9, 10, 11, 27, 45):
+        assert reader.state_at(tick) == recorded[tick]
+    # Ticks past the end return the last recorded state
+    assert reader.state_at(100) == recorded[45]
+    assert reader.state_at(0) is None
+
+    # Scrubbing over a range yields every recorded state in order
+    ticks = [tick for tick, _ in reader.iter_states(18, 23)]
+    assert ticks == [18, 19, 20, 21, 22, 23]
+
+    # Deltas are far smaller than full states
+    assert os.path.getsize(path) < 45 * len(json.dumps(recorded[45])) / 4
+
+    # The index can be rebuilt if it is lost
+    os.remove(path + ".idx")
+    assert TickJournalReader(path).keyframes == reader.keyframes
+
+def test_journal_state_dumper(simulation: Simulation, tmp_path):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    dumper = JournalStateDumper(directory=str(tmp_path), keyframe_interval=20)
+
+    for _ in range(60):
+        simulation.step()
+        dumper.dump(simulation)
+    dumper.flush()
+
+    reader = TickJournalReader(dumper.journal_path)
+    state = reader.state_at(60)
+    tank = vaporator.get_component(WaterTank)
+    assert state["world"]["entities"][vaporator.id]["slots"]["water_tank"]["component"]["fill"] == tank.capacity
+    # The state stopped changing once the tank filled at tick 50
+    assert state["tick_count"] == 50
+
+def test_journal_carries_tilemap_between_dumps(simulation: Simulation, tmp_path):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    dumper = JournalStateDumper(directory=str(tmp_path), keyframe_interval=20)
+    tilemap = simulation.world.tilemap = Tilemap.from_default()
+
+    recorded = {}
+    for tick in range(1, 31):
+        if tick == 10:
+            tilemap.set_tile(0, 0, 2 if tilemap.tiles[0][0] != 2 else 1)
+        simulation.step()
+        dumper.dump(simulation)
+        recorded[tick] = normalized(simulation.to_json())
+    dumper.flush()
+
+    # Only the changed tilemap is dumped, but every tick (including keyframes) replays with it
+    reader = TickJournalReader(dumper.journal_path)
+    for tick in (5, 10, 21, 30):
+        assert reader.state_at(tick)["world"]["tilemap"] == recorded[tick]["world"]["tilemap"]
+
+def test_stop_closes_the_journal(simulation: Simulation, tmp_path):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    dumper = JournalStateDumper(directory=str(tmp_path), keyframe_interval=20)
+
+    for _ in range(30):
+        simulation.step()
+        dumper.dump(simulation)
+    dumper.flush()
+    journal = dumper._journal
+    thread = dumper._thread
+    dumper.stop()
+
+    assert not thread.is_alive()
+    assert dumper._journal is None
+    assert journal._file.closed and journal._index_file.closed
+    reader = TickJournalReader(dumper.journal_path)
+    assert [tick for tick, _ in reader.keyframes] == [1, 21]
+    assert reader.state_at(30)["tick_count"] == 30
+
+def test_simulation_dumps_go_to_the_dump_dir(simulation: Simulation):
+    simulation.world.add_entity(GX1_Vaporator(location=Location(x=5, y=5)))
+    simulation.run_sync(ticks=5, headless=True)
+    path = simulation._state_dumper.journal_path
+    simulation.close_state_dumps()
+
+    assert os.path.dirname(path) == GlobalConfig.simulation_dump_dir
+    assert TickJournalReader(path).state_at(5)["tick_count"] == 5
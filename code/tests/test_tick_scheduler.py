@@ -0,0 +1,50 @@
+import pytest
+from simulation.core.Simulation import Simulation
+from simulation.core.TickScheduler import TickScheduler
+
+
+def test_sleep_subtracts_tick_cost():
+    scheduler = TickScheduler()
+    # A tick that took 0.03s out of a 0.1s period should only sleep for the remaining 0.07s
+    delay = scheduler.next_delay(tick_start=10.0, tick_end=10.03, period=0.1)
+    assert delay == pytest.approx(0.07)
+    assert scheduler.tick_cost == pytest.approx(0.03)
+    assert scheduler.tick_lag == 0.0
+
+    # The next tick starts when it was due, so the schedule does not drift
+    delay = scheduler.next_delay(tick_start=10.1, tick_end=10.12, period=0.1)
+    assert delay == pytest.approx(0.08)
+    assert scheduler.next_tick_time == pytest.approx(10.2)
+
+def test_catch_up_when_behind():
+    scheduler = TickScheduler(max_catchup_ticks=5)
+    # A tick that overruns its period by a little should be caught up on immediately
+    delay = scheduler.next_delay(tick_start=0.0, tick_end=0.15, period=0.1)
+    assert delay == 0.0
+    assert scheduler.tick_lag == pytest.approx(0.05)
+    assert scheduler.catchup_ticks == 1
+    assert scheduler.skipped_ticks == 0
+
+    # A fast follow-up tick gets us back on schedule
+    delay = scheduler.next_delay(tick_start=0.15, tick_end=0.16, period=0.1)
+    assert delay == pytest.approx(0.04)
+    assert scheduler.tick_lag == 0.0
+
+def test_skip_when_too_far_behind():
+    scheduler = TickScheduler(max_catchup_ticks=5)
+    # A tick that takes a full second at 10 ticks/sec is beyond the catch-up budget
+    delay = scheduler.next_delay(tick_start=0.0, tick_end=1.05, period=0.1)
+    assert delay == 0.0
+    assert scheduler.tick_lag == pytest.approx(0.95)
+    assert scheduler.skipped_ticks == 9
+    # The schedule restarts from the end of the slow tick
+    assert scheduler.next_tick_time == pytest.approx(1.05)
+
+def test_simulation_exposes_tick_lag():
+    sim = Simulation(simulation_delay=0.001)
+    sim.run_sync(ticks=5)
+    assert sim.tick_lag >= 0.0
+    assert sim.tick_cost > 0.0
+    state = sim.to_json()
+    assert "tick_lag" in state
+    assert "tick_cost" in state
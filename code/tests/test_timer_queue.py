@@ -0,0 +1,159 @@
+import json
+
+import pytest
+from simulation.core.entity.component.Chronometer import Chronometer
+from simulation.core.entity.component.DroidAgent import DroidAgent
+from simulation.core.entity.component.Motivator import Motivator
+from simulation.core.entity.component.PowerPack import PowerPack
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.core.TimerQueue import TimerQueue
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.PowerGeneratorModels import SolarPanel
+from simulation.equipment.PowerStationModels import SolarPowerStation
+from simulation.GlobalConfig import GlobalConfig
+from simulation.llm.QueuedWebRequest import QueuedHttpRequest
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_timer_queue_fires_in_order():
+    timers = TimerQueue()
+    fired = []
+    timers.schedule(5, fired.append, "b")
+    timers.schedule(3, fired.append, "a")
+    timers.schedule(5, fired.append, "c")
+
+    assert timers.advance(2) == 0
+    assert timers.next_tick() == 3
+    assert timers.advance(5) == 3
+    assert fired == ["a", "b", "c"]
+    assert len(timers) == 0
+
+def test_timer_queue_discards_timers_by_owner():
+    timers = TimerQueue()
+    fired = []
+    timers.schedule(3, fired.append, "a", owner="droid")
+    timers.schedule(4, fired.append, "b", owner="station")
+    timers.schedule(5, fired.append, "c")
+
+    timers.discard_owner("droid")
+    timers.advance(5)
+    assert fired == ["b", "c"]
+
+def test_timers_leave_with_their_entity(simulation: Simulation):
+    station = SolarPowerStation(location=Location(x=5, y=5))
+    other = SolarPowerStation(location=Location(x=8, y=5))
+    simulation.world.add_entity(station)
+    simulation.world.add_entity(other)
+    simulation.run_sync(ticks=1)
+    assert len(simulation.world._timers) == 4  # Two suspended panels per station
+
+    simulation.world.remove_entity(station)
+    assert len(simulation.world._timers) == 2
+    simulation.world.clear_entities()
+    assert len(simulation.world._timers) == 0
+
+def test_power_generator_sleeps_between_recharges(simulation: Simulation):
+    station = SolarPowerStation(location=Location(x=5, y=5))
+    simulation.world.add_entity(station)
+    power: PowerPack = station.get_component(PowerPack)
+    panel: SolarPanel = station.get_component("solar_vane_1")
+    power.charge = 0
+
+    # Both panels recharge on the first tick, then every cooldown_delay + 1 ticks
+    simulation.run_sync(ticks=1)
+    assert power.charge == 2 * panel.recharge_amount
+    assert panel.is_suspended
+    assert panel.current_cooldown == panel.cooldown_delay
+
+    # Recharging woke the power pack, which goes back to sleep on the next tick, and takes the station with it
+    simulation.run_sync(ticks=1)
+    assert not simulation.world.is_entity_active(station)
+
+    simulation.run_sync(ticks=3)
+    assert panel.current_cooldown == panel.cooldown_delay - 4
+    assert panel.to_json()["cooldown_remaining"] == panel.current_cooldown
+
+    simulation.run_sync(ticks=panel.cooldown_delay - 4)
+    assert power.charge == 2 * panel.recharge_amount
+    simulation.run_sync(ticks=1)
+    assert power.charge == 4 * panel.recharge_amount
+
+def test_changes_do_not_end_a_suspension(simulation: Simulation):
+    station = SolarPowerStation(location=Location(x=5, y=5))
+    simulation.world.add_entity(station)
+    power: PowerPack = station.get_component(PowerPack)
+    panel: SolarPanel = station.get_component("solar_vane_1")
+    power.charge = 0
+    simulation.run_sync(ticks=1)
+
+    power.charge = 0  # Wakes the chassis, but not the suspended panels
+    simulation.run_sync(ticks=1)
+    assert power.charge == 0
+    assert panel.is_suspended
+
+    # Setting the cooldown explicitly does take effect
+    panel.current_cooldown = 0
+    simulation.run_sync(ticks=1)
+    assert power.charge == panel.recharge_amount
+
+def test_motivator_cooldown_uses_timer(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    simulation.world.add_entity(droid)
+    motivator: Motivator = droid.get_component(Motivator)
+    motivator.cooldown_delay = 3
+    motivator.move_to_location(3, 1)
+
+    simulation.run_sync(ticks=1)
+    assert droid.location == Location(x=2, y=1)
+    # The cooldown starts on the next tick, which reports it, then sleeps through the rest of it
+    simulation.run_sync(ticks=1)
+    assert motivator.is_suspended
+    assert motivator.last_block_reason == "cooldown"
+    # Serialized state counts the cooldown down while suspended, as if it were still ticked
+    assert motivator.to_json()["cooldown_remaining"] == 2
+    simulation.run_sync(ticks=1)
+    assert motivator.to_json()["cooldown_remaining"] == 1
+    assert not simulation.world.is_entity_active(droid)
+
+    simulation.run_sync(ticks=1)
+    assert droid.location == Location(x=2, y=1)
+    simulation.run_sync(ticks=1)
+    assert droid.location == Location(x=3, y=1)
+    # Arrival is noticed on the next tick, rather than after another cooldown
+    assert not motivator.is_suspended
+    simulation.run_sync(ticks=1)
+    assert motivator.destination is None
+
+def test_agent_sleeps_through_chronometer_sleep(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    droid.install_component("misc", Chronometer())
+    simulation.world.add_entity(droid)
+    agent: DroidAgent = droid.get_component(DroidAgent)
+
+    request = QueuedHttpRequest("http://example.com/api")
+    request.response = {"choices": [{
+        "finish_reason": "tool_calls",
+        "message": {"role": "assistant", "tool_calls": [
+            {"id": "tool_call_1", "function": {"name": "sleep", "arguments": json.dumps({"ticks": 5})}}
+        ]},
+    }]}
+    agent.queued_http_request = request
+    agent.activate()
+
+    # The agent calls sleep, and then skips the ticks until the sleep is due rather than polling it
+    simulation.run_sync(ticks=1)
+    assert agent.pending_tool_call is not None
+    assert agent.is_suspended
+    assert agent.suspended_ticks == 4
+
+    simulation.run_sync(ticks=4)
+    assert agent.pending_tool_call is not None
+    simulation.run_sync(ticks=1)
+    assert agent.pending_tool_call is None
@@ -0,0 +1,48 @@
+import pytest
+import simulation.llm.ToolCall as ToolCallModule
+from simulation.core.entity.component.Motivator import Motivator
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_tool_docstrings_are_parsed_once(simulation: Simulation, monkeypatch):
+    first = GonkDroid(location=Location(x=1, y=1))
+    second = GonkDroid(location=Location(x=2, y=2))
+    first.get_available_tools()
+
+    parsed = []
+    original = ToolCallModule.parse
+    monkeypatch.setattr(ToolCallModule, "parse", lambda doc: parsed.append(doc) or original(doc))
+    tools = second.get_available_tools()
+    assert parsed == []
+
+    # Tools are still bound to their own component
+    move = tools["move_to_location"]
+    assert move.function_ptr.__self__ is second.get_component(Motivator)
+    assert move.to_openai_json() is first.get_available_tools()["move_to_location"].to_openai_json()
+    assert move.to_openai_json()["function"]["parameters"]["required"] == ["x", "y"]
+
+def test_chassis_tool_map_follows_installed_components(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    assert "move_to_location" in droid.get_available_tools()
+    assert droid.get_available_tools()["move_to_location"].function_ptr.__self__ is droid.get_component(Motivator)
+
+    slot_id = next(slot_id for slot_id, slot in droid.slots.items() if isinstance(slot.component, Motivator))
+    motivator = droid.uninstall_component(slot_id)
+    assert "move_to_location" not in droid.get_available_tools()
+
+    droid.install_component(slot_id, motivator)
+    assert "move_to_location" in droid.get_available_tools()
+
+    # Callers get their own copy of the map
+    droid.get_available_tools().clear()
+    assert "move_to_location" in droid.get_available_tools()
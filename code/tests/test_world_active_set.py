@@ -0,0 +1,150 @@
+from typing import ClassVar, Dict, List
+
+import pytest
+from simulation.core.entity.component.DroidAgent import DroidAgent
+from simulation.core.entity.Chassis import Chassis
+from simulation.core.entity.component.Component import Component
+from simulation.core.entity.component.CondenserUnit import CondenserUnit
+from simulation.core.entity.component.Motivator import Motivator
+from simulation.core.entity.component.PowerPack import PowerPack
+from simulation.core.entity.component.WaterTank import WaterTank
+from simulation.core.entity.ComponentSlot import ComponentSlot
+from simulation.core.entity.Entity import Location
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.VaporatorModels import GX1_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+
+
+class TickRecorder(Component):
+    ticks: ClassVar[List[str]] = []
+    remaining: int = 1  # Number of ticks to record before going dormant
+
+    def tick(self):
+        if self.remaining <= 0:
+            self.go_dormant()
+            return
+        TickRecorder.ticks.append(self.chassis.id)
+        self.remaining -= 1
+
+class RecorderChassis(Chassis):
+    slots: Dict[str, ComponentSlot] = {
+        "recorder": ComponentSlot(accepts=TickRecorder, default_component=TickRecorder),
+    }
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_full_vaporator_goes_dormant_until_drained(simulation: Simulation):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    tank: WaterTank = vaporator.get_component(WaterTank)
+    power: PowerPack = vaporator.get_component(PowerPack)
+
+    simulation.run_sync(ticks=tank.capacity + 2)
+    assert tank.fill == tank.capacity
+    assert vaporator.get_component(CondenserUnit).is_dormant
+    assert not simulation.world.is_entity_active(vaporator)
+
+    charge = power.charge
+    simulation.run_sync(ticks=10)
+    assert power.charge == charge
+
+    # Draining the tank wakes the vaporator back up
+    tank.fill = 0
+    assert simulation.world.is_entity_active(vaporator)
+    simulation.run_sync(ticks=10)
+    assert tank.fill == 10
+
+def test_idle_droid_is_woken_by_tool_call(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    simulation.world.add_entity(droid)
+    simulation.run_sync(ticks=2)
+    assert not simulation.world.is_entity_active(droid)
+    assert droid.get_component(DroidAgent).is_dormant
+
+    droid.get_available_tools()["move_to_location"].execute(x=4, y=1)
+    assert simulation.world.is_entity_active(droid)
+    simulation.run_sync(ticks=10)
+    assert droid.location == Location(x=4, y=1)
+    assert droid.get_component(Motivator).is_dormant
+
+def test_installing_a_component_wakes_the_chassis(simulation: Simulation):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    vaporator.get_component(PowerPack).charge = 0
+    simulation.run_sync(ticks=2)
+    assert not simulation.world.is_entity_active(vaporator)
+
+    vaporator.uninstall_component("power_pack")
+    vaporator.install_component("power_pack", PowerPack())
+    assert simulation.world.is_entity_active(vaporator)
+    simulation.run_sync(ticks=3)
+    assert vaporator.get_component(WaterTank).fill == 3
+
+def test_woken_entities_keep_their_tick_order(simulation: Simulation):
+    first = RecorderChassis(location=Location(x=1, y=1))
+    second = RecorderChassis(location=Location(x=3, y=3))
+    third = RecorderChassis(location=Location(x=5, y=5))
+    for entity in (first, second, third):
+        simulation.world.add_entity(entity)
+    simulation.run_sync(ticks=2)
+    assert not any(simulation.world.is_entity_active(e) for e in (first, second, third))
+
+    TickRecorder.ticks.clear()
+    third.get_component(TickRecorder).remaining = 1
+    first.get_component(TickRecorder).remaining = 1
+    simulation.run_sync(ticks=1)
+    assert TickRecorder.ticks == [first.id, third.id]
+
+def test_only_components_that_tick_are_dispatched(simulation: Simulation):
+    vaporator = GX1_Vaporator(location=Location(x=5, y=5))
+    simulation.world.add_entity(vaporator)
+    condenser = vaporator.get_component(CondenserUnit)
+    assert vaporator.tick_list == [condenser]
+    # Passive components are never ticked, so always count as dormant
+    assert vaporator.get_component(WaterTank).is_dormant
+    assert vaporator.get_component(PowerPack).is_dormant
+
+    simulation.run_sync(ticks=3)
+    assert vaporator.get_component(WaterTank).fill == 3
+
+def test_tick_list_follows_slot_changes(simulation: Simulation):
+    droid = GonkDroid(location=Location(x=1, y=1))
+    simulation.world.add_entity(droid)
+    motivator = droid.get_component(Motivator)
+    assert motivator in droid.tick_list
+    assert droid.get_component(PowerPack) not in droid.tick_list
+
+    droid.uninstall_component("motivator")
+    assert motivator not in droid.tick_list
+    droid.install_component("motivator", motivator)
+    assert motivator in droid.tick_list
+
+class Remover(Component):
+    target_id: str = ""
+
+    def tick(self):
+        self.chassis.world.remove_entity_by_id(self.target_id)
+        self.go_dormant()
+
+class RemoverChassis(Chassis):
+    slots: Dict[str, ComponentSlot] = {
+        "remover": ComponentSlot(accepts=Remover, default_component=Remover),
+    }
+
+def test_entity_removed_mid_tick_is_not_ticked(simulation: Simulation):
+    remover = RemoverChassis(location=Location(x=1, y=1))
+    recorder = RecorderChassis(location=Location(x=3, y=3))
+    simulation.world.add_entity(remover)
+    simulation.world.add_entity(recorder)
+    remover.get_component(Remover).target_id = recorder.id
+
+    TickRecorder.ticks.clear()
+    simulation.run_sync(ticks=1)
+    assert TickRecorder.ticks == []
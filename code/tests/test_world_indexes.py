@@ -0,0 +1,58 @@
+import pytest
+from simulation.core.entity.Chassis import Chassis
+from simulation.core.entity.Entity import Entity, Location
+from simulation.core.entity.Vaporator import Vaporator
+from simulation.core.Simulation import Simulation
+from simulation.equipment.DroidModels import GonkDroid
+from simulation.equipment.VaporatorModels import GX1_Vaporator, GX8_Vaporator
+from simulation.GlobalConfig import GlobalConfig
+
+
+@pytest.fixture
+def simulation() -> Simulation:
+    """Fixture to create a simulation instance for testing."""
+    sim = Simulation(simulation_delay=0)
+    GlobalConfig.log_print_level = 2
+    return sim
+
+def test_get_entities_by_class_name_and_id(simulation: Simulation):
+    world = simulation.world
+    first = GX1_Vaporator(location=Location(x=1, y=1))
+    droid = GonkDroid(location=Location(x=2, y=2))
+    second = GX1_Vaporator(location=Location(x=3, y=3))
+    for entity in (first, droid, second):
+        world.add_entity(entity)
+
+    assert world.get_entities("GX1_Vaporator") == [first, second]
+    assert world.get_entities(droid.id) == [droid]
+    assert world.get_entities("Vaporator") == []
+    assert world.get_entities("Nothing") == []
+
+    world.remove_entity(first)
+    assert world.get_entities("GX1_Vaporator") == [second]
+    world.clear_entities()
+    assert world.get_entities("GX1_Vaporator") == []
+
+def test_get_entities_include_subclasses(simulation: Simulation):
+    world = simulation.world
+    small = GX1_Vaporator(location=Location(x=1, y=1))
+    droid = GonkDroid(location=Location(x=2, y=2))
+    large = GX8_Vaporator(location=Location(x=3, y=3))
+    for entity in (small, droid, large):
+        world.add_entity(entity)
+
+    assert world.get_entities("Vaporator", include_subclasses=True) == [small, large]
+    assert world.get_entities("Chassis", include_subclasses=True) == [small, droid, large]
+
+def test_get_entity_by_type(simulation: Simulation):
+    world = simulation.world
+    plain = Entity(location=Location(x=0, y=1))
+    droid = GonkDroid(location=Location(x=2, y=2))
+    vaporator = GX8_Vaporator(location=Location(x=3, y=3))
+    for entity in (plain, droid, vaporator):
+        world.add_entity(entity)
+
+    assert world.get_entity(Vaporator) is vaporator
+    assert world.get_entity(Chassis) is droid
+    assert world.get_entity(Entity) is plain
+    assert world.get_entity(GX1_Vaporator) is None
@@ -203,5 +203,6 @@ async def shutdown_event():
     if simulation:
         simulation.running = False
         simulation_thread.join()
+        simulation.close_state_dumps()
         simulation = None
         simulation_thread = None
\ No newline at end of file